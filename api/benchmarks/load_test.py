@@ -0,0 +1,92 @@
+# Load test hitting a running server with many concurrent connections to compare serving modes
+#
+# Usage:
+#   server=wsgi python api/src/scripts/run_api.py   (or server=asgi)
+#   python -m api.benchmarks.load_test --url http://127.0.0.1:8000 --connections 256 --duration 10
+
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+_DATES = [f"{year}-{month:02d}-15" for year in (1999, 2022, 2385) for month in range(1, 13)]
+
+
+async def _worker(host: str, port: int, deadline: float, latencies: list[float], errors: list[str]) -> None:
+    """Sends requests over a connection until `deadline`, reconnecting whenever server closes the connection
+
+    Args:
+        host (str): Host of the server
+        port (int): Port of the server
+        deadline (float): `time.perf_counter` value until which requests are sent
+        latencies (list[float]): Latency in seconds of every successful request gets appended here
+        errors (list[str]): Description of every failed request gets appended here
+    """
+    reader = writer = None
+    idx = 0
+    while time.perf_counter() < deadline:
+        date = _DATES[idx % len(_DATES)]
+        idx += 1
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(f"GET /date/{date} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+            await writer.drain()
+
+            headers = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").lower()
+            if not headers.startswith("http/1.1 200"):
+                errors.append(headers.split("\r\n", 1)[0])
+            content_length = int(headers.split("content-length:", 1)[1].split("\r\n", 1)[0])
+            await reader.readexactly(content_length)
+            latencies.append(time.perf_counter() - start)
+
+            if "connection: close" in headers:
+                writer.close()
+                reader = writer = None
+        except (OSError, asyncio.IncompleteReadError, IndexError, ValueError) as e:
+            errors.append(type(e).__name__)
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def _run(url: str, connections: int, duration: float) -> None:
+    """Runs the load test and prints throughput and latency percentiles
+
+    Args:
+        url (str): Base url of the server
+        connections (int): No. of concurrent connections
+        duration (float): Duration of the test in seconds
+    """
+    split_url = urlsplit(url)
+    latencies: list[float] = []
+    errors: list[str] = []
+    deadline = time.perf_counter() + duration
+
+    await asyncio.gather(*(_worker(split_url.hostname, split_url.port or 80, deadline, latencies, errors) for _ in range(connections)))
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    print(
+        f"connections={connections} requests={len(latencies)} errors={len(errors)} rps={len(latencies) / duration:.0f} "
+        f"p50={quantiles[49] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms max={(latencies or [0.0])[-1] * 1000:.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test GET /date/<date> with many concurrent connections")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base url of the running server")
+    parser.add_argument("--connections", type=int, default=256, help="No. of concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duration of the test in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.url, args.connections, args.duration))
+
+
+if __name__ == "__main__":
+    main()
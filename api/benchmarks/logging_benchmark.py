@@ -0,0 +1,57 @@
+# Benchmark comparing per-request CPU time of the application with logging at INFO vs WARNING level
+#
+# Usage: python -m api.benchmarks.logging_benchmark [--requests N]
+
+import argparse
+import logging
+import os
+import time
+
+from api.src import get_date_matrix
+from api.src.api import flask_app
+from api.src.initializer import logger
+
+_DATES = [f"{year}-{month:02d}-{day:02d}" for year in (1999, 2022, 2385) for month in range(1, 13) for day in (1, 15, 28)]
+
+
+def _cpu_time_per_call_us(func, num_calls: int) -> float:
+    """Returns CPU time in microseconds taken per call of `func`
+
+    Args:
+        func (Callable[[str], Any]): Function that is called with a date string
+        num_calls (int): No. of calls to make
+
+    Returns:
+        float: CPU time in microseconds per call
+    """
+    start = time.process_time()
+    for idx in range(num_calls):
+        func(_DATES[idx % len(_DATES)])
+
+    return (time.process_time() - start) / num_calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request CPU time with logging at INFO vs WARNING level")
+    parser.add_argument("--requests", type=int, default=20_000, help="No. of requests per level")
+    args = parser.parse_args()
+
+    # Emit records for real (into devnull) so that INFO level pays formatting and handler costs as it would in production
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(handler)
+
+    test_client = flask_app.test_client()
+    # Warm the month cache so that both levels measure the same steady state
+    for date in _DATES:
+        get_date_matrix.get_date_matrix_json(date)
+
+    for level in (logging.INFO, logging.WARNING):
+        logger.setLevel(level)
+        direct_us = _cpu_time_per_call_us(get_date_matrix.get_date_matrix_json, args.requests)
+        http_us = _cpu_time_per_call_us(lambda date: test_client.get(f"/date/{date}"), args.requests)
+        print(f"{logging.getLevelName(level):<8} get_date_matrix_json: {direct_us:8.2f} us/call    GET /date: {http_us:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# Benchmark suite of the calendar computation and the HTTP layer with regression check against a stored baseline
+#
+# Usage:
+#   python -m api.benchmarks.suite [--output results.json] [--baseline api/benchmarks/baseline.json] [--threshold 0.25]
+#   python -m api.benchmarks.suite --save-baseline   (after an intended change in performance or on a new machine)
+#
+# Exits with status 1 if any benchmark is slower than its baseline by more than `--threshold` (as a fraction).
+# Timings depend upon the machine, so baseline must be recorded on the machine which runs the comparison.
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable
+
+from api.src import constants, get_date_matrix, utils, vectorized
+from api.src.api import flask_app
+
+_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# One date per month from the pivot date up to the end of year 9999, so that month cache misses get measured too
+_ALL_MONTH_DATES = [
+    f"{year}-{month:02d}-15"
+    for year in range(constants.PIVOT_DATE.year, 10000)
+    for month in range(1, 13)
+    if (year, month) >= (constants.PIVOT_DATE.year, constants.PIVOT_DATE.month)
+]
+_HOT_DATES = [f"{year}-{month:02d}-{day:02d}" for year in (1999, 2022, 2385) for month in range(1, 13) for day in (1, 15, 28)]
+_DATE_OBJS = [utils.date_validator(date, constants.PIVOT_DATE) for date in _HOT_DATES]
+_ALL_MONTH_COLUMNS = [[int(value) for value in values] for values in zip(*(date.split("-") for date in _ALL_MONTH_DATES))]
+
+
+def _benchmarks() -> dict[str, tuple[Callable[[], object], int]]:
+    """Returns benchmarks by name along with no. of operations performed by one call of each
+
+    Returns:
+        dict[str, tuple[Callable[[], object], int]]: Benchmark function and no. of operations per call
+    """
+    test_client = flask_app.test_client()
+
+    def is_leap_year() -> None:
+        for year in range(1752, 2800):
+            utils.is_leap_year(year)
+
+    def count_leap_years() -> None:
+        for date_obj in _DATE_OBJS:
+            utils.count_leap_years(date_obj)
+
+    def num_days_between_dates() -> None:
+        for date_obj in _DATE_OBJS:
+            utils.num_days_between_dates(constants.PIVOT_DATE, date_obj)
+
+    def add_days() -> None:
+        for date_obj in _DATE_OBJS:
+            utils.add_days(date_obj, 1000)
+
+    def date_validator() -> None:
+        for date in _HOT_DATES:
+            utils.date_validator(date, constants.PIVOT_DATE)
+
+    def date_construction() -> None:
+        for date_obj in _DATE_OBJS:
+            constants.Date(date_obj.year, date_obj.month, date_obj.day)
+
+    def get_date_matrix_hot() -> None:
+        for date in _HOT_DATES:
+            get_date_matrix.get_date_matrix(date)
+
+    def get_date_matrix_all_months() -> None:
+        for date in _ALL_MONTH_DATES:
+            get_date_matrix.get_date_matrix(date)
+
+    def vectorized_date_arrays() -> None:
+        vectorized.date_arrays(*_ALL_MONTH_COLUMNS)
+
+    def http_get_date() -> None:
+        for date in _HOT_DATES[:20]:
+            test_client.get(f"/date/{date}")
+
+    def http_get_year() -> None:
+        test_client.get("/year/2022")
+
+    return {
+        "is_leap_year": (is_leap_year, 2800 - 1752),
+        "count_leap_years": (count_leap_years, len(_DATE_OBJS)),
+        "num_days_between_dates": (num_days_between_dates, len(_DATE_OBJS)),
+        "add_days": (add_days, len(_DATE_OBJS)),
+        "date_validator": (date_validator, len(_HOT_DATES)),
+        "date_construction": (date_construction, len(_DATE_OBJS)),
+        "get_date_matrix_hot": (get_date_matrix_hot, len(_HOT_DATES)),
+        "get_date_matrix_all_months": (get_date_matrix_all_months, len(_ALL_MONTH_DATES)),
+        "vectorized_date_arrays": (vectorized_date_arrays, len(_ALL_MONTH_DATES)),
+        "http_get_date": (http_get_date, 20),
+        "http_get_year": (http_get_year, 1),
+    }
+
+
+def run(min_time: float) -> dict[str, float]:
+    """Runs every benchmark and returns the best time per operation out of several rounds
+
+    Args:
+        min_time (float): Minimum duration in seconds of every round
+
+    Returns:
+        dict[str, float]: Nanoseconds per operation by benchmark name
+    """
+    results = {}
+    for name, (func, num_ops) in _benchmarks().items():
+        timer = timeit.Timer(func)
+        num_calls, _ = timer.autorange()
+        num_calls = max(1, int(num_calls * min_time / 0.2))
+        best_time = min(timer.repeat(repeat=5, number=num_calls)) / num_calls
+        results[name] = best_time / num_ops * 1e9
+        print(f"{name:<28} {results[name]:12.1f} ns/op")
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Compares results against a baseline
+
+    Args:
+        results (dict[str, float]): Nanoseconds per operation by benchmark name
+        baseline (dict[str, float]): Baseline nanoseconds per operation by benchmark name
+        threshold (float): Allowed slowdown as a fraction of the baseline
+
+    Returns:
+        list[str]: Description of every regressed benchmark
+    """
+    regressions = []
+    for name, ns_per_op in results.items():
+        if name in baseline and ns_per_op > baseline[name] * (1 + threshold):
+            regressions.append(f"{name}: {ns_per_op:.1f} ns/op vs baseline {baseline[name]:.1f} ns/op (+{(ns_per_op / baseline[name] - 1) * 100:.0f}%)")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark calendar computation and HTTP layer against a stored baseline")
+    parser.add_argument("--output", help="Path of json file to save results to")
+    parser.add_argument("--baseline", default=_BASELINE_PATH, help="Path of json file of baseline results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum duration in seconds of every round")
+    parser.add_argument("--save-baseline", action="store_true", help="Save results as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": run(args.min_time)}
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"Baseline saved to: {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at: {args.baseline}, run with --save-baseline to record one")
+        return
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(report["results"], baseline["results"], args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regression beyond {args.threshold * 100:.0f}% of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,91 @@
 import json
+import threading
+import time
 
-from api.src import exceptions, get_date_matrix
-from api.src.initializer import flask_app, logger
+from flask import Response, g, redirect, request, url_for
+
+from api.src import (
+    calendar_table,
+    compression,
+    constants,
+    exceptions,
+    formats,
+    get_date_matrix,
+    http_utils,
+    metrics,
+    profiling,
+    utils,
+)
+from api.src.config import config
+from api.src.initializer import app_ready, flask_app, logger
+
+
+@flask_app.before_request
+def start_request_timer() -> None:
+    """Notes the time at which serving of a request begins for `record_request_metrics`"""
+    g.request_start_time = time.perf_counter()
+
+
+# Serializes lazy warm-up of concurrent first requests
+_warm_up_lock = threading.Lock()
+
+
+@flask_app.before_request
+def warm_up_lazily() -> None:
+    """Warms up caches on the first request when not done by the server before accepting traffic
+
+    - Gunicorn hooks (see `gunicorn_conf`) and ASGI lifespan warm up upfront, other WSGI servers like `flask run` or
+      waitress have no such hook and would otherwise report not ready on `/health` forever
+    """
+    if app_ready.is_set():
+        return
+
+    with _warm_up_lock:
+        if not app_ready.is_set():
+            logger.info("Warming up lazily on the first request")
+            calendar_table.load_table(config.CALENDAR_TABLE_PATH)
+            get_date_matrix.warm_up(config.WARMUP_YEARS)
+            app_ready.set()
+
+
+@flask_app.after_request
+def record_request_metrics(response: Response) -> Response:
+    """Records latency and status code of a request per route
+
+    - Registered before `compress_response` so that it runs after it and latency includes compression
+
+    Args:
+        response (Response): Response of the request
+
+    Returns:
+        Response: Same `response`
+    """
+    metrics.observe_request(_route(), response.status_code, time.perf_counter() - g.request_start_time)
+    metrics.flush()
+
+    return response
+
+
+@flask_app.before_request
+def start_request_profiler() -> None:
+    """Starts profiling of a sampled request when profiling is enabled"""
+    g.profiler = profiling.start()
+
+
+@flask_app.after_request
+def stop_request_profiler(response: Response) -> Response:
+    """Stops profiling of a sampled request, keeping its profile if it was slow
+
+    Args:
+        response (Response): Response of the request
+
+    Returns:
+        Response: Same `response`
+    """
+    if g.get("profiler") is not None:
+        profiling.stop(g.profiler, _route(), time.perf_counter() - g.request_start_time)
+
+    return response
 
 
 @flask_app.route("/", methods=["GET"])
@@ -20,32 +104,382 @@ def home() -> tuple[str, int]:
 def health() -> tuple[str, int]:
     """Health end point
 
+    - Reports not ready until caches are warmed up so that load balancers don't route traffic to a cold worker
+
     Returns:
         tuple[str, int]: Returns string message and status code
     """
     logger.debug("Health GET end point called")
 
+    if not app_ready.is_set():
+        return "Calendar App warming up.", 503
+
     return "Calendar App alive.", 200
 
 
 @flask_app.route("/date/<date>", methods=["GET"])
-def date(date: str) -> tuple[str, int]:
+def date(date: str) -> Response | tuple[str, int]:
     """Home route of the flask application
 
+    - All dates of a month share the canonical `/month/<yyyy>/<mm>` resource which is advertised via `Content-Location`
+      or, if `REDIRECT_DATE_TO_MONTH` is enabled, redirected to so that caches hold a single entry per month
+    - Layout is chosen via `week_start` (name of a day, defaults to "sunday"), `week_numbers` ("true" to prepend ISO
+      week numbers) and `trim_rows` ("true" to leave out rows of only next month) query parameters
+
     Args:
         date (str): Date for which calendar is required
 
     Returns:
-        tuple[str, int]: Returns the tuple of json response and status code
+        Response | tuple[str, int]: Returns the json response or the tuple of error message and status code
     """
-    logger.info(f"GET call received to get date for: {date}")
+    logger.info("GET call received to get date for: %s", date)
 
     try:
-        date_matrix = get_date_matrix.get_date_matrix(date)
-        return json.dumps(date_matrix), 200
+        with metrics.timed_stage("validation"):
+            date_obj = utils.date_validator(date, constants.PIVOT_DATE)
+            layout = utils.layout_validator(request.args.get("week_start"), request.args.get("week_numbers"), request.args.get("trim_rows"))
+
+        month_url = _month_url(date_obj.year, date_obj.month, layout)
+        if config.REDIRECT_DATE_TO_MONTH:
+            return _cacheable_response(redirect(month_url, 301))
+
+        response = _month_response(date_obj.year, date_obj.month, layout)
+        response.headers["Content-Location"] = month_url
+        return response
     except exceptions.InvalidDateFormat as e:
         logger.info("Date validation failed", exc_info=True)
         return str(e), 400
     except Exception:
         logger.exception("Server side error. Please reach out to support team for help")
         return "Server side issue", 500
+
+
+@flask_app.route("/month/<year>/<month>", methods=["GET"])
+def month(year: str, month: str) -> Response | tuple[str, int]:
+    """Canonical route of the calendar of a month
+
+    - Non-canonical forms like `/month/2024/5` or `/month/2024/05?week_start=Monday` are redirected to the zero padded
+      `/month/2024/05` along with only the query parameters of the parts of the layout differing from the default one
+    - Layout is chosen via `week_start`, `week_numbers` and `trim_rows` query parameters as for `/date/<date>`
+
+    Args:
+        year (str): Year (Format: "YYYY") of the month
+        month (str): Month (Format: "MM") for which calendar is required
+
+    Returns:
+        Response | tuple[str, int]: Returns the json response or the tuple of error message and status code
+    """
+    logger.info("GET call received to get month: %s/%s", year, month)
+
+    try:
+        with metrics.timed_stage("validation"):
+            year_value, month_value = utils.month_validator(f"{year}-{month}", constants.PIVOT_DATE)
+            layout = utils.layout_validator(request.args.get("week_start"), request.args.get("week_numbers"), request.args.get("trim_rows"))
+
+        if not http_utils.is_canonical_month_request(year, month, request.query_string.decode("latin-1"), year_value, month_value, layout):
+            return _cacheable_response(redirect(_month_url(year_value, month_value, layout), 301))
+
+        return _month_response(year_value, month_value, layout)
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Month validation failed", exc_info=True)
+        return str(e), 400
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return "Server side issue", 500
+
+
+@flask_app.route("/dates", methods=["POST"])
+def dates() -> Response | tuple[str, int]:
+    """Batch route returning calendars for many dates in a single request
+
+    - Request body is a json list of dates (Format: "YYYY-MM-DD") or a json object with such list under `dates`
+    - Dates failing validation are reported inline without failing the whole batch
+
+    Returns:
+        Response | tuple[str, int]: Returns the json response or the tuple of error message and status code
+    """
+    logger.info("POST call received to get dates in batch")
+
+    payload = request.get_json(silent=True)
+    batch = payload.get("dates") if isinstance(payload, dict) else payload
+    if not isinstance(batch, list):
+        logger.info("Batch request body is not a list of dates")
+        return "Request body should be a json list of dates or a json object with a list of dates under `dates`", 400
+    if len(batch) > config.MAX_BATCH_SIZE:
+        logger.info("Batch of %s dates exceeds the maximum of %s dates", len(batch), config.MAX_BATCH_SIZE)
+        return f"Given batch of {len(batch)} dates exceeds the maximum of {config.MAX_BATCH_SIZE} dates", 400
+
+    try:
+        return Response(json.dumps(get_date_matrix.get_date_matrices(batch)), mimetype=formats.JSON)
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return "Server side issue", 500
+
+
+@flask_app.route("/range", methods=["GET"])
+def month_range() -> Response | tuple[str, int]:
+    """Batch route returning calendars for every month between `from` and `to` query parameters (Format: "YYYY-MM")
+
+    - Representation is negotiated via `Accept` header (see `formats`), json being the default
+
+    Returns:
+        Response | tuple[str, int]: Returns the negotiated response or the tuple of error message and status code
+    """
+    from_month, to_month = request.args.get("from", ""), request.args.get("to", "")
+    logger.info("GET call received to get months from: %s to: %s", from_month, to_month)
+
+    try:
+        media_type = _negotiated_media_type()
+        if media_type == formats.JSON:
+            with metrics.timed_stage("computation"):
+                month_range_matrices = get_date_matrix.get_month_range_matrices(from_month, to_month)
+            with metrics.timed_stage("serialization"):
+                body = json.dumps(month_range_matrices).encode()
+        else:
+            with metrics.timed_stage("computation"):
+                body = get_date_matrix.get_month_range_body(from_month, to_month, media_type)
+        return _negotiated_response(body, media_type)
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Month range validation failed", exc_info=True)
+        return str(e), 400
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return "Server side issue", 500
+
+
+@flask_app.route("/stream", methods=["GET"])
+def stream() -> Response | tuple[str, int]:
+    """Streaming route returning NDJSON calendars for every month between `from` and `to` query parameters (Format: "YYYY-MM")
+
+    - Meant for long ranges as calendars are streamed month by month instead of being buffered
+
+    Returns:
+        Response | tuple[str, int]: Returns streaming NDJSON response or the tuple of error message and status code
+    """
+    from_month, to_month = request.args.get("from", ""), request.args.get("to", "")
+    logger.info("GET call received to stream months from: %s to: %s", from_month, to_month)
+
+    try:
+        return Response(get_date_matrix.stream_month_range_matrices(from_month, to_month), mimetype="application/x-ndjson")
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Month range validation failed", exc_info=True)
+        return str(e), 400
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return "Server side issue", 500
+
+
+@flask_app.route("/year/<year>", methods=["GET"])
+def year(year: str) -> Response | tuple[str, int]:
+    """Route returning calendars for all months of a year
+
+    - Representation is negotiated via `Accept` header (see `formats`), json being the default
+
+    Args:
+        year (str): Year (Format: "YYYY") for which calendar is required
+
+    Returns:
+        Response | tuple[str, int]: Returns the negotiated response or the tuple of error message and status code
+    """
+    logger.info("GET call received to get year: %s", year)
+
+    try:
+        media_type = _negotiated_media_type()
+        if media_type == formats.JSON:
+            with metrics.timed_stage("computation"):
+                year_matrices = get_date_matrix.get_year_matrices(year)
+            with metrics.timed_stage("serialization"):
+                body = json.dumps(year_matrices).encode()
+        else:
+            with metrics.timed_stage("computation"):
+                body = get_date_matrix.get_year_body(year, media_type)
+        return _negotiated_response(body, media_type)
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Year validation failed", exc_info=True)
+        return str(e), 400
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return "Server side issue", 500
+
+
+@flask_app.route("/cache/stats", methods=["GET"])
+def cache_stats() -> Response:
+    """Month matrix cache statistics end point
+
+    Returns:
+        Response: Returns the json counters of the month matrix cache along with no. of warmed up months and interned date matrices
+    """
+    logger.debug("Cache stats GET end point called")
+
+    return Response(
+        json.dumps(
+            {
+                **get_date_matrix.month_cache.stats(),
+                "warm_size": len(get_date_matrix.warm_month_entries),
+                "interned_size": len(get_date_matrix.interned_month_entries) + len(get_date_matrix.interned_grid_entries),
+            }
+        ),
+        mimetype=formats.JSON,
+    )
+
+
+@flask_app.after_request
+def compress_response(response: Response) -> Response:
+    """Compresses body of a successful response as per `Accept-Encoding` header of the request
+
+    - Bodies smaller than `COMPRESSION_MIN_SIZE` are left as is as compressing them doesn't pay off
+    - Streamed responses are left as is so that they aren't buffered
+    - Responses carrying an ETag (calendar of a single month) are left as is, else every encoding would need its own ETag
+
+    Args:
+        response (Response): Response of the request
+
+    Returns:
+        Response: Same `response`, compressed if applicable
+    """
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or "ETag" in response.headers
+    ):
+        return response
+    if response.calculate_content_length() < config.COMPRESSION_MIN_SIZE:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(compression.ENCODINGS)
+    if encoding is None:
+        return response
+
+    response.set_data(compression.compress(response.get_data(), encoding))
+    response.headers["Content-Encoding"] = encoding
+
+    return response
+
+
+@flask_app.route("/metrics", methods=["GET"])
+def metrics_page() -> Response:
+    """Metrics end point in Prometheus text exposition format aggregated across all worker processes
+
+    Returns:
+        Response: Metrics in text exposition format
+    """
+    logger.debug("Metrics GET end point called")
+
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@flask_app.route("/debug/profiles", methods=["GET"])
+def debug_profiles() -> Response | tuple[str, int]:
+    """Debug end point listing top functions aggregated across captured profiles
+
+    - Query parameters `limit` (default 20) and `sort` ("cumulative" (default) or "tottime")
+
+    Returns:
+        Response | tuple[str, int]: Returns the json response or the tuple of error message and status code
+    """
+    logger.debug("Debug profiles GET end point called")
+
+    if not config.PROFILING_ENABLED:
+        return "Profiling is disabled", 404
+
+    try:
+        return Response(json.dumps(profiling.top_functions(int(request.args.get("limit", 20)), request.args.get("sort", "cumulative"))), mimetype=formats.JSON)
+    except ValueError as e:
+        return str(e), 400
+
+
+def _route() -> str:
+    """Returns url rule of the route serving the current request
+
+    Returns:
+        str: Url rule like `/date/<date>` or `<unmatched>` if no route matched
+    """
+    return request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+
+
+def _month_url(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> str:
+    """Returns canonical url of the calendar of a month
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+        layout (constants.Layout, optional): Layout of the date matrix, query parameters are added only for the parts
+            differing from `DEFAULT_LAYOUT`. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        str: Url of the canonical `/month/<yyyy>/<mm>` resource
+    """
+    return url_for("month", year=f"{year:04d}", month=f"{month:02d}", **http_utils.layout_query_args(layout))
+
+
+def _month_response(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> Response:
+    """Returns cacheable response of the calendar of an already validated month in the negotiated representation
+
+    - Conditional request matching the ETag of the month is answered with 304 without computing the date matrix
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        Response: Negotiated response of the date matrix or an empty 304 response
+    """
+    media_type = _negotiated_media_type()
+    etag = http_utils.month_etag(year, month, media_type, layout)
+    if http_utils.etag_matches(request.headers.get("If-None-Match"), etag):
+        return _cacheable_response(_negotiated_response(b"", media_type, status=304), etag)
+
+    with metrics.timed_stage("computation"):
+        if media_type == formats.JSON:
+            body = get_date_matrix.get_month_matrix_json(year, month, layout)
+        else:
+            body = get_date_matrix.get_month_matrix_body(year, month, media_type, layout)
+    with metrics.timed_stage("serialization"):
+        return _cacheable_response(_negotiated_response(body, media_type), etag)
+
+
+def _negotiated_media_type() -> str:
+    """Returns representation of date matrices negotiated via `Accept` header of the current request
+
+    Returns:
+        str: Canonical media type (see `formats`), json if client doesn't accept any other representation
+    """
+    return http_utils.negotiated_media_type(request.headers.get("Accept"))
+
+
+def _negotiated_response(body: bytes, media_type: str, status: int = 200) -> Response:
+    """Returns response of a representation negotiated via `Accept` header
+
+    Args:
+        body (bytes): Encoded body
+        media_type (str): Canonical media type (see `formats`) of the representation
+        status (int, optional): Status code. Defaults to 200.
+
+    Returns:
+        Response: Response varying upon `Accept` header
+    """
+    response = Response(body, status=status, mimetype=media_type)
+    response.vary.add("Accept")
+
+    return response
+
+
+def _cacheable_response(response: Response, etag: str | None = None) -> Response:
+    """Marks a response of an immutable resource as cacheable forever
+
+    Args:
+        response (Response): Response that needs to be marked
+        etag (str | None, optional): Unquoted strong ETag of the resource. Defaults to None.
+
+    Returns:
+        Response: Same `response` with ETag and Cache-Control headers
+    """
+    if etag is not None:
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = http_utils.immutable_cache_control()
+
+    return response
@@ -0,0 +1,216 @@
+# ASGI application serving the same routes as the Flask application on an asyncio server like uvicorn
+#
+# It is a plain ASGI callable without any framework so that the only added dependency is the server itself.
+# Computation of date matrices is shared with the Flask application via `get_date_matrix`.
+
+from typing import Awaitable, Callable
+from urllib.parse import parse_qs
+
+from api.src import (
+    calendar_table,
+    constants,
+    exceptions,
+    formats,
+    get_date_matrix,
+    http_utils,
+    utils,
+)
+from api.src.config import config
+from api.src.initializer import app_ready, logger
+
+_Receive = Callable[[], Awaitable[dict]]
+_Send = Callable[[dict], Awaitable[None]]
+
+_TEXT_CONTENT_TYPE = (b"content-type", b"text/html; charset=utf-8")
+
+
+async def asgi_app(scope: dict, receive: _Receive, send: _Send) -> None:
+    """ASGI entry point of the application
+
+    Args:
+        scope (dict): Connection scope
+        receive (_Receive): Awaitable callable to receive events
+        send (_Send): Awaitable callable to send events
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+    if scope["method"] not in ("GET", "HEAD"):
+        status, headers, body = 405, [_TEXT_CONTENT_TYPE], b"Method Not Allowed"
+    elif path == "/":
+        logger.debug("Home GET end point called")
+        status, headers, body = 200, [_TEXT_CONTENT_TYPE], b"Welcome to Calendar App. Please visit url: 'hostname:port/date' to try it."
+    elif path == "/health":
+        logger.debug("Health GET end point called")
+        if app_ready.is_set():
+            status, headers, body = 200, [_TEXT_CONTENT_TYPE], b"Calendar App alive."
+        else:
+            status, headers, body = 503, [_TEXT_CONTENT_TYPE], b"Calendar App warming up."
+    elif path.startswith("/date/") and path.count("/") == 2:
+        status, headers, body = _date(path[len("/date/") :], scope)
+    elif path.startswith("/month/") and path.count("/") == 3:
+        status, headers, body = _month(*path[len("/month/") :].split("/"), scope)
+    else:
+        status, headers, body = 404, [_TEXT_CONTENT_TYPE], b"Not Found"
+
+    headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+def _date(date: str, scope: dict) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """Returns calendar for the month of `date` mirroring `/date/<date>` route of the Flask application
+
+    - Layout is chosen via `week_start`, `week_numbers` and `trim_rows` query parameters and representation via `Accept`
+      header, as for the Flask application
+
+    Args:
+        date (str): Date for which calendar is required
+        scope (dict): Connection scope
+
+    Returns:
+        tuple[int, list[tuple[bytes, bytes]], bytes]: Status code, headers and body of the response
+    """
+    logger.info("GET call received to get date for: %s", date)
+
+    try:
+        date_obj = utils.date_validator(date, constants.PIVOT_DATE)
+        layout = _layout(scope)
+
+        return _month_response(date_obj.year, date_obj.month, layout, scope)
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Date validation failed", exc_info=True)
+        return 400, [_TEXT_CONTENT_TYPE], str(e).encode()
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return 500, [_TEXT_CONTENT_TYPE], b"Server side issue"
+
+
+def _month(year: str, month: str, scope: dict) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """Returns calendar of a month mirroring canonical `/month/<yyyy>/<mm>` route of the Flask application
+
+    - Non-canonical forms are redirected to the canonical url of the month and layout, as for the Flask application
+
+    Args:
+        year (str): Year (Format: "YYYY") of the month
+        month (str): Month (Format: "MM") for which calendar is required
+        scope (dict): Connection scope
+
+    Returns:
+        tuple[int, list[tuple[bytes, bytes]], bytes]: Status code, headers and body of the response
+    """
+    logger.info("GET call received to get month: %s/%s", year, month)
+
+    try:
+        year_value, month_value = utils.month_validator(f"{year}-{month}", constants.PIVOT_DATE)
+        layout = _layout(scope)
+
+        if not http_utils.is_canonical_month_request(year, month, scope.get("query_string", b"").decode("latin-1"), year_value, month_value, layout):
+            location = scope.get("root_path", "") + http_utils.month_path(year_value, month_value, layout)
+            return 301, [_TEXT_CONTENT_TYPE, (b"location", location.encode()), _cache_control()], b""
+
+        return _month_response(year_value, month_value, layout, scope)
+    except exceptions.InvalidDateFormat as e:
+        logger.info("Month validation failed", exc_info=True)
+        return 400, [_TEXT_CONTENT_TYPE], str(e).encode()
+    except Exception:
+        logger.exception("Server side error. Please reach out to support team for help")
+        return 500, [_TEXT_CONTENT_TYPE], b"Server side issue"
+
+
+def _month_response(year: int, month: int, layout: constants.Layout, scope: dict) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """Returns cacheable response of the calendar of an already validated month in the negotiated representation
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+        layout (constants.Layout): Layout of the date matrix
+        scope (dict): Connection scope
+
+    Returns:
+        tuple[int, list[tuple[bytes, bytes]], bytes]: Status code, headers and body of the response, empty 304 response
+            for a conditional request matching the ETag of the month
+    """
+    media_type = http_utils.negotiated_media_type(_header(scope, b"accept"))
+    etag = http_utils.month_etag(year, month, media_type, layout)
+    headers = [
+        (b"etag", f'"{etag}"'.encode()),
+        _cache_control(),
+        (b"content-location", (scope.get("root_path", "") + http_utils.month_path(year, month, layout)).encode()),
+        (b"vary", b"Accept"),
+    ]
+    if http_utils.etag_matches(_header(scope, b"if-none-match"), etag):
+        return 304, headers, b""
+
+    headers.append((b"content-type", media_type.encode()))
+    if media_type == formats.JSON:
+        return 200, headers, get_date_matrix.get_month_matrix_json(year, month, layout)
+
+    return 200, headers, get_date_matrix.get_month_matrix_body(year, month, media_type, layout)
+
+
+def _layout(scope: dict) -> constants.Layout:
+    """Validates layout of the date matrix requested via query parameters
+
+    Args:
+        scope (dict): Connection scope
+
+    Raises:
+        exceptions.InvalidDateFormat: If the requested layout fails the validations test(s)
+
+    Returns:
+        constants.Layout: Layout of the date matrix
+    """
+    query_args = {name: values[-1] for name, values in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()}
+
+    return utils.layout_validator(query_args.get("week_start"), query_args.get("week_numbers"), query_args.get("trim_rows"))
+
+
+def _cache_control() -> tuple[bytes, bytes]:
+    """Returns `Cache-Control` header of responses that never change for a url
+
+    Returns:
+        tuple[bytes, bytes]: Name and value of the header
+    """
+    return b"cache-control", http_utils.immutable_cache_control().encode()
+
+
+def _header(scope: dict, name: bytes) -> str | None:
+    """Returns value of a request header, joining repeated headers as per RFC 9110
+
+    Args:
+        scope (dict): Connection scope
+        name (bytes): Lower cased name of the header
+
+    Returns:
+        str | None: Value of the header, None if the header isn't present
+    """
+    values = [value.decode("latin-1") for header_name, value in scope["headers"] if header_name == name]
+
+    return ", ".join(values) if values else None
+
+
+async def _lifespan(receive: _Receive, send: _Send) -> None:
+    """Handles lifespan events of the ASGI server
+
+    Args:
+        receive (_Receive): Awaitable callable to receive events
+        send (_Send): Awaitable callable to send events
+    """
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Gunicorn hooks already warm up caches when served by gunicorn, others like plain uvicorn need it here
+            if not app_ready.is_set():
+                calendar_table.load_table(config.CALENDAR_TABLE_PATH)
+                get_date_matrix.warm_up(config.WARMUP_YEARS)
+                app_ready.set()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
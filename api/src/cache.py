@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """Thread safe cache bounded by number of entries and evicting the least recently used entry"""
+
+    def __init__(self, max_size: int) -> None:
+        """Initializer for `LRUCache` class
+
+        Args:
+            max_size (int): Maximum number of entries held by the cache. `0` disables caching
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """Returns maximum number of entries held by the cache
+
+        Returns:
+            int: Maximum number of entries
+        """
+        return self._max_size
+
+    def __len__(self) -> int:
+        """Returns number of entries currently held by the cache
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns value cached for `key`, computing and caching it via `compute` on a miss
+
+        Args:
+            key (Hashable): Key of the entry
+            compute (Callable[[], Any]): Callable returning the value for `key` on a miss
+
+        Returns:
+            Any: Value for `key`
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+
+        # Computed outside of the lock so that a slow miss doesn't block hits of other threads
+        value = compute()
+        if self._max_size <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns counters of the cache that help in sizing it
+
+        Returns:
+            dict[str, int]: Hits, misses, evictions, current size and maximum size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+            }
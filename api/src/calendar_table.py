@@ -0,0 +1,129 @@
+# Compact binary table of every month of the 400 years Gregorian cycle, memory-mapped while serving
+#
+# Gregorian calendar repeats every 400 years (146097 days, a multiple of 7), so date matrix of any month only
+# depends upon (year % 400, month). The table stores a small set of distinct date matrices (grids) and, for every
+# month of the cycle, index of its grid along with its first weekday and length. It is built once by
+# `scripts/build_calendar_table.py` and memory-mapped by every worker so that all of them share the same pages.
+#
+# Layout (little endian):
+#   header: magic (4 bytes) | version (1 byte) | no. of grids (1 byte) | cycle years (2 bytes)
+#   months: cycle years * 12 entries of grid index (1 byte) | first weekday << 5 | days in month (1 byte)
+#   grids:  no. of grids * 42 bytes of dates of the grid in row major order
+
+import mmap
+import os
+import struct
+
+from api.src.initializer import logger
+
+CYCLE_YEARS = 400
+GRID_SIZE = 6 * 7
+
+_MAGIC = b"CALT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBH")
+_MONTH_ENTRY_SIZE = 2
+_MONTHS_OFFSET = _HEADER.size
+_GRIDS_OFFSET = _MONTHS_OFFSET + CYCLE_YEARS * 12 * _MONTH_ENTRY_SIZE
+
+
+def pack_table(month_entries: list[tuple[int, int, int]], grids: list[bytes]) -> bytes:
+    """Packs the table into its binary layout
+
+    Args:
+        month_entries (list[tuple[int, int, int]]): (grid index, first weekday, days in month) of every month of the
+            cycle in order, beginning from January of a year divisible by 400
+        grids (list[bytes]): Distinct grids of 42 dates each
+
+    Raises:
+        ValueError: If the entries or grids don't fit the layout
+
+    Returns:
+        bytes: Binary table
+    """
+    if len(month_entries) != CYCLE_YEARS * 12 or len(grids) > 255 or any(len(grid) != GRID_SIZE for grid in grids):
+        raise ValueError("Calendar table needs an entry for every month of the cycle and at most 255 grids of 42 dates")
+
+    months = bytes(byte for grid_idx, start_day, month_days in month_entries for byte in (grid_idx, start_day << 5 | month_days))
+
+    return _HEADER.pack(_MAGIC, _VERSION, len(grids), CYCLE_YEARS) + months + b"".join(grids)
+
+
+class CalendarTable:
+    """Read-only memory-mapped calendar table"""
+
+    def __init__(self, path: str) -> None:
+        """Initializer for `CalendarTable` class
+
+        Args:
+            path (str): Path of the binary table built by `scripts/build_calendar_table.py`
+
+        Raises:
+            ValueError: If the file isn't a valid calendar table
+        """
+        with open(path, "rb") as table_file:
+            self._mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_grids, cycle_years = _HEADER.unpack_from(self._mmap)
+        if (magic, version, cycle_years) != (_MAGIC, _VERSION, CYCLE_YEARS) or len(self._mmap) != _GRIDS_OFFSET + num_grids * GRID_SIZE:
+            self._mmap.close()
+            raise ValueError(f"File: {path} isn't a valid calendar table of version {_VERSION}")
+
+        self.num_grids = num_grids
+
+    def month_grid(self, year: int, month: int) -> bytes:
+        """Returns dates of the 7*6 date matrix of a month in row major order
+
+        Args:
+            year (int): Year of the month
+            month (int): Month (value of `MONTH`)
+
+        Returns:
+            bytes: 42 dates of the date matrix
+        """
+        grid_offset = _GRIDS_OFFSET + self._mmap[_MONTHS_OFFSET + ((year % CYCLE_YEARS) * 12 + month - 1) * _MONTH_ENTRY_SIZE] * GRID_SIZE
+
+        return self._mmap[grid_offset : grid_offset + GRID_SIZE]
+
+    def month_signature(self, year: int, month: int) -> tuple[int, int]:
+        """Returns first weekday and no. of days of a month
+
+        Args:
+            year (int): Year of the month
+            month (int): Month (value of `MONTH`)
+
+        Returns:
+            tuple[int, int]: Value of `DAY` on which the month begins and no. of days in the month
+        """
+        packed = self._mmap[_MONTHS_OFFSET + ((year % CYCLE_YEARS) * 12 + month - 1) * _MONTH_ENTRY_SIZE + 1]
+
+        return packed >> 5, packed & 0b11111
+
+    def close(self) -> None:
+        """Unmaps the table"""
+        self._mmap.close()
+
+
+# Table used while serving, loaded by `load_table` before accepting traffic
+loaded_table: CalendarTable | None = None
+
+
+def load_table(path: str) -> None:
+    """Memory-maps the table at `path` for serving, falling back to computing date matrices if it isn't usable
+
+    Args:
+        path (str): Path of the binary table built by `scripts/build_calendar_table.py`
+    """
+    global loaded_table
+
+    if not os.path.exists(path):
+        logger.warning("Calendar table: %s doesn't exist, date matrices will be computed", path)
+        return
+
+    try:
+        loaded_table = CalendarTable(path)
+    except (OSError, ValueError, struct.error):
+        logger.exception("Failed to load calendar table: %s, date matrices will be computed", path)
+        return
+
+    logger.info("Loaded calendar table: %s with %s distinct grids", path, loaded_table.num_grids)
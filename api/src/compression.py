@@ -0,0 +1,54 @@
+# Compression of response bodies negotiated via `Accept-Encoding` header
+#
+# Compressed bodies are cached by their content, so that responses which are the same for every request (like
+# calendars of a year or a range of months) are compressed only once.
+
+import gzip
+
+from api.src.cache import LRUCache
+from api.src.config import config
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, gzip is always available
+    brotli = None
+
+# Offered in order of preference
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+compressed_cache = LRUCache(config.COMPRESSION_CACHE_SIZE)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses a response body, reusing the cached result for a body compressed before
+
+    Args:
+        body (bytes): Uncompressed body
+        encoding (str): One of `ENCODINGS`
+
+    Returns:
+        bytes: Compressed body
+    """
+    return compressed_cache.get_or_compute((encoding, body), lambda: _compress(body, encoding))
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Compresses a response body
+
+    Args:
+        body (bytes): Uncompressed body
+        encoding (str): One of `ENCODINGS`
+
+    Raises:
+        ValueError: If `encoding` isn't supported
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == "gzip":
+        # Fixed mtime so that the same body is always compressed into the same bytes
+        return gzip.compress(body, compresslevel=config.GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=config.BROTLI_QUALITY)
+
+    raise ValueError(f"Encoding: {encoding} isn't one of {list(ENCODINGS)}")
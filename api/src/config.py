@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Type
 
 
@@ -8,18 +9,80 @@ class _Config:
     # Placeholders
     ENV = None
 
+    # Serving mode: "wsgi" for Flask application on gunicorn workers or "asgi" for ASGI application on uvicorn workers
+    SERVER = os.getenv("server") or "wsgi"
+
+    # Serving parameters of gunicorn
+    BIND = "0.0.0.0:8000"
+    WORKERS = int(os.getenv("workers") or 2 * (os.cpu_count() or 1) + 1)
+    WORKER_CLASS = os.getenv("worker_class") or "sync"  # One of "sync", "gthread" or "gevent". Ignored for "asgi" server
+    THREADS = int(os.getenv("threads") or 1)  # Threads per worker, used by "gthread" worker class
+    KEEP_ALIVE = 2  # Seconds to wait for requests on a keep-alive connection
+    BACKLOG = 2048  # Maximum number of pending connections
+    PRELOAD = False  # Load application before forking workers so that they share its memory copy-on-write
+    RELOAD = False  # Restart workers on code changes
+
+    # Maximum number of (year, month) entries held by the month matrix cache
+    MONTH_CACHE_SIZE = 1200
+
+    # Binary table of every month of the 400 years cycle built by `scripts/build_calendar_table.py`, memory-mapped while serving
+    CALENDAR_TABLE_PATH = os.getenv("calendar_table_path") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "calendar_table.bin")
+
+    # Months of current year +/- `WARMUP_YEARS` years are precomputed before accepting traffic
+    WARMUP_YEARS = int(os.getenv("warmup_years") or 10)
+
+    # Limits on the size of a single batch request
+    MAX_BATCH_SIZE = 366
+    MAX_RANGE_MONTHS = 1200
+    # Limit on the length of a streamed range, which holds a worker thread until done. Default fits every month from
+    # the pivot date up to 9999-12
+    MAX_STREAM_MONTHS = int(os.getenv("max_stream_months") or 100_000)
+
+    # Lifetime (in seconds) of immutable responses like calendar of a month in HTTP caches
+    HTTP_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+
+    # Response bodies smaller than `COMPRESSION_MIN_SIZE` bytes (like calendar of a single month) are sent uncompressed,
+    # larger ones are compressed as per `Accept-Encoding` and cached per body
+    COMPRESSION_MIN_SIZE = 1024
+    COMPRESSION_CACHE_SIZE = 64
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5
+
+    # Directory where every gunicorn worker flushes a snapshot of its metrics, at most once per `METRICS_FLUSH_INTERVAL`
+    # seconds, for `/metrics` to aggregate them. Gunicorn master process creates a temporary one when not set
+    METRICS_DIR = os.getenv("metrics_dir")
+    METRICS_FLUSH_INTERVAL = 1.0
+
+    # Opt-in cProfile capture of a fraction `PROFILE_SAMPLE_RATE` of requests, keeping profiles of requests taking at
+    # least `PROFILE_SLOW_THRESHOLD` seconds as the latest `PROFILE_MAX_FILES` `.prof` files in `PROFILE_DIR`
+    PROFILING_ENABLED = os.getenv("profiling") == "true"
+    PROFILE_SAMPLE_RATE = float(os.getenv("profile_sample_rate") or 0.01)
+    PROFILE_SLOW_THRESHOLD = float(os.getenv("profile_slow_threshold") or 0.0)
+    PROFILE_DIR = os.getenv("profile_dir") or os.path.join(tempfile.gettempdir(), "calendar-python-profiles")
+    PROFILE_MAX_FILES = 100
+
+    # Redirect `/date/<date>` to canonical `/month/<yyyy>/<mm>` instead of only advertising it via `Content-Location`
+    REDIRECT_DATE_TO_MONTH = False
+
 
 class _DevelopmentConfig(_Config):
     """Development config class"""
 
     ENV = "development"
 
+    RELOAD = True  # `--reload` doesn't work along with `--preload`
+
 
 class _ProductionConfig(_Config):
     """Production config class"""
 
     ENV = "production"
 
+    WORKER_CLASS = os.getenv("worker_class") or "gthread"
+    THREADS = int(os.getenv("threads") or 4)
+    KEEP_ALIVE = 5
+    PRELOAD = True
+
 
 _ENV_CONFIG_MAPPING: dict[str, Type[_ProductionConfig] | Type[_DevelopmentConfig]] = {
     "production": _ProductionConfig,
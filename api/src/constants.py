@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import NamedTuple
 
 
 # Represents day of a week
@@ -33,55 +34,18 @@ class MONTH(Enum):
 
 
 # Standardized date object used across the application
-class Date:
-    """Class representing the date object"""
+class Date(NamedTuple):
+    """Immutable and hashable date holding plain integers
 
-    def __init__(self, date: str) -> None:
-        """Initializer for `Date` class
+    - Being a tuple, it has no per-instance `__dict__` and dates are ordered by (year, month, day) tuple comparison
+    - Instances are meant to be created from user input via `utils.date_validator` which parses and validates once
+    - Construction doesn't validate, but date arithmetic of `utils` (`to_ordinal` and functions built on it) rejects
+      dates that don't exist like 2024-02-31 instead of silently rolling them over
+    """
 
-        Args:
-            date (str): ("YYYY-MM-DD") that needs to be represented as a `Date` object
-        """
-        year, month, day = map(int, date.split("-"))
-        self._year = year
-        self._month = MONTH._value2member_map_[month]
-        self._day = day
-
-    @property
-    def year(self) -> int:
-        """Returns value of year
-
-        Returns:
-            int: Integer representation of year of `Date` object
-        """
-        return self._year
-
-    @property
-    def month(self) -> Enum:
-        """Returns value of month
-
-        Returns:
-            Enum: `MONTH` representation of month of `Date` object
-        """
-        return self._month
-
-    @property
-    def day(self) -> int:
-        """Returns value of day
-
-        Returns:
-            int: Integer representation of day of `Date` object
-        """
-        return self._day
-
-    @day.setter
-    def day(self, day: int) -> None:
-        """Allows setting value of day
-
-        Args:
-            day (int): Value of day that needs to be set for `Date` object
-        """
-        self._day = day
+    year: int
+    month: int  # Value of `MONTH`
+    day: int
 
     def __str__(self) -> str:
         """Returns string representation of `Date` object
@@ -89,13 +53,43 @@ class Date:
         Returns:
             str: String representation of `Date` object
         """
-        return f"{self.year}-{self.month.value}-{self.day}"
+        return f"{self.year}-{self.month}-{self.day}"
 
 
 # The Britain and the British Empire including the American colonies adopted the Gregorian Calendar on 13-Sept-1752
 # We are following the Gregorian Calendar and hence minimum supported date is 01-Oct-1752
-PIVOT_DATE = Date("1752-10-01")
+PIVOT_DATE = Date(1752, 10, 1)
 PIVOT_DAY = DAY.SUNDAY
 
 # Represents all months that have 31 days in a year
 MONTHS_WITH_31_DAYS = {MONTH.JANUARY, MONTH.MARCH, MONTH.MAY, MONTH.JULY, MONTH.AUGUST, MONTH.OCTOBER, MONTH.DECEMBER}
+
+# No. of days in a month in a non-leap year, indexed by value of `MONTH`
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Cumulative no. of days before the beginning of a month in a non-leap year, indexed by value of `MONTH`
+DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# No. of days in the cycles of the Gregorian calendar: 400 years repeat exactly, 100 years skip a leap day (except
+# the last century of 400 years) and 4 years hold one leap day (except the last 4 years of a century)
+DAYS_IN_400_YEARS = 146097
+DAYS_IN_100_YEARS = 36524
+DAYS_IN_4_YEARS = 1461
+
+
+# Layout of a date matrix
+class Layout(NamedTuple):
+    """Immutable and hashable layout of a date matrix
+
+    - Every row is a week beginning on `week_start` (value of `DAY`)
+    - With `week_numbers`, every row is preceded by ISO week number of the Monday in that row
+    - With `trim_rows`, trailing rows holding only dates of the next month are left out, leaving 4 to 6 rows
+    """
+
+    week_start: int = DAY.SUNDAY.value
+    week_numbers: bool = False
+    trim_rows: bool = False
+
+
+# Sunday first layout without week numbers as per `#   S  M  T   W   T   F   S`
+DEFAULT_LAYOUT = Layout()
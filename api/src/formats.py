@@ -0,0 +1,135 @@
+# Alternate representations of date matrices negotiated via `Accept` header, json stays the default
+#
+# - `application/octet-stream`: 42 dates of every date matrix packed as unsigned bytes in row major order
+# - `application/msgpack`: MessagePack array of 6 arrays of 7 dates, hand encoded as every date (and week number) is a
+#   positive fixint
+# - `application/vnd.calendar.compact+json`: `{"start": weekday of 1st, "days": days in month, "prev_days": days in previous month}`
+#
+# Counts above are of the default layout, other layouts (see `constants.Layout`) may have 4 to 6 rows of 7 or 8 values.
+# Compact form is the sparse representation from which clients can rebuild a date matrix of any layout.
+#
+# Batches are encoded as a sequence of the same representations: concatenated 42 bytes blocks, a MessagePack array
+# or a json list respectively.
+
+import json
+import struct
+from array import array
+
+JSON = "application/json"
+OCTET_STREAM = "application/octet-stream"
+MSGPACK = "application/msgpack"
+COMPACT_JSON = "application/vnd.calendar.compact+json"
+
+# Offered in order of preference so that json wins whenever client accepts several representations equally
+MEDIA_TYPES = (JSON, OCTET_STREAM, MSGPACK, "application/x-msgpack", COMPACT_JSON)
+
+# Suffix of ETag per representation so that caches never serve one representation for another
+_ETAG_SUFFIXES = {JSON: "", OCTET_STREAM: "-bin", MSGPACK: "-msgpack", COMPACT_JSON: "-compact"}
+
+
+def canonical_media_type(media_type: str | None) -> str:
+    """Returns canonical media type of a negotiated representation
+
+    Args:
+        media_type (str | None): Media type chosen out of `MEDIA_TYPES` or None if none of them is acceptable
+
+    Returns:
+        str: One of `JSON`, `OCTET_STREAM`, `MSGPACK` or `COMPACT_JSON`
+    """
+    if media_type == "application/x-msgpack":
+        return MSGPACK
+
+    return media_type if media_type in _ETAG_SUFFIXES else JSON
+
+
+def etag_suffix(media_type: str) -> str:
+    """Returns suffix of ETag of a representation
+
+    Args:
+        media_type (str): Canonical media type of the representation
+
+    Returns:
+        str: Suffix appended to ETag of the json representation
+    """
+    return _ETAG_SUFFIXES[media_type]
+
+
+def encode_month(media_type: str, date_matrix: tuple[tuple[int, ...], ...], month_signature: tuple[int, int, int]) -> bytes:
+    """Encodes date matrix of a month in a non json representation
+
+    Args:
+        media_type (str): Canonical media type of the representation
+        date_matrix (tuple[tuple[int, ...], ...]): Date matrix of the month, 7*6 in the default layout
+        month_signature (tuple[int, int, int]): Value of `DAY` on which the month begins, no. of days in the month and
+            in the previous month
+
+    Raises:
+        ValueError: If `media_type` isn't an alternate representation
+
+    Returns:
+        bytes: Encoded date matrix
+    """
+    if media_type == OCTET_STREAM:
+        return array("B", [date for row in date_matrix for date in row]).tobytes()
+    if media_type == MSGPACK:
+        # fixarray of rows, each a fixarray of positive fixints
+        return _msgpack_array_header(len(date_matrix)) + b"".join(_msgpack_array_header(len(row)) + bytes(row) for row in date_matrix)
+    if media_type == COMPACT_JSON:
+        return json.dumps(_compact(month_signature)).encode()
+
+    raise ValueError(f"Media type: {media_type} isn't an alternate representation of a date matrix")
+
+
+def encode_months(media_type: str, months: list[tuple[tuple[tuple[int, ...], ...], tuple[int, int, int]]]) -> bytes:
+    """Encodes date matrices of a batch of months in a non json representation
+
+    Args:
+        media_type (str): Canonical media type of the representation
+        months (list[tuple[tuple[tuple[int, ...], ...], tuple[int, int, int]]]): Date matrix and signature of every month
+
+    Raises:
+        ValueError: If `media_type` isn't an alternate representation
+
+    Returns:
+        bytes: Encoded date matrices in order
+    """
+    if media_type == COMPACT_JSON:
+        return json.dumps([_compact(month_signature) for _, month_signature in months]).encode()
+
+    encoded_months = b"".join(encode_month(media_type, date_matrix, month_signature) for date_matrix, month_signature in months)
+    if media_type == MSGPACK:
+        return _msgpack_array_header(len(months)) + encoded_months
+
+    return encoded_months
+
+
+def _compact(month_signature: tuple[int, int, int]) -> dict[str, int]:
+    """Returns compact form of a month from which its date matrix can be rebuilt
+
+    Args:
+        month_signature (tuple[int, int, int]): Value of `DAY` on which the month begins, no. of days in the month and
+            in the previous month
+
+    Returns:
+        dict[str, int]: Compact form of the month
+    """
+    start_day, month_days, last_month_days = month_signature
+
+    return {"start": start_day, "days": month_days, "prev_days": last_month_days}
+
+
+def _msgpack_array_header(length: int) -> bytes:
+    """Returns header of a MessagePack array
+
+    Args:
+        length (int): No. of elements in the array
+
+    Returns:
+        bytes: fixarray, array 16 or array 32 header as per `length`
+    """
+    if length < 16:
+        return bytes([0x90 | length])
+    if length < 1 << 16:
+        return b"\xdc" + struct.pack(">H", length)
+
+    return b"\xdd" + struct.pack(">I", length)
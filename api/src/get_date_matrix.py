@@ -1,6 +1,36 @@
-from api.src import constants, utils
+import json
+import time
+import tracemalloc
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping
+
+from api.src import calendar_table, constants, exceptions, formats, utils
+from api.src.cache import LRUCache
+from api.src.config import config
 from api.src.initializer import logger
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only speeds up building of a year
+    np = None
+
+# Date matrix only depends upon year and month of the date, so we cache it per (year, month) along with its
+# serialized json so that all days of a month share a single entry
+month_cache = LRUCache(config.MONTH_CACHE_SIZE)
+
+# Date matrix only depends upon signature of its month i.e. (first weekday, days in month, days in previous month) and
+# there are only a few dozen signatures, so every cached month shares the single interned entry of its signature
+interned_month_entries: dict[tuple[int, int, int], tuple[tuple[tuple[int, ...], ...], bytes]] = {}
+
+# Date matrices served out of the memory-mapped calendar table, interned per distinct 42 bytes grid of the table
+interned_grid_entries: dict[bytes, tuple[tuple[tuple[int, ...], ...], bytes]] = {}
+
+# Alternate representations (see `formats`) of interned date matrices per (signature, media type)
+interned_month_bodies: dict[tuple[tuple[int, int, int], str], bytes] = {}
+
+# Read-only table of months precomputed by `warm_up`, consulted before `month_cache`
+warm_month_entries: Mapping[tuple[int, int], tuple[tuple[tuple[int, ...], ...], bytes]] = MappingProxyType({})
+
 
 def get_date_matrix(date: str) -> list[list]:
     """Computes the date matrix for a given date
@@ -14,49 +44,614 @@ def get_date_matrix(date: str) -> list[list]:
     Returns:
         list[list]: Returns a list of list representing 7*6 calendar for the month as per `date`
     """
-    logger.info(f"Computing date matrix for: {date}")
+    date_matrix, _ = _get_month_entry(date)
+
+    # Copy so that callers can't modify the cached matrix
+    return [list(row) for row in date_matrix]
+
+
+def get_date_matrix_json(date: str) -> bytes:
+    """Computes the json serialized date matrix for a given date
+
+    Args:
+        date (str): Date (Format: "YYYY-MM-DD") for which calendar is required
+
+    Returns:
+        bytes: Json serialized 7*6 calendar for the month as per `date`
+    """
+    _, date_matrix_json = _get_month_entry(date)
+
+    return date_matrix_json
+
+
+def get_month_matrix_json(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> bytes:
+    """Computes the json serialized date matrix for an already validated month
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        bytes: Json serialized calendar for the month, 7*6 in the default layout
+    """
+    _, date_matrix_json = _get_cached_month_entry(year, month, layout)
+
+    return date_matrix_json
+
+
+def get_month_matrix_body(year: int, month: int, media_type: str, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> bytes:
+    """Computes the date matrix for an already validated month encoded in an alternate representation
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        media_type (str): Canonical media type (see `formats`) of the representation other than json
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        bytes: Encoded calendar for the month, 7*6 in the default layout
+    """
+    if layout != constants.DEFAULT_LAYOUT:
+        date_matrix, _ = _get_cached_month_entry(year, month, layout)
+        return formats.encode_month(media_type, date_matrix, _layout_month_signature(year, month, layout))
+
+    return _get_interned_month_body(year, month, media_type)
+
+
+def _get_month_entry(date: str) -> tuple[tuple[tuple[int, ...], ...], bytes]:
+    """Validates `date` and returns the cached date matrix along with its json for the month of `date`
+
+    Args:
+        date (str): Date (Format: "YYYY-MM-DD") for which calendar is required
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], bytes]: Immutable date matrix and its json serialization
+    """
+    logger.debug("Computing date matrix for: %s", date)
+
+    # Validation on date passed by user and conversion into application specific Date object
+    date_obj = utils.date_validator(date, constants.PIVOT_DATE)
+
+    return _get_cached_month_entry(date_obj.year, date_obj.month)
+
+
+def get_date_matrices(dates: list[str]) -> list[dict]:
+    """Computes the date matrices for a batch of dates
+
+    - Date matrix of each distinct month in the batch is computed only once
+    - Validation failure of a date is reported inline against that date without failing the whole batch
+
+    Args:
+        dates (list[str]): Dates (Format: "YYYY-MM-DD") for which calendars are required
+
+    Returns:
+        list[dict]: Returns `{"date": date, "matrix": date_matrix}` or `{"date": date, "error": message}` per date
+    """
+    logger.debug("Computing date matrices for batch of %s dates", len(dates))
+
+    date_matrices = {}
+    results = []
+    for date in dates:
+        try:
+            date_obj = utils.date_validator(date, constants.PIVOT_DATE)
+        except exceptions.InvalidDateFormat as e:
+            results.append({"date": date, "error": str(e)})
+            continue
+
+        year_month = (date_obj.year, date_obj.month)
+        if year_month not in date_matrices:
+            date_matrices[year_month], _ = _get_cached_month_entry(*year_month)
+        results.append({"date": date, "matrix": date_matrices[year_month]})
+
+    return results
+
+
+def get_month_range_matrices(from_month: str, to_month: str) -> list[dict]:
+    """Computes the date matrices for every month between two months (both inclusive)
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s) or don't form a valid range
+
+    Returns:
+        list[dict]: Returns `{"month": "YYYY-MM", "matrix": date_matrix}` per month of the range
+    """
+    logger.debug("Computing date matrices for months from: %s to: %s", from_month, to_month)
+
+    from_year, from_month_value, num_months = _bounded_month_range_validator(from_month, to_month)
+
+    results = []
+    for year, month in _iter_months(from_year, from_month_value, num_months):
+        date_matrix, _ = _get_cached_month_entry(year, month)
+        results.append({"month": f"{year:04d}-{month:02d}", "matrix": date_matrix})
+
+    return results
+
+
+def get_month_range_body(from_month: str, to_month: str, media_type: str) -> bytes:
+    """Computes the date matrices for every month between two months (both inclusive) encoded in an alternate representation
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+        media_type (str): Canonical media type (see `formats`) of the representation other than json
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s) or don't form a valid range
+
+    Returns:
+        bytes: Encoded date matrices of the months of the range in order
+    """
+    logger.debug("Encoding date matrices for months from: %s to: %s as: %s", from_month, to_month, media_type)
+
+    from_year, from_month_value, num_months = _bounded_month_range_validator(from_month, to_month)
+
+    return _encode_months(_iter_months(from_year, from_month_value, num_months), media_type)
+
+
+def stream_month_range_matrices(from_month: str, to_month: str) -> Iterator[bytes]:
+    """Validates a range of months and returns a generator of NDJSON lines of date matrices for every month in the range
+
+    - Validation happens eagerly so that an invalid range is reported before streaming begins
+    - Memory usage stays flat irrespective of the length of the range as only one month is held at a time, but the
+      range is limited to `MAX_STREAM_MONTHS` as streaming holds a worker thread
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s), don't form a valid range or
+            the range exceeds `MAX_STREAM_MONTHS`
+
+    Returns:
+        Iterator[bytes]: Yields `{"month": "YYYY-MM", "matrix": date_matrix}` json line per month of the range
+    """
+    logger.debug("Streaming date matrices for months from: %s to: %s", from_month, to_month)
+
+    from_year, from_month_value, num_months = _month_range_validator(from_month, to_month)
+    if num_months > config.MAX_STREAM_MONTHS:
+        raise exceptions.InvalidDateFormat(f"Given range of {num_months} months exceeds the maximum of {config.MAX_STREAM_MONTHS} months")
+
+    return _iter_month_range_lines(from_year, from_month_value, num_months)
+
+
+def iter_month_range_matrices(from_month: str, to_month: str) -> Iterator[tuple[int, int, tuple[tuple[int, ...], ...]]]:
+    """Validates a range of months and returns a generator of date matrices for every month in the range
+
+    - Meant for bulk generation, so there is no limit on the length of the range and `month_cache` isn't touched
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s) or don't form a valid range
+
+    Returns:
+        Iterator[tuple[int, int, tuple[tuple[int, ...], ...]]]: Yields year, month (value of `MONTH`) and immutable date
+            matrix per month of the range
+    """
+    from_year, from_month_value, num_months = _month_range_validator(from_month, to_month)
+
+    return ((year, month, date_matrix) for year, month, (date_matrix, _) in _iter_month_range_entries(from_year, from_month_value, num_months))
+
+
+def iter_month_range_lines(from_month: str, to_month: str) -> Iterator[bytes]:
+    """Validates a range of months and returns a generator of NDJSON lines of date matrices for every month in the range
+
+    - Meant for bulk generation like `iter_month_range_matrices`, so unlike `stream_month_range_matrices` there is no
+      limit on the length of the range
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s) or don't form a valid range
+
+    Returns:
+        Iterator[bytes]: Yields `{"month": "YYYY-MM", "matrix": date_matrix}` json line per month of the range
+    """
+    from_year, from_month_value, num_months = _month_range_validator(from_month, to_month)
+
+    return _iter_month_range_lines(from_year, from_month_value, num_months)
+
+
+def _iter_month_range_lines(year: int, month: int, num_months: int) -> Iterator[bytes]:
+    """Yields NDJSON lines of date matrices for `num_months` consecutive months starting from `year`-`month`
+
+    - Interned json of every date matrix is embedded as is instead of serializing the matrix again
+
+    Args:
+        year (int): Year of the first month
+        month (int): First month (value of `MONTH`)
+        num_months (int): No. of months to yield
+
+    Yields:
+        Iterator[bytes]: `{"month": "YYYY-MM", "matrix": date_matrix}` json line per month
+    """
+    for year, month, (_, date_matrix_json) in _iter_month_range_entries(year, month, num_months):
+        yield b'{"month": "%04d-%02d", "matrix": %s}\n' % (year, month, date_matrix_json)
+
+
+def _iter_month_range_entries(year: int, month: int, num_months: int) -> Iterator[tuple[int, int, tuple[tuple[tuple[int, ...], ...], bytes]]]:
+    """Yields interned date matrices along with their json for `num_months` consecutive months starting from `year`-`month`
+
+    - Weekday of the beginning of a month is carried forward from the previous month instead of being recomputed
+
+    Args:
+        year (int): Year of the first month
+        month (int): First month (value of `MONTH`)
+        num_months (int): No. of months to yield
+
+    Yields:
+        Iterator[tuple[int, int, tuple[tuple[tuple[int, ...], ...], bytes]]]: Year, month (value of `MONTH`) and
+            immutable date matrix along with its json serialization per month
+    """
+    start_day, _, last_month_days = _month_signature(year, month)
+
+    for _ in range(num_months):
+        month_days = utils.get_actual_days_in_month(constants.MONTH._value2member_map_[month], year)
+        yield year, month, interned_month_entries.get((start_day, month_days, last_month_days)) or _compute_month_entry(year, month)
+
+        start_day = (start_day + month_days) % 7
+        last_month_days = month_days
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _bounded_month_range_validator(from_month: str, to_month: str) -> tuple[int, int, int]:
+    """Validates a range of months (both inclusive) that is buffered in a single response
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s), don't form a valid range or
+            the range exceeds `MAX_RANGE_MONTHS`
+
+    Returns:
+        tuple[int, int, int]: Year and month (value of `MONTH`) of the first month along with no. of months in the range
+    """
+    from_year, from_month_value, num_months = _month_range_validator(from_month, to_month)
+    if num_months > config.MAX_RANGE_MONTHS:
+        raise exceptions.InvalidDateFormat(f"Given range of {num_months} months exceeds the maximum of {config.MAX_RANGE_MONTHS} months")
 
-    # Validation on date passed by user
-    utils.date_validator(date, constants.PIVOT_DATE)
+    return from_year, from_month_value, num_months
 
-    date_obj = constants.Date(date)  # Convert into application specific Date object
-    date_obj.day = 1
-    diff_days_from_pivot_date = utils.num_days_between_dates(constants.PIVOT_DATE, date_obj)
-    curr_day = constants.DAY._value2member_map_[(constants.PIVOT_DAY.value + diff_days_from_pivot_date) % 7]
 
+def _iter_months(year: int, month: int, num_months: int) -> Iterator[tuple[int, int]]:
+    """Yields `num_months` consecutive months starting from `year`-`month`
+
+    Args:
+        year (int): Year of the first month
+        month (int): First month (value of `MONTH`)
+        num_months (int): No. of months to yield
+
+    Yields:
+        Iterator[tuple[int, int]]: Year and month (value of `MONTH`)
+    """
+    for _ in range(num_months):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _month_range_validator(from_month: str, to_month: str) -> tuple[int, int, int]:
+    """Validates a range of months (both inclusive)
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the range
+        to_month (str): Last month (Format: "YYYY-MM") of the range
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed months fail the validations test(s) or don't form a valid range
+
+    Returns:
+        tuple[int, int, int]: Year and month (value of `MONTH`) of the first month along with no. of months in the range
+    """
+    from_year, from_month_value = utils.month_validator(from_month, constants.PIVOT_DATE)
+    to_year, to_month_value = utils.month_validator(to_month, constants.PIVOT_DATE)
+
+    num_months = (to_year - from_year) * 12 + to_month_value - from_month_value + 1
+    if num_months <= 0:
+        raise exceptions.InvalidDateFormat(f"Given month: {from_month} should be less or equal to {to_month}")
+
+    return from_year, from_month_value, num_months
+
+
+def get_year_matrices(year: str) -> list[list[list]]:
+    """Computes the date matrices for all months of a given year
+
+    Args:
+        year (str): Year (Format: "YYYY") for which calendar is required
+
+    Returns:
+        list[list[list]]: Returns 12 date matrices (one per month in order) representing 7*6 calendars
+    """
+    logger.debug("Computing date matrices for year: %s", year)
+
+    # Validation on year passed by user
+    year_value = utils.year_validator(year, constants.PIVOT_DATE)
+
+    return _build_year_matrices(year_value)
+
+
+def get_year_body(year: str, media_type: str) -> bytes:
+    """Computes the date matrices for all months of a given year encoded in an alternate representation
+
+    Args:
+        year (str): Year (Format: "YYYY") for which calendar is required
+        media_type (str): Canonical media type (see `formats`) of the representation other than json
+
+    Returns:
+        bytes: Encoded 12 date matrices (one per month in order)
+    """
+    logger.debug("Encoding date matrices for year: %s as: %s", year, media_type)
+
+    # Validation on year passed by user
+    year_value = utils.year_validator(year, constants.PIVOT_DATE)
+
+    return _encode_months(((year_value, month.value) for month in constants.MONTH), media_type)
+
+
+def _encode_months(months: Iterable[tuple[int, int]], media_type: str) -> bytes:
+    """Encodes date matrices of already validated months in an alternate representation
+
+    Args:
+        months (Iterable[tuple[int, int]]): Year and month (value of `MONTH`) of every month in order
+        media_type (str): Canonical media type (see `formats`) of the representation other than json
+
+    Returns:
+        bytes: Encoded date matrices in order
+    """
+    return formats.encode_months(media_type, [(_get_cached_month_entry(year, month)[0], _month_signature(year, month)) for year, month in months])
+
+
+def warm_up(years_around: int) -> None:
+    """Precomputes date matrices along with their json for every month of current year +/- `years_around` years
+
+    - Meant to be called before accepting traffic, ideally before forking workers so that they share the table
+    - Precomputed months are kept in read-only `warm_month_entries` and never evicted
+
+    Args:
+        years_around (int): No. of years before and after the current year to precompute
+    """
+    current_year = time.gmtime().tm_year
+    first_month = max((current_year - years_around, constants.MONTH.JANUARY.value), (constants.PIVOT_DATE.year, constants.PIVOT_DATE.month))
+
+    start_time = time.perf_counter()
+    # Tracing enabled by the operator (like via `PYTHONTRACEMALLOC`) is left running
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    entries = {}
+    for year in range(first_month[0], current_year + years_around + 1):
+        for month in constants.MONTH:
+            if (year, month.value) >= first_month:
+                entries[(year, month.value)] = _compute_month_entry(year, month.value)
+    memory_used = tracemalloc.get_traced_memory()[0] - memory_before
+    if not already_tracing:
+        tracemalloc.stop()
+
+    global warm_month_entries
+    warm_month_entries = MappingProxyType(entries)
+    logger.info("Warmed up %s months in %.1f ms using %.1f KiB of memory", len(entries), (time.perf_counter() - start_time) * 1000, memory_used / 1024)
+
+
+def build_calendar_table() -> bytes:
+    """Builds the binary calendar table of every month of the 400 years cycle for `calendar_table.load_table`
+
+    Returns:
+        bytes: Binary calendar table
+    """
+    grid_indices: dict[bytes, int] = {}
+    month_entries = []
+    # Any year divisible by 400 begins the cycle, 2000 is used as it lies within the supported range of dates
+    start_year = 2000
+    start_day = utils.first_weekday_of_month(start_year, constants.MONTH.JANUARY.value)
+    last_month_days = utils.get_actual_days_in_month(constants.MONTH.DECEMBER, start_year - 1)
+    for year in range(start_year, start_year + calendar_table.CYCLE_YEARS):
+        for month in constants.MONTH:
+            month_days = utils.get_actual_days_in_month(month, year)
+            grid = bytes(date for row in _fill_date_matrix(start_day, month_days, last_month_days) for date in row)
+            month_entries.append((grid_indices.setdefault(grid, len(grid_indices)), start_day, month_days))
+
+            start_day = (start_day + month_days) % 7
+            last_month_days = month_days
+
+    return calendar_table.pack_table(month_entries, list(grid_indices))
+
+
+def _get_cached_month_entry(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> tuple[tuple[tuple[int, ...], ...], bytes]:
+    """Returns the date matrix along with its json for a month from cache, computing it on a miss
+
+    - Default layout keeps the `(year, month)` key, other layouts are cached under `(year, month, layout)`
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], bytes]: Immutable date matrix and its json serialization
+    """
+    if layout != constants.DEFAULT_LAYOUT:
+        return month_cache.get_or_compute((year, month, layout), lambda: _compute_month_entry(year, month, layout))
+
+    entry = warm_month_entries.get((year, month))
+    if entry is not None:
+        return entry
+
+    return month_cache.get_or_compute((year, month), lambda: _compute_month_entry(year, month))
+
+
+def _get_interned_month_body(year: int, month: int, media_type: str) -> bytes:
+    """Returns the interned alternate representation of the date matrix of a month, encoding it on first use
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        media_type (str): Canonical media type (see `formats`) of the representation other than json
+
+    Returns:
+        bytes: Encoded date matrix
+    """
+    month_signature = _month_signature(year, month)
+    body = interned_month_bodies.get((month_signature, media_type))
+    if body is None:
+        date_matrix, _ = _compute_month_entry(year, month)
+        body = interned_month_bodies.setdefault((month_signature, media_type), formats.encode_month(media_type, date_matrix, month_signature))
+
+    return body
+
+
+def _compute_month_entry(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> tuple[tuple[tuple[int, ...], ...], bytes]:
+    """Returns the interned date matrix along with its json for a month, building it on first use of its signature
+
+    - Default layout is read out of the calendar table when it is loaded, computing only when it isn't
+    - Layouts beginning weeks on another day reuse the interned date matrix of the signature rotated by the week start
+    - Trimmed rows and week numbers (which depend upon the year) are laid out on a copy of the interned date matrix
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], bytes]: Immutable date matrix and its json serialization
+    """
+    if layout == constants.DEFAULT_LAYOUT and calendar_table.loaded_table is not None:
+        return _table_month_entry(calendar_table.loaded_table.month_grid(year, month))
+
+    month_signature = _layout_month_signature(year, month, layout)
+    entry = interned_month_entries.get(month_signature)
+    if entry is None:
+        date_matrix = _fill_date_matrix(*month_signature)
+        logger.debug("Date matrix for month signature: %s is: %s", month_signature, date_matrix)
+        # `setdefault` so that threads racing on the same signature end up sharing a single entry
+        entry = interned_month_entries.setdefault(month_signature, (tuple(tuple(row) for row in date_matrix), json.dumps(date_matrix).encode()))
+
+    if layout.trim_rows:
+        # Rows up to the one holding the last day of the month
+        date_matrix = entry[0][: (month_signature[0] + month_signature[1] + 6) // 7]
+        entry = (date_matrix, json.dumps(date_matrix).encode())
+
+    if layout.week_numbers:
+        # Every row has exactly one Monday, whose ISO week is the week of the row
+        monday_ordinal = utils.to_ordinal(constants.Date(year, month, 1)) - month_signature[0] + (constants.DAY.MONDAY.value - layout.week_start) % 7
+        date_matrix = tuple((utils.iso_week_number(monday_ordinal + 7 * idx), *row) for idx, row in enumerate(entry[0]))
+        entry = (date_matrix, json.dumps(date_matrix).encode())
+
+    return entry
+
+
+def _table_month_entry(grid: bytes) -> tuple[tuple[tuple[int, ...], ...], bytes]:
+    """Returns the interned date matrix along with its json for a grid read out of the calendar table
+
+    Args:
+        grid (bytes): 42 dates of the date matrix in row major order, see `CalendarTable.month_grid`
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], bytes]: Immutable date matrix and its json serialization
+    """
+    entry = interned_grid_entries.get(grid)
+    if entry is None:
+        date_matrix = tuple(tuple(grid[idx : idx + 7]) for idx in range(0, calendar_table.GRID_SIZE, 7))
+        entry = interned_grid_entries.setdefault(grid, (date_matrix, json.dumps(date_matrix).encode()))
+
+    return entry
+
+
+def _layout_month_signature(year: int, month: int, layout: constants.Layout) -> tuple[int, int, int]:
+    """Returns the signature of a month as laid out in columns beginning on the week start of a layout
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+        layout (constants.Layout): Layout of the date matrix
+
+    Returns:
+        tuple[int, int, int]: Column of the first day of the month, no. of days in the month and in the previous month
+    """
+    start_day, month_days, last_month_days = _month_signature(year, month)
+
+    return (start_day - layout.week_start) % 7, month_days, last_month_days
+
+
+def _month_signature(year: int, month: int) -> tuple[int, int, int]:
+    """Returns the signature of a month which alone determines its date matrix
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`) for which calendar is required
+
+    Returns:
+        tuple[int, int, int]: Value of `DAY` on which the month begins, no. of days in the month and in the previous month
+    """
+    # Previous month of January is December of the previous year
+    last_month, last_month_year = (12, year - 1) if month == 1 else (month - 1, year)
+
+    if calendar_table.loaded_table is not None:
+        start_day, month_days = calendar_table.loaded_table.month_signature(year, month)
+        return start_day, month_days, calendar_table.loaded_table.month_signature(last_month_year, last_month)[1]
+
+    start_day = utils.first_weekday_of_month(year, month)
+    last_month_days = utils.get_actual_days_in_month(constants.MONTH._value2member_map_[last_month], last_month_year)
+    month_days = utils.get_actual_days_in_month(constants.MONTH._value2member_map_[month], year)
+
+    return start_day, month_days, last_month_days
+
+
+def _build_year_matrices(year: int) -> list[list[list]]:
+    """Builds the date matrices for all months of a year in a single pass
+
+    - Weekday of 1st January is computed once and start of every other month is derived from cumulative month lengths
+    - Whole 12*6*7 block is filled as a single NumPy array when NumPy is available
+
+    Args:
+        year (int): Year for which calendar is required
+
+    Returns:
+        list[list[list]]: Returns 12 date matrices (one per month in order) representing 7*6 calendars
+    """
+    month_days = [utils.get_actual_days_in_month(month, year) for month in constants.MONTH]
+    last_month_days = [31] + month_days[:-1]  # December of the previous year has 31 days
+    start_days = [utils.first_weekday_of_month(year, constants.MONTH.JANUARY.value)]
+    for days in month_days[:-1]:
+        start_days.append((start_days[-1] + days) % 7)
+
+    if np is None:
+        return [_fill_date_matrix(*month_signature) for month_signature in zip(start_days, month_days, last_month_days)]
+
+    cells = np.arange(6 * 7)
+    start_days, month_days, last_month_days = (np.array(values)[:, np.newaxis] for values in (start_days, month_days, last_month_days))
+    year_block = np.where(
+        cells < start_days,
+        last_month_days - start_days + cells + 1,
+        np.where(cells < start_days + month_days, cells - start_days + 1, cells - start_days - month_days + 1),
+    )
+
+    return year_block.reshape(12, 6, 7).tolist()
+
+
+def _fill_date_matrix(start_day: int, month_days: int, last_month_days: int) -> list[list]:
+    """Fills the date matrix of a month with dates of previous, current and next month
+
+    Args:
+        start_day (int): Value of `DAY` on which the month begins
+        month_days (int): No. of days in the month
+        last_month_days (int): No. of days in the previous month
+
+    Returns:
+        list[list]: Returns a list of list representing 7*6 calendar for the month
+    """
     #   S  M  T   W   T   F   S
-    date_matrix = [[0] * 7 for _ in range(6)]
-
-    # Fill the matrix
-    # Fill the previous month
-    idx = 0
-    jdx = curr_day.value - 1
-    last_month_date = utils.get_actual_days_in_month(constants.MONTH._value2member_map_[date_obj.month.value - 1], date_obj.year)
-    while jdx >= 0:
-        date_matrix[idx][jdx] = last_month_date
-        last_month_date -= 1
-        jdx -= 1
-
-    # Fill the current month
-    idx = 0
-    jdx = curr_day.value
-    this_month_date = utils.get_actual_days_in_month(date_obj.month, date_obj.year)
-    for day in range(1, this_month_date + 1):
-        date_matrix[idx][jdx] = day
-        jdx += 1
-        if jdx >= len(date_matrix[0]):
-            idx += 1
-            jdx = 0
-
-    # Fill the next month
-    next_month_date = 1
-    while idx < len(date_matrix):
-        date_matrix[idx][jdx] = next_month_date
-        next_month_date += 1
-        jdx += 1
-        if jdx >= len(date_matrix[0]):
-            idx += 1
-            jdx = 0
-
-    logger.info(f"Date matrix for date: {date_obj} is: {date_matrix}")
-    return date_matrix
+    cells = [*range(last_month_days - start_day + 1, last_month_days + 1), *range(1, month_days + 1), *range(1, 6 * 7 - start_day - month_days + 1)]
+
+    return [cells[idx : idx + 7] for idx in range(0, 6 * 7, 7)]
@@ -0,0 +1,106 @@
+# Server hooks of gunicorn, loaded via `--config=python:api.src.gunicorn_conf` by `scripts/run_api.py`
+
+import glob
+import os
+import shutil
+import tempfile
+
+# Aliased as gunicorn treats module level `config` as its own setting
+from api.src.config import config as app_config
+
+# Temporary metrics directory created by this master process, removed on exit
+_temp_metrics_dir: str | None = None
+
+
+def on_starting(server) -> None:
+    """Warms up caches in the master process before forking workers when the application is preloaded
+
+    - Prepares directory where workers flush their metrics, inherited by workers via `config`
+    - Workers share the warmed up pages copy-on-write and none of them serves its first requests cold
+    - Workers inherit the memory-mapped calendar table and share its pages
+
+    Args:
+        server (gunicorn.arbiter.Arbiter): Gunicorn master process
+    """
+    _prepare_metrics_dir()
+    if app_config.PRELOAD:
+        _warm_up()
+
+
+def post_worker_init(worker) -> None:
+    """Warms up caches in every worker before it accepts traffic when the application isn't preloaded
+
+    - Warming up in the master process would import application modules there and break `--reload`
+    - Starts flushing metrics of the worker in background, so that they show up even if it goes idle
+
+    Args:
+        worker (gunicorn.workers.base.Worker): Gunicorn worker process
+    """
+    from api.src import metrics
+
+    if not app_config.PRELOAD:
+        _warm_up()
+    metrics.start_flusher()
+
+
+def worker_exit(server, worker) -> None:
+    """Flushes metrics of an exiting worker, so that requests served since its last flush aren't lost
+
+    Args:
+        server (gunicorn.arbiter.Arbiter): Gunicorn master process
+        worker (gunicorn.workers.base.Worker): Exiting gunicorn worker process
+    """
+    from api.src import metrics
+
+    metrics.flush(force=True)
+
+
+def child_exit(server, worker) -> None:
+    """Marks metrics snapshot of an exited worker, so that its counters are kept but not its cache size gauges
+
+    - Runs in the master process even when the worker was killed without running `worker_exit`
+
+    Args:
+        server (gunicorn.arbiter.Arbiter): Gunicorn master process
+        worker (gunicorn.workers.base.Worker): Exited gunicorn worker process
+    """
+    if not app_config.METRICS_DIR:
+        return
+
+    # Prefix is duplicated from `metrics.EXITED_SNAPSHOT_PREFIX` to not import application modules in the master process
+    for snapshot_path in glob.glob(os.path.join(app_config.METRICS_DIR, f"{worker.pid}-*.json")):
+        os.replace(snapshot_path, os.path.join(app_config.METRICS_DIR, f"exited-{os.path.basename(snapshot_path)}"))
+
+
+def on_exit(server) -> None:
+    """Removes temporary metrics directory created by `on_starting`
+
+    Args:
+        server (gunicorn.arbiter.Arbiter): Gunicorn master process
+    """
+    if _temp_metrics_dir is not None:
+        shutil.rmtree(_temp_metrics_dir, ignore_errors=True)
+
+
+def _prepare_metrics_dir() -> None:
+    """Creates a temporary metrics directory if `METRICS_DIR` isn't configured else removes stale snapshots from it"""
+    global _temp_metrics_dir
+
+    if not app_config.METRICS_DIR:
+        _temp_metrics_dir = app_config.METRICS_DIR = tempfile.mkdtemp(prefix="calendar-python-metrics-")
+        return
+
+    os.makedirs(app_config.METRICS_DIR, exist_ok=True)
+    for snapshot_path in glob.glob(os.path.join(app_config.METRICS_DIR, "*.json")):
+        os.remove(snapshot_path)
+
+
+def _warm_up() -> None:
+    """Maps the calendar table, precomputes hot months and marks the application as ready to accept traffic"""
+    # Imported here as this module is loaded by the master process even when the application isn't preloaded
+    from api.src import calendar_table, get_date_matrix
+    from api.src.initializer import app_ready
+
+    calendar_table.load_table(app_config.CALENDAR_TABLE_PATH)
+    get_date_matrix.warm_up(app_config.WARMUP_YEARS)
+    app_ready.set()
@@ -0,0 +1,144 @@
+# Framework agnostic helpers of HTTP responses shared by the WSGI (Flask) and ASGI applications
+
+from urllib.parse import urlencode
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from api.src import constants, formats
+from api.src.config import config
+
+
+def month_etag(year: int, month: int, media_type: str = formats.JSON, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> str:
+    """Returns strong ETag of the calendar of a month
+
+    - Version prefix allows invalidating all cached calendars if representation of date matrix ever changes
+    - Every representation other than json and every layout other than the default gets its own suffix
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+        media_type (str, optional): Canonical media type (see `formats`) of the representation. Defaults to json.
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        str: Unquoted ETag of the month
+    """
+    layout_suffix = "" if layout.week_start == constants.DEFAULT_LAYOUT.week_start else f"-{constants.DAY(layout.week_start).name.lower()[:3]}"
+    if layout.week_numbers:
+        layout_suffix += "-wk"
+    if layout.trim_rows:
+        layout_suffix += "-trim"
+
+    return f"v1-{year:04d}-{month:02d}{layout_suffix}{formats.etag_suffix(media_type)}"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Checks whether `If-None-Match` header matches an ETag as per weak comparison of RFC 9110
+
+    - Weak comparison ignores the `W/` prefix, which proxies like nginx add to strong ETags of responses they compress
+
+    Args:
+        if_none_match (str | None): Value of `If-None-Match` header, None if the header isn't present
+        etag (str): Unquoted ETag of the resource
+
+    Returns:
+        bool: True if any entity tag of the header or `*` matches
+    """
+    if not if_none_match:
+        return False
+
+    for entity_tag in if_none_match.split(","):
+        entity_tag = entity_tag.strip()
+        if entity_tag == "*" or entity_tag.removeprefix("W/").strip('"') == etag:
+            return True
+
+    return False
+
+
+def month_path(year: int, month: int, layout: constants.Layout = constants.DEFAULT_LAYOUT) -> str:
+    """Returns path of the canonical resource of the calendar of a month
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+        layout (constants.Layout, optional): Layout of the date matrix. Defaults to `DEFAULT_LAYOUT`.
+
+    Returns:
+        str: Path of the canonical `/month/<yyyy>/<mm>` resource along with query parameters of the layout
+    """
+    query_string = layout_query_string(layout)
+
+    return f"/month/{year:04d}/{month:02d}" + (f"?{query_string}" if query_string else "")
+
+
+def is_canonical_month_request(year: str, month: str, query_string: str, year_value: int, month_value: int, layout: constants.Layout) -> bool:
+    """Checks whether a request of `/month/<year>/<month>` is for the canonical url of its month and layout
+
+    - Raw parts of the request are compared instead of its path so that the check holds under any script root
+
+    Args:
+        year (str): Year as given in the path
+        month (str): Month as given in the path
+        query_string (str): Query string of the request
+        year_value (int): Validated year
+        month_value (int): Validated month (value of `MONTH`)
+        layout (constants.Layout): Validated layout of the date matrix
+
+    Returns:
+        bool: True if the request needn't be redirected to `month_path`
+    """
+    return year == f"{year_value:04d}" and month == f"{month_value:02d}" and query_string == layout_query_string(layout)
+
+
+def layout_query_string(layout: constants.Layout) -> str:
+    """Returns canonical query string selecting a layout, so that every layout is cached under a single url
+
+    Args:
+        layout (constants.Layout): Layout of the date matrix
+
+    Returns:
+        str: Encoded `layout_query_args`, empty for `DEFAULT_LAYOUT`
+    """
+    return urlencode(layout_query_args(layout))
+
+
+def layout_query_args(layout: constants.Layout) -> dict[str, str]:
+    """Returns query parameters selecting a layout, inverse of `utils.layout_validator`
+
+    Args:
+        layout (constants.Layout): Layout of the date matrix
+
+    Returns:
+        dict[str, str]: Query parameters of only the parts differing from `DEFAULT_LAYOUT`
+    """
+    layout_args = {}
+    if layout.week_start != constants.DEFAULT_LAYOUT.week_start:
+        layout_args["week_start"] = constants.DAY(layout.week_start).name.lower()
+    if layout.week_numbers:
+        layout_args["week_numbers"] = "true"
+    if layout.trim_rows:
+        layout_args["trim_rows"] = "true"
+
+    return layout_args
+
+
+def negotiated_media_type(accept: str | None) -> str:
+    """Returns representation of date matrices negotiated via `Accept` header
+
+    Args:
+        accept (str | None): Value of `Accept` header, None if the header isn't present
+
+    Returns:
+        str: Canonical media type (see `formats`), json if client doesn't accept any other representation
+    """
+    return formats.canonical_media_type(parse_accept_header(accept, MIMEAccept).best_match(formats.MEDIA_TYPES, default=formats.JSON))
+
+
+def immutable_cache_control() -> str:
+    """Returns value of Cache-Control header for immutable responses like calendar of a month
+
+    Returns:
+        str: Value of Cache-Control header
+    """
+    return f"public, max-age={config.HTTP_CACHE_MAX_AGE}, immutable"
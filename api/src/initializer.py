@@ -2,6 +2,7 @@
 # connection etc. It also helps in avoiding circular dependencies in the code
 
 import logging
+import threading
 
 from flask import Flask
 
@@ -12,3 +13,7 @@ logger = logging.getLogger(__name__)
 # ----------------------------------------------------------
 # Flask application setup
 flask_app = Flask(__name__)
+
+# ----------------------------------------------------------
+# Readiness of the application to accept traffic, set once caches are warmed up
+app_ready = threading.Event()
@@ -0,0 +1,264 @@
+# Per-request latency histograms, status counts and stage timings exposed in Prometheus text exposition format
+#
+# Every process records into its own in-memory registry. Gunicorn workers additionally flush snapshots of their
+# registry to `<METRICS_DIR>/<pid>-<nonce>.json` (prepared by gunicorn master process, see `gunicorn_conf`), so that
+# whichever worker serves `/metrics` aggregates all of them. A background thread of every worker flushes unflushed
+# metrics, so snapshots of other live workers lag by at most `METRICS_FLUSH_INTERVAL` seconds even when they are idle,
+# and workers flush once more on exit. Snapshots of exited workers are renamed to `exited-<pid>-<nonce>.json` by the
+# master process and kept so that counters never go backwards, while their cache size gauges are left out. The nonce
+# keeps a recycled pid from overwriting the snapshot of an earlier worker.
+
+import bisect
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from api.src import get_date_matrix
+from api.src.config import config
+from api.src.initializer import logger
+
+# Upper bounds (in seconds) of latency buckets
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_lock = threading.Lock()
+_request_counts: dict[str, dict[str, int]] = {}  # route -> status -> count
+_request_latencies: dict[str, dict] = {}  # route -> histogram
+_stage_latencies: dict[str, dict] = {}  # stage -> histogram
+_last_flush = 0.0
+_dirty = False  # Whether metrics were recorded since the last flush
+_snapshot_name: tuple[int, str] | None = None  # pid -> file name of the snapshot of this process
+
+# Prefix of file names of snapshots of exited processes, see `gunicorn_conf.child_exit`
+EXITED_SNAPSHOT_PREFIX = "exited-"
+# Month cache stats that are point-in-time values of live processes rather than counters
+_GAUGES = ("size", "max_size")
+
+
+def observe_request(route: str, status: int, duration: float) -> None:
+    """Records a served request
+
+    Args:
+        route (str): Url rule of the route (like `/date/<date>`) serving the request
+        status (int): Status code of the response
+        duration (float): Latency in seconds
+    """
+    global _dirty
+
+    with _lock:
+        _dirty = True
+        status_counts = _request_counts.setdefault(route, {})
+        status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+        _observe(_request_latencies, route, duration)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Context manager recording time taken by a stage of serving a request like validation or serialization
+
+    Args:
+        stage (str): Name of the stage
+
+    Yields:
+        Iterator[None]: Nothing
+    """
+    global _dirty
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start_time
+        with _lock:
+            _dirty = True
+            _observe(_stage_latencies, stage, duration)
+
+
+def flush(force: bool = False) -> None:
+    """Writes snapshot of this process with unflushed metrics to `METRICS_DIR`, at most once per `METRICS_FLUSH_INTERVAL` seconds
+
+    - Does nothing when `METRICS_DIR` isn't set i.e. when serving from a single process
+
+    Args:
+        force (bool, optional): Writes irrespective of unflushed metrics and the time since last write. Defaults to
+            False.
+    """
+    global _dirty, _last_flush
+
+    if not config.METRICS_DIR or (not force and (not _dirty or time.monotonic() - _last_flush < config.METRICS_FLUSH_INTERVAL)):
+        return
+    _last_flush = time.monotonic()
+    with _lock:
+        _dirty = False
+
+    snapshot_path = _snapshot_path()
+    temp_path = f"{snapshot_path}.tmp"
+    try:
+        with open(temp_path, "w") as snapshot_file:
+            json.dump(_snapshot(), snapshot_file)
+        # Atomic rename so that readers never see a partial snapshot
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        logger.exception("Failed to write metrics snapshot: %s", snapshot_path)
+
+
+def start_flusher() -> threading.Thread:
+    """Starts daemon thread flushing unflushed metrics of this process every `METRICS_FLUSH_INTERVAL` seconds
+
+    - Requests only flush when they end, so without it metrics of a worker going idle after a burst would never show
+
+    Returns:
+        threading.Thread: Started thread
+    """
+    flusher = threading.Thread(target=_flush_periodically, name="metrics-flusher", daemon=True)
+    flusher.start()
+
+    return flusher
+
+
+def render() -> str:
+    """Renders metrics aggregated across all processes in Prometheus text exposition format
+
+    Returns:
+        str: Metrics in text exposition format
+    """
+    snapshots = [_snapshot()]
+    if config.METRICS_DIR:
+        own_snapshot_path = _snapshot_path()
+        for snapshot_path in glob.glob(os.path.join(config.METRICS_DIR, "*.json")):
+            if snapshot_path == own_snapshot_path:
+                continue
+            try:
+                with open(snapshot_path) as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+            except (OSError, ValueError):
+                logger.warning("Skipping unreadable metrics snapshot: %s", snapshot_path)
+                continue
+            if os.path.basename(snapshot_path).startswith(EXITED_SNAPSHOT_PREFIX):
+                snapshot["month_cache"] = {name: value for name, value in snapshot["month_cache"].items() if name not in _GAUGES}
+            snapshots.append(snapshot)
+
+    aggregate = _merge(snapshots)
+
+    lines = ["# HELP calendar_http_requests_total Requests served per route and status code", "# TYPE calendar_http_requests_total counter"]
+    for route, status_counts in sorted(aggregate["requests"].items()):
+        for status, count in sorted(status_counts.items()):
+            lines.append(f'calendar_http_requests_total{{route="{route}",status="{status}"}} {count}')
+    lines += _render_histograms("calendar_http_request_duration_seconds", "Latency of requests per route", "route", aggregate["latencies"])
+    lines += _render_histograms("calendar_stage_duration_seconds", "Time taken per stage of serving a request", "stage", aggregate["stages"])
+    for name, value in sorted(aggregate["month_cache"].items()):
+        kind = "gauge" if name in _GAUGES else "counter"
+        metric = f"calendar_month_cache_{name}" if kind == "gauge" else f"calendar_month_cache_{name}_total"
+        lines += [f"# HELP {metric} Month matrix cache {name.replace('_', ' ')} summed across processes", f"# TYPE {metric} {kind}", f"{metric} {value}"]
+
+    return "\n".join(lines) + "\n"
+
+
+def _flush_periodically() -> None:
+    """Flushes unflushed metrics of this process every `METRICS_FLUSH_INTERVAL` seconds, target of `start_flusher`"""
+    while True:
+        time.sleep(config.METRICS_FLUSH_INTERVAL)
+        if _dirty:
+            flush(force=True)
+
+
+def _snapshot_path() -> str:
+    """Returns path of the snapshot of this process, unique even across processes recycling a pid
+
+    Returns:
+        str: Path of the snapshot under `METRICS_DIR`
+    """
+    global _snapshot_name
+
+    # Name is generated per pid, so that a worker forked after the master process used it gets a name of its own
+    if _snapshot_name is None or _snapshot_name[0] != os.getpid():
+        _snapshot_name = (os.getpid(), f"{os.getpid()}-{uuid.uuid4().hex}.json")
+
+    return os.path.join(config.METRICS_DIR, _snapshot_name[1])
+
+
+def _observe(histograms: dict[str, dict], label: str, duration: float) -> None:
+    """Records a duration into the histogram of `label`, caller must hold `_lock`
+
+    Args:
+        histograms (dict[str, dict]): Histograms per label
+        label (str): Label of the histogram
+        duration (float): Duration in seconds
+    """
+    histogram = histograms.get(label)
+    if histogram is None:
+        histogram = histograms[label] = {"buckets": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0}
+
+    histogram["buckets"][bisect.bisect_left(BUCKETS, duration)] += 1
+    histogram["sum"] += duration
+    histogram["count"] += 1
+
+
+def _snapshot() -> dict:
+    """Returns json serializable snapshot of metrics of this process
+
+    Returns:
+        dict: Snapshot of metrics
+    """
+    with _lock:
+        return {
+            "requests": {route: dict(status_counts) for route, status_counts in _request_counts.items()},
+            "latencies": {route: {**histogram, "buckets": list(histogram["buckets"])} for route, histogram in _request_latencies.items()},
+            "stages": {stage: {**histogram, "buckets": list(histogram["buckets"])} for stage, histogram in _stage_latencies.items()},
+            "month_cache": get_date_matrix.month_cache.stats(),
+        }
+
+
+def _merge(snapshots: list[dict]) -> dict:
+    """Sums snapshots of several processes
+
+    Args:
+        snapshots (list[dict]): Snapshots of metrics
+
+    Returns:
+        dict: Aggregated snapshot
+    """
+    aggregate: dict = {"requests": {}, "latencies": {}, "stages": {}, "month_cache": {}}
+    for snapshot in snapshots:
+        for route, status_counts in snapshot["requests"].items():
+            aggregate_counts = aggregate["requests"].setdefault(route, {})
+            for status, count in status_counts.items():
+                aggregate_counts[status] = aggregate_counts.get(status, 0) + count
+        for key in ("latencies", "stages"):
+            for label, histogram in snapshot[key].items():
+                aggregate_histogram = aggregate[key].setdefault(label, {"buckets": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0})
+                aggregate_histogram["buckets"] = [total + count for total, count in zip(aggregate_histogram["buckets"], histogram["buckets"])]
+                aggregate_histogram["sum"] += histogram["sum"]
+                aggregate_histogram["count"] += histogram["count"]
+        for name, value in snapshot["month_cache"].items():
+            aggregate["month_cache"][name] = aggregate["month_cache"].get(name, 0) + value
+
+    return aggregate
+
+
+def _render_histograms(metric: str, description: str, label_name: str, histograms: dict[str, dict]) -> list[str]:
+    """Renders histograms in text exposition format with cumulative buckets
+
+    Args:
+        metric (str): Name of the metric
+        description (str): Help text of the metric
+        label_name (str): Name of the label distinguishing histograms
+        histograms (dict[str, dict]): Histograms per label
+
+    Returns:
+        list[str]: Lines of text exposition format
+    """
+    lines = [f"# HELP {metric} {description}", f"# TYPE {metric} histogram"]
+    for label, histogram in sorted(histograms.items()):
+        cumulative_count = 0
+        for upper_bound, count in zip((*(str(bound) for bound in BUCKETS), "+Inf"), histogram["buckets"]):
+            cumulative_count += count
+            lines.append(f'{metric}_bucket{{{label_name}="{label}",le="{upper_bound}"}} {cumulative_count}')
+        lines.append(f'{metric}_sum{{{label_name}="{label}"}} {histogram["sum"]}')
+        lines.append(f'{metric}_count{{{label_name}="{label}"}} {histogram["count"]}')
+
+    return lines
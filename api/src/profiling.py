@@ -0,0 +1,100 @@
+# Opt-in cProfile capture of requests for investigating latency spikes, see `PROFILING_ENABLED` in `config`
+#
+# A fraction (`PROFILE_SAMPLE_RATE`) of requests is profiled and the profile is kept only if the request took at least
+# `PROFILE_SLOW_THRESHOLD` seconds. Kept profiles are dumped as `.prof` files into `PROFILE_DIR`, shared by all
+# workers, which holds at most `PROFILE_MAX_FILES` of the latest ones. They can be inspected with `pstats`/`snakeviz`
+# or aggregated via `top_functions`.
+
+import cProfile
+import glob
+import os
+import pstats
+import random
+import re
+import time
+
+from api.src.config import config
+from api.src.initializer import logger
+
+
+def start() -> cProfile.Profile | None:
+    """Starts profiling the current request if profiling is enabled and the request is sampled
+
+    Returns:
+        cProfile.Profile | None: Running profiler or None if the request isn't profiled
+    """
+    if not config.PROFILING_ENABLED or random.random() >= config.PROFILE_SAMPLE_RATE:
+        return None
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # Another profiler is already active e.g. in another thread on Python 3.12+
+        return None
+
+    return profiler
+
+
+def stop(profiler: cProfile.Profile, route: str, duration: float) -> None:
+    """Stops a profiler and dumps its profile if the request was slow enough
+
+    Args:
+        profiler (cProfile.Profile): Profiler returned by `start`
+        route (str): Url rule of the route (like `/date/<date>`) serving the request
+        duration (float): Latency of the request in seconds
+    """
+    profiler.disable()
+    if duration < config.PROFILE_SLOW_THRESHOLD:
+        return
+
+    os.makedirs(config.PROFILE_DIR, exist_ok=True)
+    route_name = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+    profile_path = os.path.join(config.PROFILE_DIR, f"{time.time_ns()}-{os.getpid()}-{route_name}-{duration * 1000:.1f}ms.prof")
+    profiler.dump_stats(profile_path)
+    logger.info("Dumped profile of request taking %.1f ms to: %s", duration * 1000, profile_path)
+
+    _prune_profiles()
+
+
+def top_functions(limit: int, sort_key: str = "cumulative") -> dict:
+    """Aggregates all captured profiles and returns the top functions
+
+    Args:
+        limit (int): No. of functions to return
+        sort_key (str, optional): One of "cumulative" or "tottime". Defaults to "cumulative".
+
+    Raises:
+        ValueError: If `sort_key` isn't supported
+
+    Returns:
+        dict: No. of aggregated profiles along with calls, own time and cumulative time (in seconds) of top functions
+    """
+    if sort_key not in ("cumulative", "tottime"):
+        raise ValueError(f"Sort key: {sort_key} isn't one of ['cumulative', 'tottime']")
+
+    profile_paths = sorted(glob.glob(os.path.join(config.PROFILE_DIR, "*.prof")))
+    if not profile_paths:
+        return {"profiles": 0, "functions": []}
+
+    stats = pstats.Stats(*profile_paths)
+    value_idx = 3 if sort_key == "cumulative" else 2
+    top_stats = sorted(stats.stats.items(), key=lambda item: item[1][value_idx], reverse=True)[:limit]  # type: ignore[attr-defined]
+
+    return {
+        "profiles": len(profile_paths),
+        "functions": [
+            {"function": f"{file_name}:{line_no}({func_name})", "calls": num_calls, "tottime": total_time, "cumtime": cumulative_time}
+            for (file_name, line_no, func_name), (_, num_calls, total_time, cumulative_time, _) in top_stats
+        ],
+    }
+
+
+def _prune_profiles() -> None:
+    """Removes oldest profiles beyond `PROFILE_MAX_FILES`"""
+    # File names begin with the capture time in nanoseconds, so sorting them sorts by age
+    profile_paths = sorted(glob.glob(os.path.join(config.PROFILE_DIR, "*.prof")))
+    for profile_path in profile_paths[: max(0, len(profile_paths) - config.PROFILE_MAX_FILES)]:
+        try:
+            os.remove(profile_path)
+        except FileNotFoundError:  # Already pruned by another worker
+            pass
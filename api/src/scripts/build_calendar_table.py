@@ -0,0 +1,34 @@
+# Builds the binary calendar table memory-mapped by the application while serving
+#
+# Usage:
+#   python api/src/scripts/build_calendar_table.py [--output path]
+
+import argparse
+import os
+
+from api.src import get_date_matrix
+from api.src.config import config
+
+
+def write_calendar_table(path: str) -> None:
+    """Builds the calendar table and atomically writes it to `path`
+
+    - Written to a temporary file first and then renamed so that a running server never maps a partial table
+
+    Args:
+        path (str): Path of the binary table
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as table_file:
+        table_file.write(get_date_matrix.build_calendar_table())
+    os.replace(temp_path, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the binary calendar table of every month of the 400 years cycle")
+    parser.add_argument("--output", default=config.CALENDAR_TABLE_PATH, help="Path of the binary table")
+    args = parser.parse_args()
+
+    write_calendar_table(args.output)
+    print(f"Calendar table written to: {args.output} ({os.path.getsize(args.output)} bytes)")
@@ -0,0 +1,137 @@
+# Bulk export of calendars of every month in a range of years for offline generation like printed or static-site calendars
+#
+# Usage:
+#   python api/src/scripts/export_calendars.py --output calendars.jsonl [--from-year 1752] [--to-year 9999]
+#       [--format jsonl|csv|bin] [--workers N] [--chunk-years 50]
+#
+# Formats:
+#   jsonl: `{"month": "YYYY-MM", "matrix": date_matrix}` line per month, same as `/stream`
+#   csv:   `month,d1,...,d42` header followed by a row of month and its 42 dates in row major order per month
+#   bin:   42 bytes of dates in row major order per month, concatenated from the first month, same as `/range` with
+#          `Accept: application/octet-stream`
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from api.src import constants, get_date_matrix
+
+OUTPUT_FORMATS = ("jsonl", "csv", "bin")
+
+
+def export_chunk(from_month: str, to_month: str, output_format: str) -> bytes:
+    """Encodes calendars of every month between two months (both inclusive), run in a worker process
+
+    Args:
+        from_month (str): First month (Format: "YYYY-MM") of the chunk
+        to_month (str): Last month (Format: "YYYY-MM") of the chunk
+        output_format (str): One of `OUTPUT_FORMATS`
+
+    Raises:
+        ValueError: If `output_format` isn't supported
+
+    Returns:
+        bytes: Encoded calendars in order
+    """
+    if output_format == "jsonl":
+        return b"".join(get_date_matrix.iter_month_range_lines(from_month, to_month))
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Output format: {output_format} isn't one of {list(OUTPUT_FORMATS)}")
+
+    # Date matrices are interned per month signature, so each of the few dozen distinct ones is encoded only once
+    encoded_matrices: dict[int, bytes] = {}
+    chunk = []
+    for year, month, date_matrix in get_date_matrix.iter_month_range_matrices(from_month, to_month):
+        encoded_matrix = encoded_matrices.get(id(date_matrix))
+        if encoded_matrix is None:
+            dates = [date for row in date_matrix for date in row]
+            encoded_matrix = encoded_matrices[id(date_matrix)] = ",".join(map(str, dates)).encode() if output_format == "csv" else bytes(dates)
+        chunk.append(b"%04d-%02d,%s\n" % (year, month, encoded_matrix) if output_format == "csv" else encoded_matrix)
+
+    return b"".join(chunk)
+
+
+def chunk_ranges(from_year: int, to_year: int, chunk_years: int) -> list[tuple[str, str]]:
+    """Splits a range of years into ranges of months of at most `chunk_years` years each
+
+    - Range begins no earlier than month of `constants.PIVOT_DATE`
+
+    Args:
+        from_year (int): First year of the range
+        to_year (int): Last year of the range
+        chunk_years (int): Maximum no. of years per chunk
+
+    Returns:
+        list[tuple[str, str]]: First and last month (Format: "YYYY-MM") of every chunk in order
+    """
+    chunks = []
+    for chunk_from_year in range(from_year, to_year + 1, chunk_years):
+        first_month = max((chunk_from_year, 1), (constants.PIVOT_DATE.year, constants.PIVOT_DATE.month))
+        chunks.append((f"{first_month[0]}-{first_month[1]:02d}", f"{min(chunk_from_year + chunk_years - 1, to_year)}-12"))
+
+    return chunks
+
+
+def export(output_path: str, from_year: int, to_year: int, output_format: str, workers: int, chunk_years: int) -> int:
+    """Exports calendars of every month of a range of years to a file, encoding chunks of years in parallel processes
+
+    - Chunks are written in order as soon as they and all chunks before them are done
+    - At most `2 * workers` chunks are submitted ahead of the one being written, so memory stays bounded by the chunks
+      in flight however many chunks the range has
+
+    Args:
+        output_path (str): Path of the output file
+        from_year (int): First year of the range
+        to_year (int): Last year of the range
+        output_format (str): One of `OUTPUT_FORMATS`
+        workers (int): No. of worker processes
+        chunk_years (int): No. of years encoded per task
+
+    Returns:
+        int: No. of exported months
+    """
+    chunks = chunk_ranges(from_year, to_year, chunk_years)
+    with open(output_path, "wb") as output_file, ProcessPoolExecutor(max_workers=workers) as executor:
+        if output_format == "csv":
+            output_file.write(("month," + ",".join(f"d{idx}" for idx in range(1, 6 * 7 + 1)) + "\n").encode())
+
+        pending_chunks = iter(chunks)
+        futures = deque(
+            executor.submit(export_chunk, chunk_from_month, chunk_to_month, output_format)
+            for chunk_from_month, chunk_to_month in islice(pending_chunks, 2 * workers)
+        )
+        while futures:
+            output_file.write(futures.popleft().result())
+            for chunk_from_month, chunk_to_month in islice(pending_chunks, 1):
+                futures.append(executor.submit(export_chunk, chunk_from_month, chunk_to_month, output_format))
+
+    first_year, first_month = (int(value) for value in chunks[0][0].split("-"))
+    return (to_year - first_year) * 12 + 12 - first_month + 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export calendars of every month in a range of years")
+    parser.add_argument("--output", required=True, help="Path of the output file")
+    parser.add_argument("--from-year", type=int, default=constants.PIVOT_DATE.year, help="First year of the range")
+    parser.add_argument("--to-year", type=int, default=9999, help="Last year of the range")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="jsonl", help="Output format")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="No. of worker processes")
+    parser.add_argument("--chunk-years", type=int, default=50, help="No. of years encoded per task")
+    args = parser.parse_args()
+
+    if args.from_year < constants.PIVOT_DATE.year or args.to_year < args.from_year or args.workers < 1 or args.chunk_years < 1:
+        parser.error(f"Expected {constants.PIVOT_DATE.year} <= from-year <= to-year and positive workers and chunk-years")
+
+    start_time = time.perf_counter()
+    exported_months = export(args.output, args.from_year, args.to_year, args.format, args.workers, args.chunk_years)
+    elapsed_time = time.perf_counter() - start_time
+    print(
+        f"Exported {exported_months} months to: {args.output} in {elapsed_time:.2f} s ({exported_months / elapsed_time:.0f} months/sec) "
+        f"using {args.workers} workers",
+        file=sys.stderr,
+    )
@@ -1,12 +1,61 @@
+import importlib.util
 import os
 
 from api.src.config import config
+from api.src.scripts import build_calendar_table
 
-if config.ENV in [
-    "production",
-]:
-    print("Starting the application server")
-    os.system("gunicorn --workers=4 --bind=0.0.0.0:8000 api.src.api:flask_app")
-else:
-    print("Starting the application server")
-    os.system("gunicorn --workers=4 --bind=0.0.0.0:8000 api.src.api:flask_app --reload")
+# Worker classes of gunicorn supported for WSGI application
+_WSGI_WORKER_CLASSES = {"sync", "gthread", "gevent"}
+# Worker classes needing a package of their own, see `requirements.txt`
+_WORKER_CLASS_PACKAGES = {"gevent": "gevent"}
+
+
+def gunicorn_args() -> list[str]:
+    """Builds command line arguments of gunicorn from serving parameters of the current config
+
+    Raises:
+        ValueError: If the configured worker class isn't supported or its package isn't installed
+
+    Returns:
+        list[str]: Command line arguments including the program name
+    """
+    if config.SERVER == "asgi":
+        app, worker_class = "api.src.asgi:asgi_app", "uvicorn.workers.UvicornWorker"
+    elif config.WORKER_CLASS in _WSGI_WORKER_CLASSES:
+        app, worker_class = "api.src.api:flask_app", config.WORKER_CLASS
+    else:
+        raise ValueError(f"Worker class: {config.WORKER_CLASS} isn't one of {sorted(_WSGI_WORKER_CLASSES)}")
+
+    # Checked upfront as gunicorn would only fail after booting, once every worker fails to load its class
+    package = _WORKER_CLASS_PACKAGES.get(worker_class)
+    if package is not None and importlib.util.find_spec(package) is None:
+        raise ValueError(f"Worker class: {worker_class} needs package: {package}, install it via `pip install -r requirements.txt`")
+
+    args = [
+        "gunicorn",
+        "--config=python:api.src.gunicorn_conf",
+        f"--bind={config.BIND}",
+        f"--workers={config.WORKERS}",
+        f"--worker-class={worker_class}",
+        f"--threads={config.THREADS}",
+        f"--keep-alive={config.KEEP_ALIVE}",
+        f"--backlog={config.BACKLOG}",
+    ]
+    if config.PRELOAD:
+        args.append("--preload")
+    if config.RELOAD:
+        args.append("--reload")
+    args.append(app)
+
+    return args
+
+
+if __name__ == "__main__":
+    # Source directory may be mounted over the image (see `docker-compose.yml`) hiding the table built along with it
+    if not os.path.exists(config.CALENDAR_TABLE_PATH):
+        build_calendar_table.write_calendar_table(config.CALENDAR_TABLE_PATH)
+
+    args = gunicorn_args()
+    print(f"Starting the application server in {config.ENV} environment: {' '.join(args)}")
+    # Replace this process by gunicorn so that it directly receives signals from the container runtime
+    os.execvp(args[0], args)
@@ -1 +1 @@
-python api/src/scripts/run_api.py
+exec python api/src/scripts/run_api.py
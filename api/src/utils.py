@@ -13,22 +13,8 @@ def is_leap_year(year: int) -> bool:
     Returns:
         bool: Boolean flag as `True` if given `year` is a leap year else `False`
     """
-    logger.debug(f"Checking year: {year} for leap year")
-
-    is_leap_year = False
-    if year % 4 == 0:
-        if year % 100 == 0:
-            if year % 400 == 0:
-                return True
-            else:
-                is_leap_year = False
-        else:
-            is_leap_year = True
-    else:
-        is_leap_year = False
-
-    logger.debug(f"Leap year check: {year}: {is_leap_year}")
-    return is_leap_year
+    # Called for every date on the hot path and hence intentionally doesn't log
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
 def count_leap_years(date: constants.Date) -> int:
@@ -42,19 +28,19 @@ def count_leap_years(date: constants.Date) -> int:
     Returns:
         int: No. of leap years passed until the `date`
     """
-    logger.debug(f"Counting no. of leap years until date: {date}")
+    logger.debug("Counting no. of leap years until date: %s", date)
 
     num_leap_years_until_date = 0
     year = date.year
 
-    if date.month.value <= 2:
+    if date.month <= 2:
         year -= 1
 
     num_leap_years_until_date = year // 4
     num_leap_years_until_date -= year // 100
     num_leap_years_until_date += year // 400
 
-    logger.debug(f"No. of leap years until date: {date}: {num_leap_years_until_date}")
+    logger.debug("No. of leap years until date: %s: %s", date, num_leap_years_until_date)
     return num_leap_years_until_date
 
 
@@ -67,7 +53,7 @@ def get_default_days_in_month(month: Enum) -> int:
     Returns:
         int: No. of days in given month `month`
     """
-    logger.debug(f"Getting default days for month: {month}")
+    logger.debug("Getting default days for month: %s", month)
 
     if month in constants.MONTHS_WITH_31_DAYS:
         return 31
@@ -89,7 +75,7 @@ def get_actual_days_in_month(month: Enum, year: int) -> int:
     Returns:
         int: No. of days in given month `month`
     """
-    logger.debug(f"Getting actual days for month: {month} for year: {year}")
+    logger.debug("Getting actual days for month: %s for year: %s", month, year)
 
     if month is constants.MONTH.FEBRUARY:
         if is_leap_year(year):
@@ -103,7 +89,7 @@ def get_actual_days_in_month(month: Enum, year: int) -> int:
 def num_days_between_dates(base_date: constants.Date, actual_date: constants.Date) -> int:
     """Returns difference of days between two dates
 
-    - Makes use of `getDefaultDaysInMonth`, `countLeapYears`
+    - Makes use of `day_ordinal`, so unlike `days_between` days beyond their month roll over into the next one
 
     Args:
         base_date (constants.Date): Base date from which difference needs to be calculated
@@ -112,84 +98,324 @@ def num_days_between_dates(base_date: constants.Date, actual_date: constants.Dat
     Returns:
         int: Difference of days between `total_days_actual_date` `total_days_base_date`
     """
-    logger.debug(f"Counting diff of days between: {base_date} and {actual_date}")
+    logger.debug("Counting diff of days between: %s and %s", base_date, actual_date)
+
+    diff_days = day_ordinal(*actual_date) - day_ordinal(*base_date)
+    logger.debug("Diff of days between: %s and %s = %s", base_date, actual_date, diff_days)
+
+    return diff_days
+
+
+def day_ordinal(year: int, month: int, day: int) -> int:
+    """Returns ordinal of a date in proleptic Gregorian calendar in constant time where 0001-01-01 is day 1
+
+    Args:
+        year (int): Year of the date
+        month (int): Month (value of `MONTH`) of the date
+        day (int): Day of the date
+
+    Returns:
+        int: No. of days since beginning until the date
+    """
+    previous_year = year - 1
+    ordinal = previous_year * 365 + previous_year // 4 - previous_year // 100 + previous_year // 400
+    ordinal += constants.DAYS_BEFORE_MONTH[month] + day
+    if month > 2 and is_leap_year(year):
+        ordinal += 1
+
+    return ordinal
+
+
+def to_ordinal(date: constants.Date) -> int:
+    """Returns ordinal of a date in constant time where 0001-01-01 is day 1, same as `datetime.date.toordinal`
+
+    Args:
+        date (constants.Date): Date whose ordinal is required
+
+    Raises:
+        exceptions.InvalidDateFormat: If month or day of `date` doesn't exist, instead of rolling over into another date
+
+    Returns:
+        int: Ordinal of the date
+    """
+    year, month, day = date
+    if month < 1 or month > 12 or day < 1 or day > constants.DAYS_IN_MONTH[month] + (month == 2 and is_leap_year(year)):
+        raise exceptions.InvalidDateFormat(f"Given date: {date} doesn't exist")
+
+    return day_ordinal(year, month, day)
+
+
+def from_ordinal(ordinal: int) -> constants.Date:
+    """Returns date of an ordinal in constant time, inverse of `to_ordinal`
+
+    - Whole 400, 100, 4 and 1 year cycles are divided out of the ordinal, leaving the day of the year
+
+    Args:
+        ordinal (int): Ordinal of the date where 0001-01-01 is day 1
+
+    Returns:
+        constants.Date: Date of the ordinal
+    """
+    num_400_years, day_of_year = divmod(ordinal - 1, constants.DAYS_IN_400_YEARS)
+    num_100_years, day_of_year = divmod(day_of_year, constants.DAYS_IN_100_YEARS)
+    num_4_years, day_of_year = divmod(day_of_year, constants.DAYS_IN_4_YEARS)
+    num_years, day_of_year = divmod(day_of_year, 365)
+    year = num_400_years * 400 + num_100_years * 100 + num_4_years * 4 + num_years + 1
+
+    # Last day of a 4 or 400 year cycle is the leap day of the 366 days long year before
+    if num_years == 4 or num_100_years == 4:
+        return constants.Date(year - 1, 12, 31)
+
+    leap_day = num_years == 3 and (num_4_years != 24 or num_100_years == 3)
+    # Months are 28 to 31 days long, so the estimate is the month or the one after it
+    month = (day_of_year + 50) >> 5
+    days_before_month = constants.DAYS_BEFORE_MONTH[month] + (month > 2 and leap_day)
+    if days_before_month > day_of_year:
+        month -= 1
+        days_before_month -= constants.DAYS_IN_MONTH[month] + (month == 2 and leap_day)
+
+    return constants.Date(year, month, day_of_year - days_before_month + 1)
+
+
+def add_days(date: constants.Date, num_days: int) -> constants.Date:
+    """Returns the date `num_days` days after (or before, if negative) a date in constant time
+
+    Args:
+        date (constants.Date): Date to which days need to be added
+        num_days (int): No. of days to add
+
+    Raises:
+        exceptions.InvalidDateFormat: If a given date doesn't exist, see `to_ordinal`
+
+    Returns:
+        constants.Date: Resulting date
+    """
+    return from_ordinal(to_ordinal(date) + num_days)
+
+
+def weekday(date: constants.Date) -> int:
+    """Returns day of the week of a date in constant time
+
+    - As 0001-01-01 was a Monday, ordinal modulo 7 directly maps onto values of `DAY`
+
+    Args:
+        date (constants.Date): Date whose day of the week is required
+
+    Raises:
+        exceptions.InvalidDateFormat: If a given date doesn't exist, see `to_ordinal`
+
+    Returns:
+        int: Value of `DAY` of the date
+    """
+    return to_ordinal(date) % 7
+
+
+def days_between(from_date: constants.Date, to_date: constants.Date) -> int:
+    """Returns no. of days from a date to another in constant time, negative if `to_date` is earlier
+
+    Args:
+        from_date (constants.Date): Date from which days are counted
+        to_date (constants.Date): Date until which days are counted
 
-    def calculate_absolute_days(date: constants.Date) -> int:
-        """Returns no. of absolute days since beginning until `date`
+    Raises:
+        exceptions.InvalidDateFormat: If a given date doesn't exist, see `to_ordinal`
 
-        - Makes use of `getDefaultDaysInMonth`, `countLeapYears`
+    Returns:
+        int: No. of days between the dates
+    """
+    return to_ordinal(to_date) - to_ordinal(from_date)
 
-        Args:
-            date (constants.Date): Date for which absolute no. of days needs to be calculated
 
-        Returns:
-            int: No. of days since beginning until `date`
-        """
-        logger.debug(f"Calculating absolute number of days from beginning for date: {date}")
+def first_weekday_of_month(year: int, month: int) -> int:
+    """Returns day of the week on which a month begins in constant time
 
-        total_days = date.year * 365 + date.day
-        for i in range(1, date.month.value):
-            total_days += get_default_days_in_month(constants.MONTH._value2member_map_[i])
+    - Makes use of `day_ordinal` without creating a `constants.Date` or validating it like `weekday`, as it is called
+      for every month computation with an already validated month
 
-        total_days += count_leap_years(date)
-        logger.debug(f"Absolute number of days from beginning for date: {date} calculated = {total_days}")
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
 
-        return total_days
+    Returns:
+        int: Value of `DAY` on which the month begins
+    """
+    return day_ordinal(year, month, 1) % 7
 
-    total_days_base_date = calculate_absolute_days(base_date)
-    total_days_actual_date = calculate_absolute_days(actual_date)
-    logger.debug(
-        f"Diff of days between: {base_date} and {actual_date} = {total_days_actual_date} - {total_days_base_date} = {total_days_actual_date - total_days_base_date}"
-    )
 
-    return total_days_actual_date - total_days_base_date
+def iso_week_number(ordinal: int) -> int:
+    """Returns ISO 8601 week number of a date
 
+    - ISO weeks begin on Monday and the first week of a year is the one containing its first Thursday, so a week
+      belongs to the year of its Thursday
 
-def date_validator(date: str, pivot_date: constants.Date) -> None:
+    Args:
+        ordinal (int): Ordinal of the date as per `to_ordinal`
+
+    Returns:
+        int: Week number between 1 and 53
+    """
+    # Ordinal modulo 7 is the value of `DAY`, shifting it by a day makes Monday 0
+    thursday_ordinal = ordinal - (ordinal - 1) % 7 + 3
+
+    return (thursday_ordinal - day_ordinal(from_ordinal(thursday_ordinal).year, 1, 1)) // 7 + 1
+
+
+def date_validator(date: str, pivot_date: constants.Date) -> constants.Date:
     """Validates a string date to be accepted by the application
 
+    - It is the single place where a date given by user is parsed into `constants.Date`
+
     Args:
         date (str): Date that needs to be validated
         pivot_date (constants.Date): Minimum possible date supported by the application
 
     Raises:
         exceptions.InvalidDateFormat: If the passed `date` fails the validations test(s)
+
+    Returns:
+        constants.Date: Validated date
     """
-    logger.info(f"Validating date: {date}")
-    try:
-        year, month, day = date.split("-")
-    except Exception:
-        logger.info(f"Failed to fetch year, month and/or day information from string: {date}")
+    logger.debug("Validating date: %s", date)
+    # String is split only once and the integers parsed out of it flow downstream as `constants.Date`
+    parts = date.split("-") if isinstance(date, str) else ()
+    if len(parts) != 3:
+        logger.info("Failed to fetch year, month and/or day information from string: %s", date)
         raise exceptions.InvalidDateFormat(f"String {date} doesn't contain enough separators to specify year, month and day")
 
     try:
-        year, month, day = int(year), int(month), int(day)
-    except Exception:
-        logger.info(f"Year and/or month and/or day of date: {date} is/are not Integers")
-        raise exceptions.InvalidDateFormat(f"Year: {year} or month: {month} or day: {day} is/are not integer(s)")
+        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        logger.info("Year and/or month and/or day of date: %s is/are not Integers", date)
+        raise exceptions.InvalidDateFormat(f"Year: {parts[0]} or month: {parts[1]} or day: {parts[2]} is/are not integer(s)")
 
     if month <= 0 or month > 12:
-        logger.info(f"Month of date: {date} is not in range [1, 12]")
+        logger.info("Month of date: %s is not in range [1, 12]", date)
         raise exceptions.InvalidDateFormat(f"Given month {month} isn't between [1, 12]")
 
-    if day < 0 or day > 31:
-        logger.info(f"Day of date: {date} is not in range [1, 31]")
+    # Fast path for the common case of a day within its month, detailed checks are only needed to report the error
+    if day <= 0 or day > constants.DAYS_IN_MONTH[month] + (month == 2 and is_leap_year(year)):
+        _report_invalid_day(date, year, month, day)
+
+    date_obj = constants.Date(year, month, day)
+    if date_obj < pivot_date:
+        logger.info("Give: %s is less than the pivot date: %s and hence not supported", date, pivot_date)
+        raise exceptions.InvalidDateFormat(f"Given date: {date} should be greater or equal to {pivot_date}")
+
+    return date_obj
+
+
+def _report_invalid_day(date: str, year: int, month: int, day: int) -> None:
+    """Raises error describing why `day` isn't valid for `month` of `year`
+
+    Args:
+        date (str): Date that is being validated
+        year (int): Year of the date
+        month (int): Month (value of `MONTH`) of the date
+        day (int): Day of the date which isn't valid
+
+    Raises:
+        exceptions.InvalidDateFormat: Always, with the reason of `day` not being valid
+    """
+    if day <= 0 or day > 31:
+        logger.info("Day of date: %s is not in range [1, 31]", date)
         raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1, 31]")
 
     if month == 2:
         if is_leap_year(year):
-            if day > 29:
-                logger.info(f"Month of date: {date} is not in range [1, 29] for a leap year")
-                raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1,29] for a leap year")
+            logger.info("Month of date: %s is not in range [1, 29] for a leap year", date)
+            raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1,29] for a leap year")
         else:
-            if day > 28:
-                logger.info(f"Month of date: {date} is not in range [1, 28] for a non-leap year")
-                raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1,28] for a non-leap year")
-    elif constants.MONTH._value2member_map_[month] not in constants.MONTHS_WITH_31_DAYS:
-        if day == 31:
-            logger.info(f"Month of date: {date} is not in range [1,30]")
-            raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1, 30] for given month: {constants.MONTH._value2member_map_[month].name}")
-
-    if num_days_between_dates(pivot_date, constants.Date(date)) < 0:
-        logger.info(f"Give: {date} is less than the pivot date: {pivot_date} and hence not supported")
-        raise exceptions.InvalidDateFormat(f"Given date: {date} should be greater or equal to {pivot_date}")
+            logger.info("Month of date: %s is not in range [1, 28] for a non-leap year", date)
+            raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1,28] for a non-leap year")
+
+    logger.info("Month of date: %s is not in range [1,30]", date)
+    raise exceptions.InvalidDateFormat(f"Given day: {day} isn't between [1, 30] for given month: {constants.MONTH._value2member_map_[month].name}")
+
+
+def month_validator(month: str, pivot_date: constants.Date) -> tuple[int, int]:
+    """Validates a string month (Format: "YYYY-MM") to be accepted by the application
+
+    Args:
+        month (str): Month that needs to be validated
+        pivot_date (constants.Date): Minimum possible date supported by the application
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed `month` fails the validations test(s)
+
+    Returns:
+        tuple[int, int]: Year and month (value of `MONTH`) of the validated `month`
+    """
+    logger.debug("Validating month: %s", month)
+    parts = month.split("-") if isinstance(month, str) else ()
+    if len(parts) != 2:
+        logger.info("Failed to fetch year and/or month information from string: %s", month)
+        raise exceptions.InvalidDateFormat(f"String {month} doesn't contain enough separators to specify year and month")
+
+    try:
+        year, month_value = int(parts[0]), int(parts[1])
+    except ValueError:
+        logger.info("Year and/or month of: %s is/are not Integers", month)
+        raise exceptions.InvalidDateFormat(f"Year: {parts[0]} or month: {parts[1]} is/are not integer(s)")
+
+    if month_value <= 0 or month_value > 12:
+        logger.info("Month of: %s is not in range [1, 12]", month)
+        raise exceptions.InvalidDateFormat(f"Given month {month_value} isn't between [1, 12]")
+
+    if (year, month_value) < (pivot_date.year, pivot_date.month):
+        logger.info("Given: %s is less than the month of pivot date: %s and hence not supported", month, pivot_date)
+        raise exceptions.InvalidDateFormat(f"Given month: {month} should be greater or equal to month of {pivot_date}")
+
+    return year, month_value
+
+
+def year_validator(year: str, pivot_date: constants.Date) -> int:
+    """Validates a string year (Format: "YYYY") to be accepted by the application
+
+    - All months of the year need to be on or after month of `pivot_date`
+
+    Args:
+        year (str): Year that needs to be validated
+        pivot_date (constants.Date): Minimum possible date supported by the application
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed `year` fails the validations test(s)
+
+    Returns:
+        int: Validated year
+    """
+    logger.debug("Validating year: %s", year)
+    try:
+        year_value = int(year)
+    except Exception:
+        logger.info("Year: %s is not an Integer", year)
+        raise exceptions.InvalidDateFormat(f"Year: {year} is not an integer")
+
+    if (year_value, constants.MONTH.JANUARY.value) < (pivot_date.year, pivot_date.month):
+        logger.info("Given year: %s begins before the pivot date: %s and hence not supported", year, pivot_date)
+        raise exceptions.InvalidDateFormat(f"Given year: {year} should begin on or after {pivot_date}")
+
+    return year_value
+
+
+def layout_validator(week_start: str | None, week_numbers: str | None, trim_rows: str | None = None) -> constants.Layout:
+    """Validates layout of the date matrix requested via query parameters
+
+    Args:
+        week_start (str | None): Name of the day (like "monday") on which weeks begin, None for the default layout
+        week_numbers (str | None): "true" to prepend ISO week numbers, "false" or None to not
+        trim_rows (str | None, optional): "true" to leave out rows of only next month, "false" or None to not. Defaults to None.
+
+    Raises:
+        exceptions.InvalidDateFormat: If the passed layout fails the validations test(s)
+
+    Returns:
+        constants.Layout: Layout of the date matrix
+    """
+    week_start_day = constants.DAY.SUNDAY if week_start is None else constants.DAY.__members__.get(week_start.upper())
+    if week_start_day is None:
+        raise exceptions.InvalidDateFormat(f"Given week start: {week_start} should be one of {[day.name.lower() for day in constants.DAY]}")
+    for name, flag in (("week numbers", week_numbers), ("trim rows", trim_rows)):
+        if flag not in (None, "true", "false"):
+            raise exceptions.InvalidDateFormat(f"Given {name}: {flag} should be one of ['true', 'false']")
+
+    return constants.Layout(week_start_day.value, week_numbers == "true", trim_rows == "true")
@@ -0,0 +1,175 @@
+# Array counterparts of the scalar date functions of `utils` for bulk jobs computing over many dates at once
+#
+# Every function accepts sequences (or NumPy arrays) of years, months and days of equal length and returns one value
+# per date, equal to what the scalar function returns for that date. NumPy arrays are returned when NumPy is installed,
+# else lists computed one date at a time in pure Python.
+#
+# Dates of months outside [1, 12] get 0 days in month, 0 ordinal and -1 weekday. They and dates of days outside their
+# month are flagged by the validation mask of `date_arrays` instead of raising, so one bad date never fails the batch.
+
+from typing import Any, NamedTuple, Sequence
+
+from api.src import constants, utils
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, lists are computed in pure Python without it
+    np = None
+
+
+class DateArrays(NamedTuple):
+    """Values of every date of a batch, computed in a single pass by `date_arrays`"""
+
+    is_leap_year: Any  # bool per date, as per `utils.is_leap_year` of its year
+    days_in_month: Any  # int per date, as per `utils.get_actual_days_in_month` of its month
+    ordinal: Any  # int per date, as per `utils.day_ordinal`
+    weekday: Any  # int per date, value of `DAY`
+    valid: Any  # bool per date, True if its month and day exist and it isn't before the pivot date
+
+
+def is_leap_year(years: Sequence[int]) -> Any:
+    """Checks whether every year is leap year or not
+
+    Args:
+        years (Sequence[int]): Years that need to be checked
+
+    Returns:
+        Any: Boolean flag per year, as per `utils.is_leap_year`
+    """
+    if np is None:
+        return [utils.is_leap_year(year) for year in years]
+
+    years = np.asarray(years, dtype=np.int64)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def count_leap_years(years: Sequence[int], months: Sequence[int]) -> Any:
+    """Counts no. of leap years passed until every date, taking its year into account beyond February
+
+    Args:
+        years (Sequence[int]): Years of the dates
+        months (Sequence[int]): Months (values of `MONTH`) of the dates
+
+    Returns:
+        Any: No. of leap years per date, as per `utils.count_leap_years`
+    """
+    if np is None:
+        # Year of a date in January or February doesn't count as it hasn't passed its 29th February yet
+        return [year // 4 - year // 100 + year // 400 for year in (year - (month <= 2) for year, month in zip(years, months))]
+
+    years = np.asarray(years, dtype=np.int64) - (np.asarray(months, dtype=np.int64) <= 2)
+    return years // 4 - years // 100 + years // 400
+
+
+def days_in_month(years: Sequence[int], months: Sequence[int]) -> Any:
+    """Returns no. of days in every month considering leap years
+
+    Args:
+        years (Sequence[int]): Years of the months
+        months (Sequence[int]): Months (values of `MONTH`)
+
+    Returns:
+        Any: No. of days per month, as per `utils.get_actual_days_in_month` and 0 for invalid months
+    """
+    if np is None:
+        return [_days_in_month(year, month) for year, month in zip(years, months)]
+
+    years, months = np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64)
+    return _month_lengths(months, is_leap_year(years))
+
+
+def num_days_between_dates(base_date: constants.Date, years: Sequence[int], months: Sequence[int], days: Sequence[int]) -> Any:
+    """Returns difference of days between a base date and every date
+
+    Args:
+        base_date (constants.Date): Base date from which difference needs to be calculated
+        years (Sequence[int]): Years of the dates
+        months (Sequence[int]): Months (values of `MONTH`) of the dates
+        days (Sequence[int]): Days of the dates
+
+    Returns:
+        Any: Difference of days per date, as per `utils.num_days_between_dates`
+    """
+    base_ordinal = utils.day_ordinal(*base_date)
+    ordinals = date_arrays(years, months, days).ordinal
+    if np is None:
+        return [ordinal - base_ordinal for ordinal in ordinals]
+
+    return ordinals - base_ordinal
+
+
+def date_arrays(years: Sequence[int], months: Sequence[int], days: Sequence[int], pivot_date: constants.Date = constants.PIVOT_DATE) -> DateArrays:
+    """Computes leap year flags, month lengths, ordinals, weekdays and validation mask of every date in a single pass
+
+    Args:
+        years (Sequence[int]): Years of the dates
+        months (Sequence[int]): Months (values of `MONTH`) of the dates
+        days (Sequence[int]): Days of the dates
+        pivot_date (constants.Date, optional): Minimum possible date supported by the application. Defaults to
+            `PIVOT_DATE`.
+
+    Returns:
+        DateArrays: Values of every date
+    """
+    pivot_ordinal = utils.day_ordinal(*pivot_date)
+    if np is None:
+        leap_flags, month_lengths, ordinals, weekdays, valid = [], [], [], [], []
+        for year, month, day in zip(years, months, days):
+            leap_flags.append(utils.is_leap_year(year))
+            month_lengths.append(_days_in_month(year, month))
+            ordinals.append(utils.day_ordinal(year, month, day) if month_lengths[-1] else 0)
+            weekdays.append(ordinals[-1] % 7 if month_lengths[-1] else -1)
+            valid.append(0 < day <= month_lengths[-1] and ordinals[-1] >= pivot_ordinal)
+
+        return DateArrays(leap_flags, month_lengths, ordinals, weekdays, valid)
+
+    years, months, days = (np.asarray(values, dtype=np.int64) for values in (years, months, days))
+    leap_flags = is_leap_year(years)
+    month_lengths = _month_lengths(months, leap_flags)
+    valid_months = month_lengths > 0
+
+    # Same arithmetic as `utils.day_ordinal`, with months outside [1, 12] looked up as 0 and masked afterwards
+    previous_years = years - 1
+    ordinals = previous_years * 365 + previous_years // 4 - previous_years // 100 + previous_years // 400
+    ordinals += np.asarray(constants.DAYS_BEFORE_MONTH)[np.where(valid_months, months, 0)] + days + ((months > 2) & leap_flags)
+    ordinals = np.where(valid_months, ordinals, 0)
+
+    return DateArrays(
+        leap_flags,
+        month_lengths,
+        ordinals,
+        np.where(valid_months, ordinals % 7, -1),
+        (days > 0) & (days <= month_lengths) & (ordinals >= pivot_ordinal),
+    )
+
+
+def _month_lengths(months: Any, leap_flags: Any) -> Any:
+    """Returns no. of days of every month as NumPy array
+
+    Args:
+        months (Any): NumPy array of months (values of `MONTH`)
+        leap_flags (Any): NumPy array of leap year flags of years of the months
+
+    Returns:
+        Any: NumPy array of no. of days per month, 0 for invalid months
+    """
+    valid_months = (months >= 1) & (months <= 12)
+    month_lengths = np.asarray(constants.DAYS_IN_MONTH)[np.where(valid_months, months, 0)] + ((months == 2) & leap_flags)
+
+    return np.where(valid_months, month_lengths, 0)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Returns no. of days in a month considering leap years in pure Python, counterpart of `_month_lengths`
+
+    Args:
+        year (int): Year of the month
+        month (int): Month (value of `MONTH`)
+
+    Returns:
+        int: No. of days in the month, as per `utils.get_actual_days_in_month` and 0 for invalid months
+    """
+    if month < 1 or month > 12:
+        return 0
+
+    return constants.DAYS_IN_MONTH[month] + (month == 2 and utils.is_leap_year(year))
@@ -1,9 +1,13 @@
+import gzip
 import json
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from api.src import constants
 from api.src.api import flask_app
 from api.src.exceptions import InvalidDateFormat
+from api.src.initializer import app_ready
 from api.tests.mocks import FakeResponse
 
 
@@ -11,6 +15,7 @@ class TestFlaskApp(unittest.TestCase):
     def setUp(self):
         self._app = flask_app
         self._app.config.update({"TESTING": True})
+        app_ready.set()
 
     def test_home_page_should_return_expected_message(self):
         with self._app.test_client() as test_client:
@@ -32,11 +37,25 @@ class TestFlaskApp(unittest.TestCase):
             self.assertEqual(expected_response.status_code, actual_response.status_code)
             self.assertEqual(expected_response.data, actual_response.data)
 
+    @patch("api.src.api.calendar_table")
+    @patch("api.src.api.get_date_matrix")
+    def test_health_page_should_warm_up_lazily_when_not_warmed_up_by_server(self, stub_get_date_matrix, stub_calendar_table):
+        app_ready.clear()
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/health")
+            test_client.get("/health")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertTrue(app_ready.is_set())
+            stub_calendar_table.load_table.assert_called_once()
+            stub_get_date_matrix.warm_up.assert_called_once()
+
     @patch("api.src.api.get_date_matrix")
     def test_date_page_should_return_expected_message_for_valid_date(self, stub_get_date_matrix):
         dummy_date = "2022-02-27"
         expected_date_matrix = b"[[30, 31, 1, 2, 3, 4, 5], [6, 7, 8, 9, 10, 11, 12], [13, 14, 15, 16, 17, 18, 19], [20, 21, 22, 23, 24, 25, 26], [27, 28, 1, 2, 3, 4, 5], [6, 7, 8, 9, 10, 11, 12]]"
-        stub_get_date_matrix.get_date_matrix.return_value = json.loads(expected_date_matrix.decode())
+        stub_get_date_matrix.get_month_matrix_json.return_value = expected_date_matrix
         expected_response = FakeResponse(data=expected_date_matrix, status_code=200)
 
         with self._app.test_client() as test_client:
@@ -46,10 +65,43 @@ class TestFlaskApp(unittest.TestCase):
             self.assertEqual(expected_response.status_code, actual_response.status_code)
             self.assertEqual(expected_response.data, actual_response.data)
 
+    def test_date_page_should_return_packed_date_matrix_for_octet_stream(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27", headers={"Accept": "application/octet-stream"})
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual("application/octet-stream", actual_response.mimetype)
+            self.assertEqual(bytes([30, 31, *range(1, 29), *range(1, 13)]), actual_response.data)
+            self.assertEqual('"v1-2022-02-bin"', actual_response.headers["ETag"])
+            self.assertIn("Accept", actual_response.vary)
+
+    def test_date_page_should_prefer_json_when_accepting_any_representation(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27", headers={"Accept": "application/msgpack;q=0.5, */*"})
+
+            self.assertEqual("application/json", actual_response.mimetype)
+            self.assertEqual('"v1-2022-02"', actual_response.headers["ETag"])
+
+    def test_date_page_should_return_304_only_for_etag_of_negotiated_representation(self):
+        with self._app.test_client() as test_client:
+            json_response = test_client.get("/date/2022-02-27", headers={"If-None-Match": '"v1-2022-02"', "Accept": "application/msgpack"})
+            msgpack_response = test_client.get("/date/2022-02-27", headers={"If-None-Match": '"v1-2022-02-msgpack"', "Accept": "application/msgpack"})
+
+            self.assertEqual(200, json_response.status_code)
+            self.assertEqual(304, msgpack_response.status_code)
+
     @patch("api.src.api.get_date_matrix")
-    def test_date_page_should_return_400_for_invalid_date(self, stub_get_date_matrix):
+    def test_date_page_should_return_304_for_weak_etag(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2024-05-15", headers={"If-None-Match": 'W/"v1-2024-05"'})
+
+            self.assertEqual(304, actual_response.status_code)
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.utils")
+    def test_date_page_should_return_400_for_invalid_date(self, stub_utils):
         dummy_date = "2022-02-27"
-        stub_get_date_matrix.get_date_matrix.side_effect = InvalidDateFormat("unittest-invalid-date")
+        stub_utils.date_validator.side_effect = InvalidDateFormat("unittest-invalid-date")
         expected_response = FakeResponse(data="unittest-invalid-date", status_code=400)
 
         with self._app.test_client() as test_client:
@@ -62,7 +114,7 @@ class TestFlaskApp(unittest.TestCase):
     @patch("api.src.api.get_date_matrix")
     def test_date_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
         dummy_date = "2022-02-27"
-        stub_get_date_matrix.get_date_matrix.side_effect = Exception("unittest-server-side-exception")
+        stub_get_date_matrix.get_month_matrix_json.side_effect = Exception("unittest-server-side-exception")
         expected_response = FakeResponse(data="Server side issue", status_code=500)
 
         with self._app.test_client() as test_client:
@@ -72,6 +124,440 @@ class TestFlaskApp(unittest.TestCase):
             self.assertEqual(expected_response.status_code, actual_response.status_code)
             self.assertEqual(expected_response.data, actual_response.data.decode())
 
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_return_cacheable_json_response(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27")
+
+            self.assertEqual("application/json", actual_response.mimetype)
+            self.assertEqual(("v1-2022-02", False), actual_response.get_etag())
+            self.assertIn("public", actual_response.cache_control)
+            self.assertIn("immutable", actual_response.cache_control)
+            self.assertEqual(365 * 24 * 60 * 60, actual_response.cache_control.max_age)
+            stub_get_date_matrix.get_month_matrix_json.assert_called_once_with(2022, 2, constants.DEFAULT_LAYOUT)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_share_etag_across_days_of_a_month(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            first_response = test_client.get("/date/2022-02-01")
+            second_response = test_client.get("/date/2022-02-28")
+            other_month_response = test_client.get("/date/2022-03-01")
+
+            self.assertEqual(first_response.get_etag(), second_response.get_etag())
+            self.assertNotEqual(first_response.get_etag(), other_month_response.get_etag())
+
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_return_304_without_computing_for_matching_etag(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27", headers={"If-None-Match": '"v1-2022-02"'})
+
+            self.assertEqual(304, actual_response.status_code)
+            self.assertEqual(b"", actual_response.data)
+            self.assertEqual(("v1-2022-02", False), actual_response.get_etag())
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_return_200_for_non_matching_etag(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27", headers={"If-None-Match": '"v1-2022-03"'})
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(b"[]", actual_response.data)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_point_to_canonical_month_via_content_location(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2024-5-17")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual("/month/2024/05", actual_response.headers["Content-Location"])
+
+    @patch("api.src.api.config")
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_redirect_to_canonical_month_in_redirect_mode(self, stub_get_date_matrix, stub_config):
+        stub_config.REDIRECT_DATE_TO_MONTH = True
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2024-05-17")
+
+            self.assertEqual(301, actual_response.status_code)
+            self.assertTrue(actual_response.location.endswith("/month/2024/05"))
+            self.assertIn("immutable", actual_response.cache_control)
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_return_cacheable_json_response(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/05")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(b"[]", actual_response.data)
+            self.assertEqual(("v1-2024-05", False), actual_response.get_etag())
+            self.assertIn("immutable", actual_response.cache_control)
+            stub_get_date_matrix.get_month_matrix_json.assert_called_once_with(2024, 5, constants.DEFAULT_LAYOUT)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_redirect_non_canonical_month(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/5")
+
+            self.assertEqual(301, actual_response.status_code)
+            self.assertTrue(actual_response.location.endswith("/month/2024/05"))
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_not_redirect_canonical_month_mounted_under_prefix(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/05", environ_overrides={"SCRIPT_NAME": "/cal"})
+            redirect_response = test_client.get("/month/2024/5", environ_overrides={"SCRIPT_NAME": "/cal"})
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(301, redirect_response.status_code)
+            self.assertTrue(redirect_response.location.endswith("/cal/month/2024/05"))
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_redirect_non_canonical_layout_query_parameters(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            for query_string, expected_location in (
+                ("week_start=sunday", "/month/2024/05"),
+                ("week_start=Monday", "/month/2024/05?week_start=monday"),
+                ("trim_rows=true&week_start=monday", "/month/2024/05?week_start=monday&trim_rows=true"),
+                ("week_numbers=false&utm_source=feed", "/month/2024/05"),
+            ):
+                with self.subTest(query_string=query_string):
+                    actual_response = test_client.get(f"/month/2024/05?{query_string}")
+
+                    self.assertEqual(301, actual_response.status_code)
+                    self.assertTrue(actual_response.location.endswith(expected_location))
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_return_304_for_matching_etag(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/05", headers={"If-None-Match": '"v1-2024-05"'})
+
+            self.assertEqual(304, actual_response.status_code)
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_date_page_should_return_requested_layout(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2024-05-15?week_start=monday&week_numbers=true")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(("v1-2024-05-mon-wk", False), actual_response.get_etag())
+            self.assertTrue(actual_response.headers["Content-Location"].endswith("/month/2024/05?week_start=monday&week_numbers=true"))
+            stub_get_date_matrix.get_month_matrix_json.assert_called_once_with(2024, 5, constants.Layout(constants.DAY.MONDAY.value, True))
+
+    def test_date_page_should_return_400_for_invalid_layout(self):
+        with self._app.test_client() as test_client:
+            self.assertEqual(400, test_client.get("/date/2024-05-15?week_start=someday").status_code)
+            self.assertEqual(400, test_client.get("/date/2024-05-15?week_numbers=yes").status_code)
+            self.assertEqual(400, test_client.get("/date/2024-05-15?trim_rows=yes").status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_return_trimmed_rows(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2015/02?trim_rows=true")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(("v1-2015-02-trim", False), actual_response.get_etag())
+            stub_get_date_matrix.get_month_matrix_json.assert_called_once_with(2015, 2, constants.Layout(trim_rows=True))
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_keep_layout_when_redirecting_non_canonical_month(self, stub_get_date_matrix):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/5?week_start=monday")
+
+            self.assertEqual(301, actual_response.status_code)
+            self.assertTrue(actual_response.location.endswith("/month/2024/05?week_start=monday"))
+            stub_get_date_matrix.get_month_matrix_json.assert_not_called()
+
+    def test_month_page_should_return_400_for_invalid_month(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/13")
+
+            self.assertEqual(400, actual_response.status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_month_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.side_effect = Exception("unittest-server-side-exception")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/month/2024/05")
+
+            self.assertEqual(500, actual_response.status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_dates_page_should_return_expected_message_for_list_of_dates(self, stub_get_date_matrix):
+        dummy_dates = ["2022-02-27", "2022-13-01"]
+        dummy_results = [{"date": "2022-02-27", "matrix": [[1] * 7] * 6}, {"date": "2022-13-01", "error": "unittest-invalid-date"}]
+        stub_get_date_matrix.get_date_matrices.return_value = dummy_results
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.post("/dates", json=dummy_dates)
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(dummy_results, json.loads(actual_response.data))
+            self.assertEqual("application/json", actual_response.mimetype)
+            stub_get_date_matrix.get_date_matrices.assert_called_once_with(dummy_dates)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_dates_page_should_accept_object_with_list_of_dates(self, stub_get_date_matrix):
+        dummy_dates = ["2022-02-27"]
+        stub_get_date_matrix.get_date_matrices.return_value = []
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.post("/dates", json={"dates": dummy_dates})
+
+            self.assertEqual(200, actual_response.status_code)
+            stub_get_date_matrix.get_date_matrices.assert_called_once_with(dummy_dates)
+
+    def test_dates_page_should_return_400_for_invalid_body(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.post("/dates", data="2022-02-27")
+
+            self.assertEqual(400, actual_response.status_code)
+
+    @patch("api.src.api.config")
+    def test_dates_page_should_return_400_for_too_large_batch(self, stub_config):
+        stub_config.MAX_BATCH_SIZE = 1
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.post("/dates", json=["2022-02-27", "2022-02-28"])
+
+            self.assertEqual(400, actual_response.status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_dates_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_date_matrices.side_effect = Exception("unittest-server-side-exception")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.post("/dates", json=["2022-02-27"])
+
+            self.assertEqual(500, actual_response.status_code)
+            self.assertEqual("Server side issue", actual_response.data.decode())
+
+    @patch("api.src.api.get_date_matrix")
+    def test_range_page_should_return_expected_message_for_valid_range(self, stub_get_date_matrix):
+        dummy_results = [{"month": "2022-02", "matrix": [[1] * 7] * 6}]
+        stub_get_date_matrix.get_month_range_matrices.return_value = dummy_results
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/range?from=2022-02&to=2022-03")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(dummy_results, json.loads(actual_response.data))
+            stub_get_date_matrix.get_month_range_matrices.assert_called_once_with("2022-02", "2022-03")
+
+    @patch("api.src.api.get_date_matrix")
+    def test_range_page_should_return_negotiated_representation(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_range_body.return_value = b"\x92"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/range?from=2022-02&to=2022-03", headers={"Accept": "application/x-msgpack"})
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(b"\x92", actual_response.data)
+            self.assertEqual("application/msgpack", actual_response.mimetype)
+            self.assertIn("Accept", actual_response.vary)
+            stub_get_date_matrix.get_month_range_body.assert_called_once_with("2022-02", "2022-03", "application/msgpack")
+            stub_get_date_matrix.get_month_range_matrices.assert_not_called()
+
+    @patch("api.src.api.get_date_matrix")
+    def test_range_page_should_return_400_for_invalid_range(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_range_matrices.side_effect = InvalidDateFormat("unittest-invalid-range")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/range?from=2022-03&to=2022-02")
+
+            self.assertEqual(400, actual_response.status_code)
+            self.assertEqual("unittest-invalid-range", actual_response.data.decode())
+
+    @patch("api.src.api.get_date_matrix")
+    def test_range_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_range_matrices.side_effect = Exception("unittest-server-side-exception")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/range?from=2022-02&to=2022-03")
+
+            self.assertEqual(500, actual_response.status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_stream_page_should_stream_ndjson_lines(self, stub_get_date_matrix):
+        dummy_lines = [b'{"month": "2022-02"}\n', b'{"month": "2022-03"}\n']
+        stub_get_date_matrix.stream_month_range_matrices.return_value = iter(dummy_lines)
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/stream?from=2022-02&to=2022-03")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual("application/x-ndjson", actual_response.mimetype)
+            self.assertTrue(actual_response.is_streamed)
+            self.assertEqual(b"".join(dummy_lines), actual_response.data)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_stream_page_should_return_400_for_invalid_range(self, stub_get_date_matrix):
+        stub_get_date_matrix.stream_month_range_matrices.side_effect = InvalidDateFormat("unittest-invalid-range")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/stream?from=2022-03&to=2022-02")
+
+            self.assertEqual(400, actual_response.status_code)
+            self.assertEqual("unittest-invalid-range", actual_response.data.decode())
+
+    @patch("api.src.api.get_date_matrix")
+    def test_stream_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.stream_month_range_matrices.side_effect = Exception("unittest-server-side-exception")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/stream?from=2022-02&to=2022-03")
+
+            self.assertEqual(500, actual_response.status_code)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_year_page_should_return_expected_message_for_valid_year(self, stub_get_date_matrix):
+        dummy_year_matrices = [[[month] * 7] * 6 for month in range(1, 13)]
+        stub_get_date_matrix.get_year_matrices.return_value = dummy_year_matrices
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/year/2022")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual(dummy_year_matrices, json.loads(actual_response.data))
+
+    @patch("api.src.api.get_date_matrix")
+    def test_year_page_should_return_negotiated_representation(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_year_body.return_value = b"[]"
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/year/2022", headers={"Accept": "application/vnd.calendar.compact+json"})
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual("application/vnd.calendar.compact+json", actual_response.mimetype)
+            stub_get_date_matrix.get_year_body.assert_called_once_with("2022", "application/vnd.calendar.compact+json")
+
+    @patch("api.src.api.get_date_matrix")
+    def test_year_page_should_return_400_for_invalid_year(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_year_matrices.side_effect = InvalidDateFormat("unittest-invalid-year")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/year/1752")
+
+            self.assertEqual(400, actual_response.status_code)
+            self.assertEqual("unittest-invalid-year", actual_response.data.decode())
+
+    @patch("api.src.api.get_date_matrix")
+    def test_year_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_year_matrices.side_effect = Exception("unittest-server-side-exception")
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/year/2022")
+
+            self.assertEqual(500, actual_response.status_code)
+
+    def test_year_page_should_compress_response_as_per_accept_encoding(self):
+        with self._app.test_client() as test_client:
+            plain_response = test_client.get("/year/2022")
+            actual_response = test_client.get("/year/2022", headers={"Accept-Encoding": "gzip"})
+
+            self.assertEqual("gzip", actual_response.headers["Content-Encoding"])
+            self.assertEqual(plain_response.data, gzip.decompress(actual_response.data))
+            self.assertIn("Accept-Encoding", actual_response.vary)
+            self.assertNotIn("Content-Encoding", plain_response.headers)
+
+    @patch("api.src.api.config")
+    def test_year_page_should_not_compress_response_below_threshold(self, stub_config):
+        stub_config.COMPRESSION_MIN_SIZE = 1024 * 1024
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/year/2022", headers={"Accept-Encoding": "gzip"})
+
+            self.assertNotIn("Content-Encoding", actual_response.headers)
+
+    def test_date_page_should_not_compress_single_month(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/date/2022-02-27", headers={"Accept-Encoding": "gzip"})
+
+            self.assertNotIn("Content-Encoding", actual_response.headers)
+
+    def test_stream_page_should_not_compress_streamed_response(self):
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/stream?from=2000-01&to=2022-12", headers={"Accept-Encoding": "gzip"})
+
+            self.assertNotIn("Content-Encoding", actual_response.headers)
+
+    def test_metrics_page_should_expose_latency_and_status_of_requests(self):
+        with self._app.test_client() as test_client:
+            test_client.get("/date/2022-02-27")
+            test_client.get("/date/2022-13-27")
+            actual_response = test_client.get("/metrics")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual("text/plain", actual_response.mimetype)
+            self.assertRegex(actual_response.data.decode(), r'calendar_http_requests_total\{route="/date/<date>",status="200"\} \d+')
+            self.assertRegex(actual_response.data.decode(), r'calendar_http_requests_total\{route="/date/<date>",status="400"\} \d+')
+            self.assertIn('calendar_stage_duration_seconds_count{stage="validation"}', actual_response.data.decode())
+
+    @patch("api.src.api.config")
+    def test_debug_profiles_page_should_return_404_when_profiling_is_disabled(self, stub_config):
+        stub_config.PROFILING_ENABLED = False
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/debug/profiles")
+
+            self.assertEqual(404, actual_response.status_code)
+
+    @patch("api.src.profiling.config")
+    @patch("api.src.api.config")
+    def test_debug_profiles_page_should_list_top_functions_of_profiled_requests(self, stub_config, stub_profiling_config):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            stub_config.PROFILING_ENABLED = stub_profiling_config.PROFILING_ENABLED = True
+            stub_config.COMPRESSION_MIN_SIZE = 1024
+            stub_profiling_config.PROFILE_SAMPLE_RATE = 1.0
+            stub_profiling_config.PROFILE_SLOW_THRESHOLD = 0.0
+            stub_profiling_config.PROFILE_DIR = profile_dir
+            stub_profiling_config.PROFILE_MAX_FILES = 10
+
+            with self._app.test_client() as test_client:
+                test_client.get("/year/2022")
+                actual_response = test_client.get("/debug/profiles?limit=5&sort=tottime")
+
+                self.assertEqual(200, actual_response.status_code)
+                self.assertEqual(1, json.loads(actual_response.data)["profiles"])
+                self.assertEqual(5, len(json.loads(actual_response.data)["functions"]))
+                self.assertEqual("application/json", actual_response.mimetype)
+
+    @patch("api.src.api.get_date_matrix")
+    def test_cache_stats_page_should_return_month_cache_counters(self, stub_get_date_matrix):
+        dummy_stats = {"hits": 3, "misses": 1, "evictions": 0, "size": 1, "max_size": 1200}
+        stub_get_date_matrix.month_cache.stats.return_value = dummy_stats
+        stub_get_date_matrix.warm_month_entries = {(2022, 2): ((), b"")}
+        stub_get_date_matrix.interned_month_entries = {(2, 28, 31): ((), b"")}
+
+        with self._app.test_client() as test_client:
+            actual_response = test_client.get("/cache/stats")
+
+            self.assertEqual(200, actual_response.status_code)
+            self.assertEqual({**dummy_stats, "warm_size": 1, "interned_size": 1}, json.loads(actual_response.data))
+            self.assertEqual("application/json", actual_response.mimetype)
+
 
 if __name__ == "__main__":
     unittest.main()
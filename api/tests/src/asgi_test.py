@@ -0,0 +1,190 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from api.src import formats, get_date_matrix
+from api.src.asgi import asgi_app
+from api.src.exceptions import InvalidDateFormat
+from api.src.initializer import app_ready
+
+
+def _call_asgi_app(path: str, method: str = "GET", headers: list | None = None, query_string: bytes = b"", root_path: str = "") -> tuple[int, dict, bytes]:
+    """Calls the ASGI application with a single http request and returns status code, headers and body of its response"""
+    scope = {"type": "http", "method": method, "path": path, "root_path": root_path, "query_string": query_string, "headers": headers or []}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi_app(scope, receive, send))
+
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+
+class AsgiAppTest(unittest.TestCase):
+    def setUp(self):
+        app_ready.set()
+
+    def test_home_page_should_return_expected_message(self):
+        status, _, body = _call_asgi_app("/")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"Welcome to Calendar App. Please visit url: 'hostname:port/date' to try it.", body)
+
+    def test_health_page_should_return_expected_message(self):
+        status, _, body = _call_asgi_app("/health")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"Calendar App alive.", body)
+
+    def test_health_page_should_return_503_until_app_is_warmed_up(self):
+        app_ready.clear()
+
+        status, _, body = _call_asgi_app("/health")
+
+        self.assertEqual(503, status)
+        self.assertEqual(b"Calendar App warming up.", body)
+
+    def test_date_page_should_return_expected_date_matrix_for_valid_date(self):
+        status, headers, body = _call_asgi_app("/date/2022-02-27")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"application/json", headers[b"content-type"])
+        self.assertEqual(b'"v1-2022-02"', headers[b"etag"])
+        self.assertEqual(b"/month/2022/02", headers[b"content-location"])
+        self.assertEqual(str(len(body)).encode(), headers[b"content-length"])
+        self.assertEqual([27, 28, 1, 2, 3, 4, 5], json.loads(body)[4])
+
+    def test_date_page_should_return_304_for_matching_etag(self):
+        status, _, body = _call_asgi_app("/date/2022-02-27", headers=[(b"if-none-match", b'"v1-2022-01", "v1-2022-02"')])
+
+        self.assertEqual(304, status)
+        self.assertEqual(b"", body)
+
+    def test_date_page_should_return_304_for_weak_or_wildcard_etag(self):
+        for if_none_match in (b'W/"v1-2022-02"', b"*"):
+            status, _, _ = _call_asgi_app("/date/2022-02-27", headers=[(b"if-none-match", if_none_match)])
+
+            self.assertEqual(304, status)
+
+    def test_date_page_should_honour_layout_query_parameters(self):
+        status, headers, body = _call_asgi_app("/date/2022-02-27", query_string=b"week_start=monday&week_numbers=true")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b'"v1-2022-02-mon-wk"', headers[b"etag"])
+        self.assertEqual(b"/month/2022/02?week_start=monday&week_numbers=true", headers[b"content-location"])
+        self.assertEqual([8, 21, 22, 23, 24, 25, 26, 27], json.loads(body)[3])
+
+    def test_date_page_should_negotiate_representation_via_accept_header(self):
+        status, headers, body = _call_asgi_app("/date/2022-02-27", headers=[(b"accept", b"application/vnd.calendar.compact+json")])
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"application/vnd.calendar.compact+json", headers[b"content-type"])
+        self.assertEqual(b'"v1-2022-02-compact"', headers[b"etag"])
+        self.assertEqual(b"Accept", headers[b"vary"])
+        self.assertEqual(get_date_matrix.get_month_matrix_body(2022, 2, formats.COMPACT_JSON), body)
+
+    def test_date_page_should_return_400_for_invalid_layout(self):
+        status, _, _ = _call_asgi_app("/date/2022-02-27", query_string=b"week_start=someday")
+
+        self.assertEqual(400, status)
+
+    def test_month_page_advertised_by_date_page_should_return_same_date_matrix(self):
+        _, date_headers, date_body = _call_asgi_app("/date/2022-02-27", query_string=b"trim_rows=true")
+
+        path, query_string = date_headers[b"content-location"].split(b"?")
+        status, headers, body = _call_asgi_app(path.decode(), query_string=query_string)
+
+        self.assertEqual(200, status)
+        self.assertEqual(date_headers[b"etag"], headers[b"etag"])
+        self.assertEqual(date_body, body)
+
+    def test_month_page_should_redirect_non_canonical_month_and_layout(self):
+        for path, query_string, expected_location in (
+            ("/month/2022/2", b"", b"/cal/month/2022/02"),
+            ("/month/2022/02", b"week_start=Monday", b"/cal/month/2022/02?week_start=monday"),
+            ("/month/2022/02", b"week_start=sunday", b"/cal/month/2022/02"),
+        ):
+            with self.subTest(path=path, query_string=query_string):
+                status, headers, _ = _call_asgi_app(path, query_string=query_string, root_path="/cal")
+
+                self.assertEqual(301, status)
+                self.assertEqual(expected_location, headers[b"location"])
+
+    def test_month_page_should_prefix_content_location_with_root_path(self):
+        status, headers, _ = _call_asgi_app("/month/2022/02", root_path="/cal")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"/cal/month/2022/02", headers[b"content-location"])
+
+    def test_month_page_should_return_400_for_invalid_month(self):
+        status, _, _ = _call_asgi_app("/month/2022/13")
+
+        self.assertEqual(400, status)
+
+    def test_date_page_should_return_400_for_invalid_date(self):
+        status, _, _ = _call_asgi_app("/date/2022-13-27")
+
+        self.assertEqual(400, status)
+
+    @patch("api.src.asgi.get_date_matrix")
+    def test_date_page_should_return_500_for_unexpected_server_side_error(self, stub_get_date_matrix):
+        stub_get_date_matrix.get_month_matrix_json.side_effect = Exception("unittest-server-side-exception")
+
+        status, _, body = _call_asgi_app("/date/2022-02-27")
+
+        self.assertEqual(500, status)
+        self.assertEqual(b"Server side issue", body)
+
+    @patch("api.src.asgi.utils")
+    def test_date_page_should_return_validation_message_for_invalid_date(self, stub_utils):
+        stub_utils.date_validator.side_effect = InvalidDateFormat("unittest-invalid-date")
+
+        _, _, body = _call_asgi_app("/date/2022-02-27")
+
+        self.assertEqual(b"unittest-invalid-date", body)
+
+    def test_head_request_should_return_empty_body(self):
+        status, headers, body = _call_asgi_app("/health", method="HEAD")
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"19", headers[b"content-length"])
+        self.assertEqual(b"", body)
+
+    def test_unknown_page_should_return_404(self):
+        status, _, _ = _call_asgi_app("/date/2022/02/27")
+
+        self.assertEqual(404, status)
+
+    def test_post_request_should_return_405(self):
+        status, _, _ = _call_asgi_app("/health", method="POST")
+
+        self.assertEqual(405, status)
+
+    @patch("api.src.asgi.calendar_table")
+    @patch("api.src.asgi.get_date_matrix")
+    def test_lifespan_should_warm_up_and_complete_startup_and_shutdown(self, stub_get_date_matrix, stub_calendar_table):
+        app_ready.clear()
+        messages = []
+        events = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+        async def receive():
+            return next(events)
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(asgi_app({"type": "lifespan"}, receive, send))
+
+        self.assertEqual([{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}], messages)
+        stub_calendar_table.load_table.assert_called_once()
+        stub_get_date_matrix.warm_up.assert_called_once()
+        self.assertTrue(app_ready.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from api.src.cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_getOrCompute_should_compute_value_on_miss_and_reuse_it_on_hit(self):
+        cache = LRUCache(2)
+
+        first_value = cache.get_or_compute("key", lambda: ["value"])
+        second_value = cache.get_or_compute("key", lambda: ["other-value"])
+
+        self.assertIs(first_value, second_value)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_getOrCompute_should_evict_least_recently_used_entry(self):
+        cache = LRUCache(2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)  # "b" becomes least recently used
+
+        cache.get_or_compute("c", lambda: 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(1, cache.get_or_compute("a", lambda: -1))
+        self.assertEqual(-2, cache.get_or_compute("b", lambda: -2))
+
+    def test_getOrCompute_should_not_cache_when_max_size_is_zero(self):
+        cache = LRUCache(0)
+
+        cache.get_or_compute("a", lambda: 1)
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(2, cache.get_or_compute("a", lambda: 2))
+
+    def test_clear_should_remove_entries_and_reset_counters(self):
+        cache = LRUCache(1)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+
+        cache.clear()
+
+        self.assertEqual({"hits": 0, "misses": 0, "evictions": 0, "size": 0, "max_size": 1}, cache.stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
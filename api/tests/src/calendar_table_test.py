@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from api.src import calendar_table
+from api.src.calendar_table import CalendarTable, load_table, pack_table
+from api.src.get_date_matrix import build_calendar_table, get_date_matrix
+
+
+class CalendarTableTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.table_path = os.path.join(self.temp_dir.name, "calendar_table.bin")
+        with open(self.table_path, "wb") as table_file:
+            table_file.write(build_calendar_table())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_monthGrid_should_return_dates_of_date_matrix(self):
+        table = CalendarTable(self.table_path)
+
+        for year, month in ((1752, 10), (2000, 1), (2020, 2), (2022, 2), (2100, 2), (2399, 12), (2400, 1), (9999, 12)):
+            expected_value = get_date_matrix(f"{year}-{month}-01")
+
+            actual_value = table.month_grid(year, month)
+
+            self.assertEqual(expected_value, [list(actual_value[idx : idx + 7]) for idx in range(0, 42, 7)])
+        table.close()
+
+    def test_monthSignature_should_return_first_weekday_and_no_of_days(self):
+        table = CalendarTable(self.table_path)
+
+        self.assertEqual((2, 28), table.month_signature(2022, 2))
+        self.assertEqual((6, 29), table.month_signature(2020, 2))
+        self.assertEqual((0, 31), table.month_signature(1752, 10))
+        table.close()
+
+    def test_calendarTable_should_hold_few_distinct_grids(self):
+        table = CalendarTable(self.table_path)
+
+        self.assertLess(table.num_grids, 64)
+        table.close()
+
+    def test_calendarTable_should_raise_exception_for_invalid_file(self):
+        with open(self.table_path, "r+b") as table_file:
+            table_file.write(b"XXXX")
+
+        with self.assertRaises(ValueError):
+            CalendarTable(self.table_path)
+
+    def test_packTable_should_raise_exception_for_missing_months(self):
+        with self.assertRaises(ValueError):
+            pack_table([(0, 0, 31)], [bytes(42)])
+
+    @patch("api.src.calendar_table.loaded_table", None)
+    def test_loadTable_should_map_valid_table(self):
+        load_table(self.table_path)
+
+        self.assertIsInstance(calendar_table.loaded_table, CalendarTable)
+        calendar_table.loaded_table.close()
+
+    @patch("api.src.calendar_table.loaded_table", None)
+    def test_loadTable_should_fall_back_for_missing_or_invalid_table(self):
+        load_table(os.path.join(self.temp_dir.name, "missing.bin"))
+        self.assertIsNone(calendar_table.loaded_table)
+
+        with open(self.table_path, "wb") as table_file:
+            table_file.write(b"XX")
+        load_table(self.table_path)
+        self.assertIsNone(calendar_table.loaded_table)
+
+
+if __name__ == "__main__":
+    unittest.main()
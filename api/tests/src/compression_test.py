@@ -0,0 +1,43 @@
+import gzip
+import unittest
+from unittest.mock import patch
+
+from api.src import compression
+from api.src.compression import compress, compressed_cache
+
+
+class CompressTest(unittest.TestCase):
+    def setUp(self):
+        compressed_cache.clear()
+
+    def test_compress_should_gzip_body(self):
+        body = b"[[30, 31, 1, 2, 3, 4, 5]]" * 100
+
+        actual_value = compress(body, "gzip")
+
+        self.assertEqual(body, gzip.decompress(actual_value))
+        self.assertLess(len(actual_value), len(body))
+
+    def test_compress_should_reuse_cached_result_for_same_body(self):
+        body = b"[[30, 31, 1, 2, 3, 4, 5]]" * 100
+
+        first_value = compress(body, "gzip")
+        second_value = compress(bytes(bytearray(body)), "gzip")
+
+        self.assertIs(first_value, second_value)
+        self.assertEqual(1, compressed_cache.hits)
+
+    @patch("api.src.compression.brotli", None)
+    def test_compress_should_raise_exception_for_unsupported_encoding(self):
+        with self.assertRaises(ValueError):
+            compress(b"[]", "br")
+
+    @unittest.skipIf(compression.brotli is None, "Brotli is not installed")
+    def test_compress_should_brotli_body(self):
+        body = b"[[30, 31, 1, 2, 3, 4, 5]]" * 100
+
+        self.assertEqual(body, compression.brotli.decompress(compress(body, "br")))
+
+
+if __name__ == "__main__":
+    unittest.main()
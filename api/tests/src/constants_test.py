@@ -2,6 +2,8 @@ import unittest
 
 from api.src.constants import (
     DAY,
+    DAYS_BEFORE_MONTH,
+    DAYS_IN_MONTH,
     MONTH,
     MONTHS_WITH_31_DAYS,
     PIVOT_DATE,
@@ -17,34 +19,41 @@ class ConstantsTest(unittest.TestCase):
     def test_MONTH_should_contain_12_months(self):
         self.assertEqual(12, len(MONTH))
 
-    def test_Date_should_parse_valid_date(self):
-        dummy_date = "2022-02-28"
-        Date(dummy_date)  # No error expected
-
-    def test_Date_should_have_year_month_day_properties(self):
-        dummy_date = "2022-02-28"
-        date_object = Date(dummy_date)
+    def test_Date_should_have_year_month_day_as_integers(self):
+        date_object = Date(2022, 2, 28)
 
         self.assertEqual(2022, date_object.year)
-        self.assertEqual(MONTH.FEBRUARY, date_object.month)
+        self.assertEqual(MONTH.FEBRUARY.value, date_object.month)
         self.assertEqual(28, date_object.day)
 
-    def test_Date_should_allow_setting_of_day(self):
-        dummy_date = "2022-02-28"
-        date_object = Date(dummy_date)
+    def test_Date_should_be_immutable(self):
+        date_object = Date(2022, 2, 28)
+
+        with self.assertRaises(AttributeError):
+            date_object.day = 15
+
+    def test_Date_should_not_have_per_instance_dict(self):
+        date_object = Date(2022, 2, 28)
 
-        date_object.day = 15
+        self.assertFalse(hasattr(date_object, "__dict__"))
 
-        self.assertEqual(15, date_object.day)
+    def test_Date_should_be_hashable(self):
+        self.assertEqual(hash(Date(2022, 2, 28)), hash(Date(2022, 2, 28)))
+        self.assertEqual(1, len({Date(2022, 2, 28), Date(2022, 2, 28)}))
+
+    def test_Date_should_be_ordered_by_year_month_and_day(self):
+        self.assertLess(Date(2021, 12, 31), Date(2022, 1, 1))
+        self.assertLess(Date(2022, 1, 31), Date(2022, 2, 1))
+        self.assertLess(Date(2022, 2, 1), Date(2022, 2, 2))
+        self.assertGreaterEqual(Date(2022, 2, 2), Date(2022, 2, 2))
 
     def test_Date_should_provide_original_date_when_printed(self):
-        dummy_date = "2022-02-28"
-        date_object = Date(dummy_date)
+        date_object = Date(2022, 2, 28)
 
         self.assertEqual(str(date_object), "2022-2-28")
 
     def test_PIVOT_DATE(self):
-        expected_date = Date("1752-10-01")
+        expected_date = Date(1752, 10, 1)
 
         self.assertEqual(expected_date.year, PIVOT_DATE.year)
         self.assertEqual(expected_date.month, PIVOT_DATE.month)
@@ -56,6 +65,13 @@ class ConstantsTest(unittest.TestCase):
     def test_MONTHS_WITH_31_DAYS_should_contain_7_months(self):
         self.assertEqual(7, len(MONTHS_WITH_31_DAYS))
 
+    def test_DAYS_IN_MONTH_should_add_up_to_365_days(self):
+        self.assertEqual(365, sum(DAYS_IN_MONTH))
+
+    def test_DAYS_BEFORE_MONTH_should_be_cumulative_sum_of_DAYS_IN_MONTH(self):
+        for month in MONTH:
+            self.assertEqual(sum(DAYS_IN_MONTH[: month.value]), DAYS_BEFORE_MONTH[month.value])
+
 
 if __name__ == "__main__":
     unittest.main()
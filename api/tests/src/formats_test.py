@@ -0,0 +1,62 @@
+import json
+import unittest
+
+from api.src import formats
+
+_FEBRUARY_2022 = (
+    (30, 31, 1, 2, 3, 4, 5),
+    (6, 7, 8, 9, 10, 11, 12),
+    (13, 14, 15, 16, 17, 18, 19),
+    (20, 21, 22, 23, 24, 25, 26),
+    (27, 28, 1, 2, 3, 4, 5),
+    (6, 7, 8, 9, 10, 11, 12),
+)
+_FEBRUARY_2022_SIGNATURE = (2, 28, 31)
+
+
+class FormatsTest(unittest.TestCase):
+    def test_canonicalMediaType_should_default_to_json(self):
+        self.assertEqual(formats.JSON, formats.canonical_media_type(None))
+        self.assertEqual(formats.MSGPACK, formats.canonical_media_type("application/x-msgpack"))
+        self.assertEqual(formats.OCTET_STREAM, formats.canonical_media_type(formats.OCTET_STREAM))
+
+    def test_encodeMonth_should_pack_42_bytes_for_octet_stream(self):
+        actual_value = formats.encode_month(formats.OCTET_STREAM, _FEBRUARY_2022, _FEBRUARY_2022_SIGNATURE)
+
+        self.assertEqual(42, len(actual_value))
+        self.assertEqual([date for row in _FEBRUARY_2022 for date in row], list(actual_value))
+
+    def test_encodeMonth_should_encode_nested_msgpack_arrays(self):
+        actual_value = formats.encode_month(formats.MSGPACK, _FEBRUARY_2022, _FEBRUARY_2022_SIGNATURE)
+
+        self.assertEqual(1 + 6 * 8, len(actual_value))
+        self.assertEqual(b"\x96\x97\x1e\x1f\x01\x02\x03\x04\x05\x97\x06", actual_value[:11])
+
+    def test_encodeMonth_should_encode_rows_with_week_numbers_in_msgpack(self):
+        date_matrix = tuple((week_number, *row) for week_number, row in enumerate(_FEBRUARY_2022, start=5))
+
+        actual_value = formats.encode_month(formats.MSGPACK, date_matrix, _FEBRUARY_2022_SIGNATURE)
+
+        self.assertEqual(1 + 6 * 9, len(actual_value))
+        self.assertEqual(b"\x96\x98\x05\x1e", actual_value[:4])
+
+    def test_encodeMonth_should_encode_compact_form(self):
+        actual_value = formats.encode_month(formats.COMPACT_JSON, _FEBRUARY_2022, _FEBRUARY_2022_SIGNATURE)
+
+        self.assertEqual({"start": 2, "days": 28, "prev_days": 31}, json.loads(actual_value))
+
+    def test_encodeMonth_should_raise_exception_for_json(self):
+        with self.assertRaises(ValueError):
+            formats.encode_month(formats.JSON, _FEBRUARY_2022, _FEBRUARY_2022_SIGNATURE)
+
+    def test_encodeMonths_should_encode_batch_in_order(self):
+        months = [(_FEBRUARY_2022, _FEBRUARY_2022_SIGNATURE)] * 20
+
+        self.assertEqual(20 * 42, len(formats.encode_months(formats.OCTET_STREAM, months)))
+        self.assertEqual(b"\xdc\x00\x14\x96", formats.encode_months(formats.MSGPACK, months)[:4])
+        self.assertEqual(b"\x92\x96", formats.encode_months(formats.MSGPACK, months[:2])[:2])
+        self.assertEqual(20, len(json.loads(formats.encode_months(formats.COMPACT_JSON, months))))
+
+
+if __name__ == "__main__":
+    unittest.main()
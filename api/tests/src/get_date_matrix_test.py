@@ -1,11 +1,46 @@
+import calendar
+import json
+import os
+import tempfile
+import time
+import tracemalloc
 import unittest
+from types import MappingProxyType
 from unittest.mock import patch
 
+from api.src import formats
+from api.src import get_date_matrix as get_date_matrix_module
+from api.src.calendar_table import CalendarTable
+from api.src.constants import DAY, Date, Layout
 from api.src.exceptions import InvalidDateFormat
-from api.src.get_date_matrix import get_date_matrix
+from api.src.get_date_matrix import (
+    build_calendar_table,
+    get_date_matrices,
+    get_date_matrix,
+    get_date_matrix_json,
+    get_month_matrix_body,
+    get_month_matrix_json,
+    get_month_range_body,
+    get_month_range_matrices,
+    get_year_body,
+    get_year_matrices,
+    interned_grid_entries,
+    interned_month_bodies,
+    interned_month_entries,
+    iter_month_range_lines,
+    iter_month_range_matrices,
+    month_cache,
+    np,
+    stream_month_range_matrices,
+    warm_up,
+)
 
 
 class GetDateMatrixTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
     @patch("api.src.get_date_matrix.utils")
     def test_getDateMatrix_should_raise_exception_for_invalid_date(self, stub_utils):
         dummy_date = "2022-13-15"  # Invalid month 13
@@ -17,8 +52,8 @@ class GetDateMatrixTest(unittest.TestCase):
     @patch("api.src.get_date_matrix.utils")
     def test_getDateMatrix_should_return_expected_date_matrix(self, stub_utils):
         dummy_date = "2022-02-28"
-        # The code in get_date_matrix.py makes date as 1, so this value wouldn't be the actual different between dummy_date and PIVOT_DATE
-        stub_utils.num_days_between_dates.return_value = 98373
+        stub_utils.date_validator.return_value = Date(2022, 2, 28)
+        stub_utils.first_weekday_of_month.return_value = 2
         stub_utils.get_actual_days_in_month.side_effect = [31, 28]
         expected_value = [
             [30, 31, 1, 2, 3, 4, 5],
@@ -36,8 +71,8 @@ class GetDateMatrixTest(unittest.TestCase):
     @patch("api.src.get_date_matrix.utils")
     def test_getDateMatrix_should_return_expected_date_matrix_for_leap_month(self, stub_utils):
         dummy_date = "2020-02-28"
-        # The code in get_date_matrix.py makes date as 1, so this value wouldn't be the actual different between dummy_date and PIVOT_DATE
-        stub_utils.num_days_between_dates.return_value = 97642
+        stub_utils.date_validator.return_value = Date(2020, 2, 28)
+        stub_utils.first_weekday_of_month.return_value = 6
         stub_utils.get_actual_days_in_month.side_effect = [31, 29]
         expected_value = [
             [26, 27, 28, 29, 30, 31, 1],
@@ -58,8 +93,8 @@ class GetDateMatrixTest(unittest.TestCase):
         stub_utils,
     ):
         dummy_date = "2020-03-28"
-        # The code in get_date_matrix.py makes date as 1, so this value wouldn't be the actual different between dummy_date and PIVOT_DATE
-        stub_utils.num_days_between_dates.return_value = 97671
+        stub_utils.date_validator.return_value = Date(2020, 3, 28)
+        stub_utils.first_weekday_of_month.return_value = 0
         stub_utils.get_actual_days_in_month.side_effect = [29, 31]
         expected_value = [
             [1, 2, 3, 4, 5, 6, 7],
@@ -77,8 +112,8 @@ class GetDateMatrixTest(unittest.TestCase):
     @patch("api.src.get_date_matrix.utils")
     def test_getDateMatrix_should_return_expected_date_matrix_for_a_random_date(self, stub_utils):
         dummy_date = "2385-07-07"
-        # The code in get_date_matrix.py makes date as 1, so this value wouldn't be the actual different between dummy_date and PIVOT_DATE
-        stub_utils.num_days_between_dates.return_value = 231106
+        stub_utils.date_validator.return_value = Date(2385, 7, 7)
+        stub_utils.first_weekday_of_month.return_value = 1
         stub_utils.get_actual_days_in_month.side_effect = [30, 31]
         expected_value = [
             [30, 1, 2, 3, 4, 5, 6],
@@ -93,6 +128,414 @@ class GetDateMatrixTest(unittest.TestCase):
 
         self.assertEqual(expected_value, actual_value)
 
+    def test_getDateMatrix_should_fill_december_of_previous_year_for_january(self):
+        dummy_date = "2022-01-31"
+        expected_value = [
+            [26, 27, 28, 29, 30, 31, 1],
+            [2, 3, 4, 5, 6, 7, 8],
+            [9, 10, 11, 12, 13, 14, 15],
+            [16, 17, 18, 19, 20, 21, 22],
+            [23, 24, 25, 26, 27, 28, 29],
+            [30, 31, 1, 2, 3, 4, 5],
+        ]
+
+        actual_value = get_date_matrix(dummy_date)
+
+        self.assertEqual(expected_value, actual_value)
+
+    @patch("api.src.get_date_matrix.utils")
+    def test_getDateMatrix_should_compute_a_month_only_once(self, stub_utils):
+        stub_utils.date_validator.side_effect = [Date(2022, 2, 1), Date(2022, 2, 28)]
+        stub_utils.first_weekday_of_month.return_value = 2
+        stub_utils.get_actual_days_in_month.side_effect = [31, 28]
+
+        first_value = get_date_matrix("2022-02-01")
+        second_value = get_date_matrix("2022-02-28")
+
+        self.assertEqual(first_value, second_value)
+        stub_utils.first_weekday_of_month.assert_called_once()
+        self.assertEqual(1, month_cache.hits)
+        self.assertEqual(1, month_cache.misses)
+
+    @patch("api.src.get_date_matrix.utils")
+    def test_getDateMatrix_should_not_allow_modifying_cached_matrix(self, stub_utils):
+        stub_utils.date_validator.return_value = Date(2022, 2, 1)
+        stub_utils.first_weekday_of_month.return_value = 2
+        stub_utils.get_actual_days_in_month.side_effect = [31, 28]
+
+        get_date_matrix("2022-02-01")[0][0] = -1
+
+        self.assertEqual(30, get_date_matrix("2022-02-01")[0][0])
+
+    @patch("api.src.get_date_matrix.utils")
+    def test_getDateMatrixJson_should_return_serialized_date_matrix(self, stub_utils):
+        stub_utils.date_validator.return_value = Date(2022, 2, 28)
+        stub_utils.first_weekday_of_month.return_value = 2
+        stub_utils.get_actual_days_in_month.side_effect = [31, 28]
+        expected_value = b"[[30, 31, 1, 2, 3, 4, 5], [6, 7, 8, 9, 10, 11, 12], [13, 14, 15, 16, 17, 18, 19], [20, 21, 22, 23, 24, 25, 26], [27, 28, 1, 2, 3, 4, 5], [6, 7, 8, 9, 10, 11, 12]]"
+
+        actual_value = get_date_matrix_json("2022-02-28")
+
+        self.assertEqual(expected_value, actual_value)
+        self.assertIs(actual_value, get_date_matrix_json("2022-02-01"))
+
+
+class GetDateMatricesTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
+    def test_getDateMatrices_should_return_date_matrix_per_date(self):
+        actual_value = get_date_matrices(["2022-02-28", "2022-01-31"])
+
+        self.assertEqual(["2022-02-28", "2022-01-31"], [result["date"] for result in actual_value])
+        self.assertEqual(get_date_matrix("2022-02-28"), [list(row) for row in actual_value[0]["matrix"]])
+        self.assertEqual(get_date_matrix("2022-01-31"), [list(row) for row in actual_value[1]["matrix"]])
+
+    def test_getDateMatrices_should_report_invalid_date_inline(self):
+        actual_value = get_date_matrices(["2022-13-01", "2022-02-28"])
+
+        self.assertEqual("2022-13-01", actual_value[0]["date"])
+        self.assertIn("error", actual_value[0])
+        self.assertNotIn("matrix", actual_value[0])
+        self.assertIn("matrix", actual_value[1])
+
+    @patch("api.src.get_date_matrix.month_cache")
+    def test_getDateMatrices_should_compute_each_month_only_once(self, stub_month_cache):
+        stub_month_cache.get_or_compute.return_value = ((), b"")
+
+        get_date_matrices(["2022-02-01", "2022-02-15", "2022-02-28", "2022-03-01"])
+
+        self.assertEqual(2, stub_month_cache.get_or_compute.call_count)
+
+
+class GetMonthRangeMatricesTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
+    def test_getMonthRangeMatrices_should_return_every_month_of_range(self):
+        actual_value = get_month_range_matrices("2021-11", "2022-02")
+
+        self.assertEqual(["2021-11", "2021-12", "2022-01", "2022-02"], [result["month"] for result in actual_value])
+        self.assertEqual(get_date_matrix("2022-01-01"), [list(row) for row in actual_value[2]["matrix"]])
+
+    def test_getMonthRangeMatrices_should_raise_exception_for_reversed_range(self):
+        with self.assertRaises(InvalidDateFormat):
+            get_month_range_matrices("2022-02", "2021-11")
+
+    def test_getMonthRangeMatrices_should_raise_exception_for_invalid_month(self):
+        with self.assertRaises(InvalidDateFormat):
+            get_month_range_matrices("2022-13", "2023-01")
+
+    @patch("api.src.get_date_matrix.config")
+    def test_getMonthRangeMatrices_should_raise_exception_for_too_long_range(self, stub_config):
+        stub_config.MAX_RANGE_MONTHS = 3
+
+        with self.assertRaises(InvalidDateFormat):
+            get_month_range_matrices("2021-11", "2022-02")
+
+
+class StreamMonthRangeMatricesTest(unittest.TestCase):
+    def test_streamMonthRangeMatrices_should_yield_a_json_line_per_month(self):
+        actual_value = list(stream_month_range_matrices("2019-11", "2022-02"))
+
+        self.assertEqual(28, len(actual_value))
+        self.assertTrue(all(line.endswith(b"\n") for line in actual_value))
+        self.assertEqual(json.loads(json.dumps(get_month_range_matrices("2019-11", "2022-02"))), [json.loads(line) for line in actual_value])
+
+    def test_streamMonthRangeMatrices_should_allow_every_month_up_to_year_9999(self):
+        actual_value = stream_month_range_matrices("1752-10", "9999-12")
+
+        self.assertEqual({"month": "1752-10", "matrix": get_date_matrix("1752-10-01")}, json.loads(next(actual_value)))
+
+    def test_streamMonthRangeMatrices_should_raise_exception_for_range_exceeding_limit(self):
+        with self.assertRaises(InvalidDateFormat):
+            stream_month_range_matrices("1752-10", "99999999-12")
+
+    def test_streamMonthRangeMatrices_should_raise_exception_before_streaming_for_invalid_range(self):
+        with self.assertRaises(InvalidDateFormat):
+            stream_month_range_matrices("2022-02", "2021-11")
+
+
+class IterMonthRangeLinesTest(unittest.TestCase):
+    def test_iterMonthRangeLines_should_yield_same_lines_as_stream(self):
+        self.assertEqual(list(stream_month_range_matrices("2019-11", "2022-02")), list(iter_month_range_lines("2019-11", "2022-02")))
+
+    @patch("api.src.get_date_matrix.config")
+    def test_iterMonthRangeLines_should_not_limit_length_of_range(self, stub_config):
+        stub_config.MAX_STREAM_MONTHS = 1
+
+        actual_value = list(iter_month_range_lines("2022-01", "2022-02"))
+
+        self.assertEqual(2, len(actual_value))
+
+
+class IterMonthRangeMatricesTest(unittest.TestCase):
+    def test_iterMonthRangeMatrices_should_yield_every_month_without_touching_month_cache(self):
+        month_cache.clear()
+        expected_value = [(year, month, get_date_matrix(f"{year}-{month}-01")) for year, month in ((1999, 11), (1999, 12), (2000, 1), (2000, 2))]
+        month_cache.clear()
+
+        actual_value = [(year, month, [list(row) for row in date_matrix]) for year, month, date_matrix in iter_month_range_matrices("1999-11", "2000-02")]
+
+        self.assertEqual(expected_value, actual_value)
+        self.assertEqual(0, len(month_cache))
+
+    def test_iterMonthRangeMatrices_should_raise_exception_for_invalid_range(self):
+        with self.assertRaises(InvalidDateFormat):
+            iter_month_range_matrices("2000-02", "1999-11")
+
+
+@patch("api.src.get_date_matrix.warm_month_entries", MappingProxyType({}))
+class WarmUpTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
+    def test_warmUp_should_precompute_every_month_of_the_window(self):
+        current_year = time.gmtime().tm_year
+
+        warm_up(1)
+
+        self.assertEqual(36, len(get_date_matrix_module.warm_month_entries))
+        self.assertIn((current_year - 1, 1), get_date_matrix_module.warm_month_entries)
+        self.assertIn((current_year + 1, 12), get_date_matrix_module.warm_month_entries)
+
+    def test_warmUp_should_serve_warmed_months_without_touching_month_cache(self):
+        warm_up(0)
+        current_year = time.gmtime().tm_year
+
+        get_date_matrix(f"{current_year}-02-01")
+
+        self.assertEqual(0, month_cache.hits + month_cache.misses)
+
+    def test_warmUp_should_keep_table_read_only(self):
+        warm_up(0)
+
+        with self.assertRaises(TypeError):
+            get_date_matrix_module.warm_month_entries[(1, 1)] = ((), b"")
+
+    def test_warmUp_should_leave_tracing_enabled_by_operator_running(self):
+        tracemalloc.start()
+        try:
+            warm_up(0)
+
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+        warm_up(0)
+
+        self.assertFalse(tracemalloc.is_tracing())
+
+    @patch("api.src.get_date_matrix.time")
+    def test_warmUp_should_skip_months_before_pivot_date(self, stub_time):
+        stub_time.gmtime.return_value.tm_year = 1753
+        stub_time.perf_counter.return_value = 0.0
+
+        warm_up(1)
+
+        self.assertEqual(3 + 12 + 12, len(get_date_matrix_module.warm_month_entries))
+        self.assertNotIn((1752, 9), get_date_matrix_module.warm_month_entries)
+
+
+class InternedMonthEntriesTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
+    def test_getDateMatrixJson_should_share_interned_json_between_months_of_same_signature(self):
+        # February 2010 and February 2021 both begin on Monday after a January of 31 days
+        first_value = get_date_matrix_json("2010-02-01")
+        second_value = get_date_matrix_json("2021-02-15")
+
+        self.assertIs(first_value, second_value)
+        self.assertEqual(2, len(month_cache))
+        self.assertEqual(1, len(interned_month_entries))
+
+    def test_getDateMatrixJson_should_intern_few_dozen_entries_for_whole_cycle(self):
+        for year in range(2000, 2400):
+            for month in range(1, 13):
+                get_date_matrix_json(f"{year}-{month}-01")
+
+        self.assertEqual(49, len(interned_month_entries))
+
+
+class AlternateRepresentationsTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+        interned_month_bodies.clear()
+
+    def test_getMonthMatrixBody_should_intern_body_per_signature(self):
+        first_value = get_month_matrix_body(2010, 2, formats.OCTET_STREAM)
+        second_value = get_month_matrix_body(2021, 2, formats.OCTET_STREAM)
+
+        self.assertIs(first_value, second_value)
+        self.assertEqual([date for row in get_date_matrix("2021-02-01") for date in row], list(second_value))
+
+    def test_getMonthRangeBody_should_encode_every_month_of_range(self):
+        actual_value = get_month_range_body("2021-11", "2022-02", formats.COMPACT_JSON)
+
+        self.assertEqual(
+            [
+                {"start": 1, "days": 30, "prev_days": 31},
+                {"start": 3, "days": 31, "prev_days": 30},
+                {"start": 6, "days": 31, "prev_days": 31},
+                {"start": 2, "days": 28, "prev_days": 31},
+            ],
+            json.loads(actual_value),
+        )
+
+    def test_getMonthRangeBody_should_raise_exception_for_range_exceeding_limit(self):
+        with self.assertRaises(InvalidDateFormat):
+            get_month_range_body("1800-01", "2200-01", formats.OCTET_STREAM)
+
+    def test_getYearBody_should_encode_every_month_of_year(self):
+        actual_value = get_year_body("2022", formats.OCTET_STREAM)
+
+        self.assertEqual([date for month in get_year_matrices("2022") for row in month for date in row], list(actual_value))
+
+
+class LayoutTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+
+    def test_getMonthMatrixJson_should_begin_weeks_on_week_start(self):
+        actual_value = json.loads(get_month_matrix_json(2022, 2, Layout(DAY.MONDAY.value)))
+
+        self.assertEqual([31, 1, 2, 3, 4, 5, 6], actual_value[0])
+        self.assertEqual([28, 1, 2, 3, 4, 5, 6], actual_value[4])
+
+    def test_getMonthMatrixJson_should_match_calendar_module_for_every_week_start(self):
+        for week_start in DAY:
+            # `calendar` counts weekdays from Monday
+            calendar_weeks = calendar.Calendar((week_start.value - 1) % 7).monthdatescalendar(2024, 9)
+            expected_value = [date.day for week in calendar_weeks for date in week]
+
+            actual_value = json.loads(get_month_matrix_json(2024, 9, Layout(week_start.value)))
+
+            self.assertEqual(expected_value, [date for row in actual_value for date in row][: len(expected_value)])
+
+    def test_getMonthMatrixJson_should_reuse_interned_entry_of_rotated_signature(self):
+        # February 2022 begins on Tuesday, the second column of weeks beginning on Monday, like February 2010 does of
+        # weeks beginning on Sunday
+        expected_value = get_month_matrix_json(2010, 2)
+
+        actual_value = get_month_matrix_json(2022, 2, Layout(DAY.MONDAY.value))
+
+        self.assertIs(expected_value, actual_value)
+        self.assertEqual(1, len(interned_month_entries))
+        self.assertEqual(2, len(month_cache))
+
+    def test_getMonthMatrixJson_should_prepend_iso_week_numbers(self):
+        actual_value = json.loads(get_month_matrix_json(2021, 1, Layout(DAY.MONDAY.value, True)))
+
+        self.assertEqual([53, 28, 29, 30, 31, 1, 2, 3], actual_value[0])
+        self.assertEqual([1, 4, 5, 6, 7, 8, 9, 10], actual_value[1])
+        self.assertEqual([5, 1, 2, 3, 4, 5, 6, 7], actual_value[5])
+
+    def test_getMonthMatrixJson_should_trim_rows_of_only_next_month(self):
+        # February 2015 begins on Sunday and fits in 4 weeks, May 2021 begins on Saturday and needs all 6 weeks
+        self.assertEqual(
+            [[1, 2, 3, 4, 5, 6, 7], [8, 9, 10, 11, 12, 13, 14], [15, 16, 17, 18, 19, 20, 21], [22, 23, 24, 25, 26, 27, 28]],
+            json.loads(get_month_matrix_json(2015, 2, Layout(trim_rows=True))),
+        )
+        self.assertEqual(5, len(json.loads(get_month_matrix_json(2015, 2, Layout(DAY.MONDAY.value, trim_rows=True)))))
+        self.assertEqual(json.loads(get_month_matrix_json(2021, 5)), json.loads(get_month_matrix_json(2021, 5, Layout(trim_rows=True))))
+
+    def test_getMonthMatrixJson_should_prepend_iso_week_numbers_to_trimmed_rows(self):
+        actual_value = json.loads(get_month_matrix_json(2021, 1, Layout(DAY.MONDAY.value, True, True)))
+
+        self.assertEqual(5, len(actual_value))
+        self.assertEqual([4, 25, 26, 27, 28, 29, 30, 31], actual_value[-1])
+
+    def test_getMonthMatrixBody_should_encode_laid_out_date_matrix(self):
+        actual_value = get_month_matrix_body(2022, 2, formats.OCTET_STREAM, Layout(DAY.MONDAY.value))
+
+        self.assertEqual([31, 1, 2, 3, 4, 5, 6], list(actual_value[:7]))
+        self.assertEqual({"start": 1, "days": 28, "prev_days": 31}, json.loads(get_month_matrix_body(2022, 2, formats.COMPACT_JSON, Layout(DAY.MONDAY.value))))
+
+
+class CalendarTableLookupTest(unittest.TestCase):
+    def setUp(self):
+        month_cache.clear()
+        interned_month_entries.clear()
+        interned_grid_entries.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        table_path = os.path.join(self.temp_dir.name, "calendar_table.bin")
+        with open(table_path, "wb") as table_file:
+            table_file.write(build_calendar_table())
+        self.table = CalendarTable(table_path)
+
+    def tearDown(self):
+        self.table.close()
+        self.temp_dir.cleanup()
+        month_cache.clear()
+        interned_month_entries.clear()
+        interned_grid_entries.clear()
+
+    def test_getDateMatrix_should_match_computed_date_matrix_when_table_is_loaded(self):
+        dates = [f"{year}-{month}-01" for year in (1752, 1800, 1900, 2000, 2022, 2024, 2399) for month in range(1, 13) if (year, month) >= (1752, 10)]
+        expected_value = [get_date_matrix(date) for date in dates]
+        month_cache.clear()
+        interned_month_entries.clear()
+
+        with patch("api.src.calendar_table.loaded_table", self.table):
+            actual_value = [get_date_matrix(date) for date in dates]
+
+        self.assertEqual(expected_value, actual_value)
+
+    @patch("api.src.get_date_matrix.utils")
+    def test_getDateMatrix_should_not_compute_date_matrix_when_table_is_loaded(self, stub_utils):
+        stub_utils.date_validator.return_value = Date(2022, 2, 28)
+
+        with patch("api.src.calendar_table.loaded_table", self.table):
+            actual_value = get_date_matrix("2022-02-28")
+
+        self.assertEqual([30, 31, 1, 2, 3, 4, 5], actual_value[0])
+        stub_utils.first_weekday_of_month.assert_not_called()
+        stub_utils.get_actual_days_in_month.assert_not_called()
+
+    def test_getDateMatrixJson_should_serve_interned_grids_of_table_when_table_is_loaded(self):
+        with patch("api.src.calendar_table.loaded_table", self.table):
+            first_value = get_date_matrix_json("2010-02-01")
+            second_value = get_date_matrix_json("2021-02-15")
+
+        self.assertIs(first_value, second_value)
+        self.assertEqual(1, len(interned_grid_entries))
+        self.assertEqual(0, len(interned_month_entries))
+
+
+class GetYearMatricesTest(unittest.TestCase):
+    def test_getYearMatrices_should_return_date_matrix_of_every_month(self):
+        for year in ("1753", "2020", "2022", "2100"):
+            expected_value = [get_date_matrix(f"{year}-{month}-01") for month in range(1, 13)]
+
+            actual_value = get_year_matrices(year)
+
+            self.assertEqual(expected_value, actual_value)
+
+    @patch("api.src.get_date_matrix.np", None)
+    def test_getYearMatrices_should_return_date_matrix_of_every_month_without_numpy(self):
+        expected_value = [get_date_matrix(f"2020-{month}-01") for month in range(1, 13)]
+
+        actual_value = get_year_matrices("2020")
+
+        self.assertEqual(expected_value, actual_value)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_getYearMatrices_should_return_plain_integers_with_numpy(self):
+        actual_value = get_year_matrices("2020")
+
+        self.assertIs(int, type(actual_value[0][0][0]))
+
+    def test_getYearMatrices_should_raise_exception_for_year_before_pivot_date(self):
+        with self.assertRaises(InvalidDateFormat):
+            get_year_matrices("1752")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from api.src.gunicorn_conf import (
+    child_exit,
+    on_exit,
+    on_starting,
+    post_worker_init,
+    worker_exit,
+)
+from api.src.initializer import app_ready
+
+
+@patch("api.src.metrics.start_flusher")
+@patch("api.src.calendar_table.load_table")
+@patch("api.src.get_date_matrix.warm_up")
+@patch("api.src.gunicorn_conf.app_config")
+class GunicornConfTest(unittest.TestCase):
+    def setUp(self):
+        app_ready.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.metrics_dir = os.path.join(self.temp_dir.name, "metrics")
+
+    def tearDown(self):
+        app_ready.set()
+        self.temp_dir.cleanup()
+
+    def test_onStarting_should_remove_stale_metrics_snapshots_of_configured_dir(self, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        os.makedirs(self.metrics_dir)
+        with open(os.path.join(self.metrics_dir, "1.json"), "w") as snapshot_file:
+            snapshot_file.write("{}")
+        stub_config.METRICS_DIR = self.metrics_dir
+        stub_config.PRELOAD = False
+
+        on_starting(None)
+
+        self.assertEqual([], os.listdir(self.metrics_dir))
+
+    def test_onStarting_should_create_temporary_metrics_dir_and_onExit_should_remove_it(self, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        stub_config.METRICS_DIR = None
+        stub_config.PRELOAD = False
+
+        on_starting(None)
+        metrics_dir = stub_config.METRICS_DIR
+        self.assertTrue(os.path.isdir(metrics_dir))
+        on_exit(None)
+
+        self.assertFalse(os.path.exists(metrics_dir))
+
+    def test_onStarting_should_warm_up_in_master_when_preloaded(self, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        stub_config.METRICS_DIR = self.metrics_dir
+        stub_config.PRELOAD = True
+        stub_config.WARMUP_YEARS = 3
+
+        on_starting(None)
+        post_worker_init(None)
+
+        stub_load_table.assert_called_once_with(stub_config.CALENDAR_TABLE_PATH)
+        stub_warm_up.assert_called_once_with(3)
+        self.assertTrue(app_ready.is_set())
+
+    def test_postWorkerInit_should_warm_up_in_worker_when_not_preloaded(self, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        stub_config.METRICS_DIR = self.metrics_dir
+        stub_config.PRELOAD = False
+        stub_config.WARMUP_YEARS = 3
+
+        on_starting(None)
+        self.assertFalse(app_ready.is_set())
+        post_worker_init(None)
+
+        stub_load_table.assert_called_once_with(stub_config.CALENDAR_TABLE_PATH)
+        stub_warm_up.assert_called_once_with(3)
+        self.assertTrue(app_ready.is_set())
+        stub_start_flusher.assert_called_once_with()
+
+    @patch("api.src.metrics.flush")
+    def test_workerExit_should_flush_metrics(self, stub_flush, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        worker_exit(None, None)
+
+        stub_flush.assert_called_once_with(force=True)
+
+    def test_childExit_should_mark_snapshots_of_exited_worker(self, stub_config, stub_warm_up, stub_load_table, stub_start_flusher):
+        os.makedirs(self.metrics_dir)
+        for snapshot_name in ("12-a.json", "123-b.json"):
+            with open(os.path.join(self.metrics_dir, snapshot_name), "w") as snapshot_file:
+                snapshot_file.write("{}")
+        stub_config.METRICS_DIR = self.metrics_dir
+
+        child_exit(None, SimpleNamespace(pid=12))
+
+        self.assertEqual(["123-b.json", "exited-12-a.json"], sorted(os.listdir(self.metrics_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+
+from api.src import formats
+from api.src.constants import DAY, Layout
+from api.src.http_utils import (
+    etag_matches,
+    immutable_cache_control,
+    is_canonical_month_request,
+    layout_query_args,
+    layout_query_string,
+    month_etag,
+    month_path,
+    negotiated_media_type,
+)
+
+
+class HttpUtilsTest(unittest.TestCase):
+    def test_monthEtag_should_be_zero_padded_and_versioned(self):
+        self.assertEqual("v1-2024-05", month_etag(2024, 5))
+
+    def test_monthEtag_should_differ_per_representation(self):
+        self.assertEqual("v1-2024-05", month_etag(2024, 5, formats.JSON))
+        self.assertEqual("v1-2024-05-bin", month_etag(2024, 5, formats.OCTET_STREAM))
+        self.assertEqual("v1-2024-05-msgpack", month_etag(2024, 5, formats.MSGPACK))
+        self.assertEqual("v1-2024-05-compact", month_etag(2024, 5, formats.COMPACT_JSON))
+
+    def test_monthEtag_should_differ_per_layout(self):
+        self.assertEqual("v1-2024-05", month_etag(2024, 5, formats.JSON, Layout()))
+        self.assertEqual("v1-2024-05-mon", month_etag(2024, 5, formats.JSON, Layout(DAY.MONDAY.value)))
+        self.assertEqual("v1-2024-05-wk-bin", month_etag(2024, 5, formats.OCTET_STREAM, Layout(week_numbers=True)))
+        self.assertEqual("v1-2024-05-sat-wk-trim", month_etag(2024, 5, formats.JSON, Layout(DAY.SATURDAY.value, True, True)))
+
+    def test_etagMatches_should_use_weak_comparison(self):
+        self.assertTrue(etag_matches('"v1-2024-05"', "v1-2024-05"))
+        self.assertTrue(etag_matches('W/"v1-2024-05"', "v1-2024-05"))
+        self.assertTrue(etag_matches('"v1-2024-04", W/"v1-2024-05"', "v1-2024-05"))
+        self.assertTrue(etag_matches("*", "v1-2024-05"))
+
+    def test_etagMatches_should_not_match_other_or_missing_etags(self):
+        self.assertFalse(etag_matches(None, "v1-2024-05"))
+        self.assertFalse(etag_matches('"v1-2024-05-bin"', "v1-2024-05"))
+
+    def test_monthPath_should_be_zero_padded(self):
+        self.assertEqual("/month/2024/05", month_path(2024, 5))
+
+    def test_monthPath_should_carry_query_parameters_of_non_default_layout(self):
+        self.assertEqual("/month/2024/05", month_path(2024, 5, Layout()))
+        self.assertEqual("/month/2024/05?week_start=monday&week_numbers=true&trim_rows=true", month_path(2024, 5, Layout(DAY.MONDAY.value, True, True)))
+
+    def test_layoutQueryArgs_should_only_carry_non_default_parts(self):
+        self.assertEqual({}, layout_query_args(Layout()))
+        self.assertEqual({"week_start": "saturday", "trim_rows": "true"}, layout_query_args(Layout(DAY.SATURDAY.value, trim_rows=True)))
+
+    def test_isCanonicalMonthRequest_should_compare_raw_path_and_query_string(self):
+        monday_layout = Layout(DAY.MONDAY.value)
+
+        self.assertTrue(is_canonical_month_request("2024", "05", "", 2024, 5, Layout()))
+        self.assertTrue(is_canonical_month_request("2024", "05", "week_start=monday", 2024, 5, monday_layout))
+        self.assertFalse(is_canonical_month_request("2024", "5", "", 2024, 5, Layout()))
+        self.assertFalse(is_canonical_month_request("2024", "05", "week_start=sunday", 2024, 5, Layout()))
+        self.assertFalse(is_canonical_month_request("2024", "05", "week_start=Monday", 2024, 5, monday_layout))
+
+    def test_layoutQueryString_should_encode_non_default_parts_in_fixed_order(self):
+        self.assertEqual("", layout_query_string(Layout()))
+        self.assertEqual("week_start=monday&trim_rows=true", layout_query_string(Layout(DAY.MONDAY.value, trim_rows=True)))
+
+    def test_negotiatedMediaType_should_pick_best_accepted_representation(self):
+        self.assertEqual(formats.JSON, negotiated_media_type(None))
+        self.assertEqual(formats.JSON, negotiated_media_type("text/html"))
+        self.assertEqual(formats.OCTET_STREAM, negotiated_media_type("application/json;q=0.5, application/octet-stream"))
+        self.assertEqual(formats.MSGPACK, negotiated_media_type("application/x-msgpack"))
+
+    @patch("api.src.http_utils.config")
+    def test_immutableCacheControl_should_use_configured_max_age(self, stub_config):
+        stub_config.HTTP_CACHE_MAX_AGE = 60
+
+        self.assertEqual("public, max-age=60, immutable", immutable_cache_control())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from api.src import metrics
+
+
+@patch.dict("api.src.metrics._stage_latencies", clear=True)
+@patch.dict("api.src.metrics._request_latencies", clear=True)
+@patch.dict("api.src.metrics._request_counts", clear=True)
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch("api.src.metrics.config")
+    def test_render_should_expose_status_counts_and_cumulative_histograms(self, stub_config):
+        stub_config.METRICS_DIR = None
+        metrics.observe_request("/date/<date>", 200, 0.0002)
+        metrics.observe_request("/date/<date>", 200, 0.003)
+        metrics.observe_request("/date/<date>", 400, 10.0)
+
+        actual_value = metrics.render()
+
+        self.assertIn('calendar_http_requests_total{route="/date/<date>",status="200"} 2', actual_value)
+        self.assertIn('calendar_http_requests_total{route="/date/<date>",status="400"} 1', actual_value)
+        self.assertIn('calendar_http_request_duration_seconds_bucket{route="/date/<date>",le="0.00025"} 1', actual_value)
+        self.assertIn('calendar_http_request_duration_seconds_bucket{route="/date/<date>",le="0.005"} 2', actual_value)
+        self.assertIn('calendar_http_request_duration_seconds_bucket{route="/date/<date>",le="+Inf"} 3', actual_value)
+        self.assertIn('calendar_http_request_duration_seconds_count{route="/date/<date>"} 3', actual_value)
+        self.assertIn("# TYPE calendar_month_cache_hits_total counter", actual_value)
+
+    @patch("api.src.metrics.config")
+    def test_timedStage_should_record_stage_even_on_exception(self, stub_config):
+        stub_config.METRICS_DIR = None
+
+        with self.assertRaises(ValueError):
+            with metrics.timed_stage("validation"):
+                raise ValueError("unittest-exception")
+
+        self.assertIn('calendar_stage_duration_seconds_count{stage="validation"} 1', metrics.render())
+
+    @patch("api.src.metrics.config")
+    def test_render_should_aggregate_snapshots_of_other_processes(self, stub_config):
+        stub_config.METRICS_DIR = self.temp_dir.name
+        stub_config.METRICS_FLUSH_INTERVAL = 1.0
+        metrics.observe_request("/year/<year>", 200, 0.001)
+        metrics.flush(force=True)
+        with open(metrics._snapshot_path()) as snapshot_file:
+            other_snapshot = json.load(snapshot_file)
+        with open(os.path.join(self.temp_dir.name, "1.json"), "w") as snapshot_file:
+            json.dump(other_snapshot, snapshot_file)
+        with open(os.path.join(self.temp_dir.name, "2.json"), "w") as snapshot_file:
+            snapshot_file.write("{partial")
+
+        actual_value = metrics.render()
+
+        self.assertIn('calendar_http_requests_total{route="/year/<year>",status="200"} 2', actual_value)
+
+    @patch("api.src.metrics.config")
+    def test_flush_should_write_at_most_once_per_interval(self, stub_config):
+        stub_config.METRICS_DIR = self.temp_dir.name
+        stub_config.METRICS_FLUSH_INTERVAL = 3600.0
+        snapshot_path = metrics._snapshot_path()
+
+        metrics.flush(force=True)
+        metrics.observe_request("/year/<year>", 200, 0.001)
+        os.remove(snapshot_path)
+        metrics.flush()
+
+        self.assertFalse(os.path.exists(snapshot_path))
+
+    @patch("api.src.metrics._last_flush", 0.0)
+    @patch("api.src.metrics.config")
+    def test_flush_should_only_write_unflushed_metrics(self, stub_config):
+        stub_config.METRICS_DIR = self.temp_dir.name
+        stub_config.METRICS_FLUSH_INTERVAL = 0.0
+        snapshot_path = metrics._snapshot_path()
+
+        metrics.observe_request("/year/<year>", 200, 0.001)
+        metrics.flush()
+        self.assertTrue(os.path.exists(snapshot_path))
+        os.remove(snapshot_path)
+        metrics.flush()
+
+        self.assertFalse(os.path.exists(snapshot_path))
+
+    @patch("api.src.metrics.config")
+    def test_snapshotPath_should_differ_per_process_even_for_recycled_pid(self, stub_config):
+        stub_config.METRICS_DIR = self.temp_dir.name
+
+        snapshot_path = metrics._snapshot_path()
+        with patch("api.src.metrics._snapshot_name", None):
+            recycled_snapshot_path = metrics._snapshot_path()
+
+        self.assertEqual(snapshot_path, metrics._snapshot_path())
+        self.assertTrue(os.path.basename(snapshot_path).startswith(f"{os.getpid()}-"))
+        self.assertTrue(os.path.basename(recycled_snapshot_path).startswith(f"{os.getpid()}-"))
+        self.assertNotEqual(snapshot_path, recycled_snapshot_path)
+
+    @patch("api.src.metrics.get_date_matrix")
+    @patch("api.src.metrics.config")
+    def test_render_should_keep_counters_but_not_gauges_of_exited_processes(self, stub_config, stub_get_date_matrix):
+        stub_config.METRICS_DIR = self.temp_dir.name
+        stub_get_date_matrix.month_cache.stats.return_value = {"hits": 1, "size": 2, "max_size": 10}
+        exited_snapshot = {"requests": {}, "latencies": {}, "stages": {}, "month_cache": {"hits": 5, "size": 8, "max_size": 10}}
+        with open(os.path.join(self.temp_dir.name, f"{metrics.EXITED_SNAPSHOT_PREFIX}1-0.json"), "w") as snapshot_file:
+            json.dump(exited_snapshot, snapshot_file)
+
+        actual_value = metrics.render()
+
+        self.assertIn("calendar_month_cache_hits_total 6", actual_value)
+        self.assertIn("calendar_month_cache_size 2", actual_value)
+        self.assertIn("calendar_month_cache_max_size 10", actual_value)
+
+    @patch("api.src.metrics.time.sleep", side_effect=[None, StopIteration])
+    @patch("api.src.metrics.flush")
+    @patch("api.src.metrics.config")
+    def test_flushPeriodically_should_flush_unflushed_metrics(self, stub_config, stub_flush, stub_sleep):
+        metrics.observe_request("/year/<year>", 200, 0.001)
+
+        with self.assertRaises(StopIteration):
+            metrics._flush_periodically()
+
+        stub_sleep.assert_called_with(stub_config.METRICS_FLUSH_INTERVAL)
+        stub_flush.assert_called_once_with(force=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import glob
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from api.src import profiling
+from api.src.utils import is_leap_year
+
+
+@patch("api.src.profiling.config")
+class ProfilingTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _configure(self, stub_config, enabled=True, sample_rate=1.0, slow_threshold=0.0, max_files=100):
+        stub_config.PROFILING_ENABLED = enabled
+        stub_config.PROFILE_SAMPLE_RATE = sample_rate
+        stub_config.PROFILE_SLOW_THRESHOLD = slow_threshold
+        stub_config.PROFILE_DIR = self.temp_dir.name
+        stub_config.PROFILE_MAX_FILES = max_files
+
+    def _profile_request(self, duration):
+        profiler = profiling.start()
+        is_leap_year(2024)
+        profiling.stop(profiler, "/date/<date>", duration)
+
+    def test_start_should_not_profile_when_disabled_or_not_sampled(self, stub_config):
+        self._configure(stub_config, enabled=False)
+        self.assertIsNone(profiling.start())
+
+        self._configure(stub_config, sample_rate=0.0)
+        self.assertIsNone(profiling.start())
+
+    def test_stop_should_dump_profile_of_slow_request_only(self, stub_config):
+        self._configure(stub_config, slow_threshold=0.5)
+
+        self._profile_request(0.1)
+        self.assertEqual([], glob.glob(os.path.join(self.temp_dir.name, "*.prof")))
+        self._profile_request(0.6)
+
+        profile_paths = glob.glob(os.path.join(self.temp_dir.name, "*.prof"))
+        self.assertEqual(1, len(profile_paths))
+        self.assertIn("date_date", profile_paths[0])
+
+    def test_stop_should_keep_only_latest_profiles(self, stub_config):
+        self._configure(stub_config, max_files=2)
+
+        for _ in range(4):
+            self._profile_request(0.1)
+
+        self.assertEqual(2, len(glob.glob(os.path.join(self.temp_dir.name, "*.prof"))))
+
+    def test_topFunctions_should_aggregate_captured_profiles(self, stub_config):
+        self._configure(stub_config)
+        for _ in range(3):
+            self._profile_request(0.1)
+
+        actual_value = profiling.top_functions(50, "tottime")
+
+        self.assertEqual(3, actual_value["profiles"])
+        is_leap_year_stats = [function for function in actual_value["functions"] if function["function"].endswith("(is_leap_year)")]
+        self.assertEqual(3, is_leap_year_stats[0]["calls"])
+
+    def test_topFunctions_should_return_nothing_without_profiles(self, stub_config):
+        self._configure(stub_config)
+
+        self.assertEqual({"profiles": 0, "functions": []}, profiling.top_functions(10))
+
+    def test_topFunctions_should_raise_exception_for_unknown_sort_key(self, stub_config):
+        self._configure(stub_config)
+
+        with self.assertRaises(ValueError):
+            profiling.top_functions(10, "calls")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from api.src.get_date_matrix import get_date_matrix
+from api.src.scripts.export_calendars import chunk_ranges, export, export_chunk
+
+
+class _InlineExecutor:
+    """Executor running tasks on submission, recording the most results submitted but not yet taken at once"""
+
+    def __init__(self, max_workers: int):
+        self.num_submitted = 0
+        self.num_in_flight = 0
+        self.max_in_flight = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args) -> Future:
+        self.num_submitted += 1
+        self.num_in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.num_in_flight)
+        future = _InlineFuture(self)
+        future.set_result(fn(*args))
+        return future
+
+
+class _InlineFuture(Future):
+    def __init__(self, executor: _InlineExecutor):
+        super().__init__()
+        self.executor = executor
+
+    def result(self, timeout=None):
+        self.executor.num_in_flight -= 1
+        return super().result(timeout)
+
+
+class ExportCalendarsTest(unittest.TestCase):
+    def test_chunkRanges_should_split_years_beginning_from_pivot_month(self):
+        expected_value = [("1752-10", "1801-12"), ("1802-01", "1851-12"), ("1852-01", "1860-12")]
+
+        actual_value = chunk_ranges(1752, 1860, 50)
+
+        self.assertEqual(expected_value, actual_value)
+
+    def test_exportChunk_should_encode_every_format(self):
+        jsonl_value = export_chunk("2022-01", "2022-02", "jsonl")
+        csv_value = export_chunk("2022-01", "2022-02", "csv")
+        bin_value = export_chunk("2022-01", "2022-02", "bin")
+
+        expected_matrix = get_date_matrix("2022-02-01")
+        self.assertEqual({"month": "2022-02", "matrix": expected_matrix}, json.loads(jsonl_value.splitlines()[1]))
+        self.assertEqual(b"2022-02," + ",".join(str(date) for row in expected_matrix for date in row).encode(), csv_value.splitlines()[1])
+        self.assertEqual(bytes(date for row in expected_matrix for date in row), bin_value[42:])
+
+    @patch("api.src.get_date_matrix.config")
+    def test_exportChunk_should_not_limit_jsonl_to_maximum_streamed_months(self, stub_config):
+        stub_config.MAX_STREAM_MONTHS = 1
+
+        actual_value = export_chunk("2022-01", "2022-12", "jsonl")
+
+        self.assertEqual(12, len(actual_value.splitlines()))
+
+    def test_exportChunk_should_raise_exception_for_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_chunk("2022-01", "2022-02", "xml")
+
+    def test_export_should_write_chunks_in_order(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = os.path.join(output_dir, "calendars.jsonl")
+
+            actual_value = export(output_path, 1752, 1760, "jsonl", 2, 2)
+
+            with open(output_path) as output_file:
+                months = [json.loads(line)["month"] for line in output_file]
+        self.assertEqual(3 + 8 * 12, actual_value)
+        self.assertEqual(actual_value, len(months))
+        self.assertEqual("1752-10", months[0])
+        self.assertEqual(sorted(months), months)
+
+    def test_export_should_bound_chunks_in_flight_to_twice_the_workers(self):
+        executors = []
+
+        def inline_executor(max_workers):
+            executors.append(_InlineExecutor(max_workers))
+            return executors[-1]
+
+        with tempfile.TemporaryDirectory() as output_dir, patch("api.src.scripts.export_calendars.ProcessPoolExecutor", inline_executor):
+            output_path = os.path.join(output_dir, "calendars.jsonl")
+
+            actual_value = export(output_path, 1753, 1772, "jsonl", 2, 1)
+
+            with open(output_path) as output_file:
+                months = [json.loads(line)["month"] for line in output_file]
+        self.assertEqual(20 * 12, actual_value)
+        self.assertEqual(sorted(months), months)
+        self.assertEqual(20, executors[0].num_submitted)
+        self.assertEqual(4, executors[0].max_in_flight)
+
+    def test_export_should_write_csv_header(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = os.path.join(output_dir, "calendars.csv")
+
+            export(output_path, 2022, 2022, "csv", 1, 50)
+
+            with open(output_path) as output_file:
+                lines = output_file.read().splitlines()
+        self.assertEqual(43, len(lines[0].split(",")))
+        self.assertEqual(13, len(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+
+from api.src.scripts.run_api import gunicorn_args
+
+
+class GunicornArgsTest(unittest.TestCase):
+    @patch("api.src.scripts.run_api.config")
+    def test_gunicornArgs_should_serve_flask_app_with_configured_parameters(self, stub_config):
+        stub_config.SERVER = "wsgi"
+        stub_config.BIND = "0.0.0.0:8000"
+        stub_config.WORKERS = 9
+        stub_config.WORKER_CLASS = "gthread"
+        stub_config.THREADS = 4
+        stub_config.KEEP_ALIVE = 5
+        stub_config.BACKLOG = 2048
+        stub_config.PRELOAD = True
+        stub_config.RELOAD = False
+        expected_value = [
+            "gunicorn",
+            "--config=python:api.src.gunicorn_conf",
+            "--bind=0.0.0.0:8000",
+            "--workers=9",
+            "--worker-class=gthread",
+            "--threads=4",
+            "--keep-alive=5",
+            "--backlog=2048",
+            "--preload",
+            "api.src.api:flask_app",
+        ]
+
+        actual_value = gunicorn_args()
+
+        self.assertEqual(expected_value, actual_value)
+
+    @patch("api.src.scripts.run_api.config")
+    def test_gunicornArgs_should_reload_without_preload(self, stub_config):
+        stub_config.SERVER = "wsgi"
+        stub_config.WORKER_CLASS = "sync"
+        stub_config.PRELOAD = False
+        stub_config.RELOAD = True
+
+        actual_value = gunicorn_args()
+
+        self.assertIn("--reload", actual_value)
+        self.assertNotIn("--preload", actual_value)
+
+    @patch("api.src.scripts.run_api.config")
+    def test_gunicornArgs_should_serve_asgi_app_on_uvicorn_workers(self, stub_config):
+        stub_config.SERVER = "asgi"
+        stub_config.WORKER_CLASS = "gthread"
+
+        actual_value = gunicorn_args()
+
+        self.assertIn("--worker-class=uvicorn.workers.UvicornWorker", actual_value)
+        self.assertEqual("api.src.asgi:asgi_app", actual_value[-1])
+
+    @patch("api.src.scripts.run_api.config")
+    def test_gunicornArgs_should_raise_exception_for_unsupported_worker_class(self, stub_config):
+        stub_config.SERVER = "wsgi"
+        stub_config.WORKER_CLASS = "eventlet"
+
+        with self.assertRaises(ValueError):
+            gunicorn_args()
+
+    @patch("api.src.scripts.run_api.importlib.util.find_spec")
+    @patch("api.src.scripts.run_api.config")
+    def test_gunicornArgs_should_serve_flask_app_on_gevent_workers_only_if_gevent_is_installed(self, stub_config, stub_find_spec):
+        stub_config.SERVER = "wsgi"
+        stub_config.WORKER_CLASS = "gevent"
+
+        stub_find_spec.return_value = object()
+        self.assertIn("--worker-class=gevent", gunicorn_args())
+        stub_find_spec.return_value = None
+        with self.assertRaises(ValueError):
+            gunicorn_args()
+        stub_find_spec.assert_called_with("gevent")
+
+
+if __name__ == "__main__":
+    unittest.main()
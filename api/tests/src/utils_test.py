@@ -1,14 +1,34 @@
+import datetime
 import unittest
 
-from api.src.constants import MONTH, PIVOT_DATE, Date
+from api.src.constants import (
+    DAY,
+    DEFAULT_LAYOUT,
+    MONTH,
+    PIVOT_DATE,
+    PIVOT_DAY,
+    Date,
+    Layout,
+)
 from api.src.exceptions import InvalidDateFormat
 from api.src.utils import (
+    add_days,
     count_leap_years,
     date_validator,
+    day_ordinal,
+    days_between,
+    first_weekday_of_month,
+    from_ordinal,
     get_actual_days_in_month,
     get_default_days_in_month,
     is_leap_year,
+    iso_week_number,
+    layout_validator,
+    month_validator,
     num_days_between_dates,
+    to_ordinal,
+    weekday,
+    year_validator,
 )
 
 
@@ -44,21 +64,21 @@ class IsLeapYearTest(unittest.TestCase):
 
 class CountLeapYearsTest(unittest.TestCase):
     def test_countLeapYears_should_return_expected_value(self):
-        dummy_date = Date("2022-02-28")
+        dummy_date = Date(2022, 2, 28)
         expected_value = 490
 
         actual_value = count_leap_years(dummy_date)
 
         self.assertEqual(expected_value, actual_value)
 
-        dummy_date = Date("2020-02-29")
+        dummy_date = Date(2020, 2, 29)
         expected_value = 489
 
         actual_value = count_leap_years(dummy_date)
 
         self.assertEqual(expected_value, actual_value)
 
-        dummy_date = Date("2020-03-01")
+        dummy_date = Date(2020, 3, 1)
         expected_value = 490
 
         actual_value = count_leap_years(dummy_date)
@@ -116,8 +136,8 @@ class GetActualDaysInMonthTest(unittest.TestCase):
 
 class NumDaysBetweenDatesTest(unittest.TestCase):
     def test_numDaysBetweenDates_should_return_diff_of_days_between_two_dates(self):
-        dummy_base_date = Date("1752-10-01")
-        dummy_actual_date = Date("2385-07-01")
+        dummy_base_date = Date(1752, 10, 1)
+        dummy_actual_date = Date(2385, 7, 1)
         expected_value = 231106
 
         actual_value = num_days_between_dates(dummy_base_date, dummy_actual_date)
@@ -125,8 +145,8 @@ class NumDaysBetweenDatesTest(unittest.TestCase):
         self.assertEqual(expected_value, actual_value)
 
     def test_numDaysBetweenDates_should_return_diff_of_days_between_two_dates2(self):
-        dummy_base_date = Date("2474-07-09")
-        dummy_actual_date = Date("2700-12-08")
+        dummy_base_date = Date(2474, 7, 9)
+        dummy_actual_date = Date(2700, 12, 8)
         expected_value = 82696
 
         actual_value = num_days_between_dates(dummy_base_date, dummy_actual_date)
@@ -134,12 +154,84 @@ class NumDaysBetweenDatesTest(unittest.TestCase):
         self.assertEqual(expected_value, actual_value)
 
 
+class DayOrdinalTest(unittest.TestCase):
+    def test_dayOrdinal_should_return_1_for_first_day_of_calendar(self):
+        self.assertEqual(1, day_ordinal(1, 1, 1))
+
+    def test_dayOrdinal_should_match_proleptic_gregorian_ordinal(self):
+        for year in (1752, 1800, 1900, 2000, 2020, 2022, 2100, 2385, 2400, 9999):
+            for month in range(1, 13):
+                for day in (1, 28):
+                    self.assertEqual(datetime.date(year, month, day).toordinal(), day_ordinal(year, month, day))
+
+    def test_dayOrdinal_should_count_29th_february_of_leap_year(self):
+        self.assertEqual(1, day_ordinal(2020, 3, 1) - day_ordinal(2020, 2, 29))
+        self.assertEqual(1, day_ordinal(2021, 3, 1) - day_ordinal(2021, 2, 28))
+
+
+class OrdinalArithmeticTest(unittest.TestCase):
+    def test_toOrdinal_should_match_proleptic_gregorian_ordinal(self):
+        self.assertEqual(datetime.date(2024, 2, 29).toordinal(), to_ordinal(Date(2024, 2, 29)))
+
+    def test_fromOrdinal_should_be_inverse_of_toOrdinal(self):
+        # Every day of a whole 400 year cycle along with edges of the supported range
+        start_ordinal = datetime.date(1999, 12, 25).toordinal()
+        for ordinal in (*range(start_ordinal, start_ordinal + 146097 + 7), 1, datetime.date.max.toordinal()):
+            expected_value = datetime.date.fromordinal(ordinal)
+
+            actual_value = from_ordinal(ordinal)
+
+            self.assertEqual((expected_value.year, expected_value.month, expected_value.day), actual_value)
+            self.assertEqual(ordinal, to_ordinal(actual_value))
+
+    def test_addDays_should_cross_months_and_years(self):
+        self.assertEqual(Date(2024, 2, 29), add_days(Date(2024, 2, 28), 1))
+        self.assertEqual(Date(2025, 1, 1), add_days(Date(2024, 12, 31), 1))
+        self.assertEqual(Date(2023, 2, 28), add_days(Date(2023, 3, 1), -1))
+        self.assertEqual(Date(2385, 7, 1), add_days(PIVOT_DATE, 231106))
+
+    def test_dateArithmetic_should_reject_dates_that_do_not_exist(self):
+        for date in (Date(2024, 2, 30), Date(2023, 2, 29), Date(2024, 4, 31), Date(2024, 1, 0), Date(2024, 13, 1), Date(2024, 0, 1)):
+            with self.subTest(date=date):
+                self.assertRaises(InvalidDateFormat, to_ordinal, date)
+                self.assertRaises(InvalidDateFormat, add_days, date, 1)
+                self.assertRaises(InvalidDateFormat, weekday, date)
+                self.assertRaises(InvalidDateFormat, days_between, PIVOT_DATE, date)
+
+    def test_weekday_should_return_value_of_day(self):
+        self.assertEqual(PIVOT_DAY.value, weekday(PIVOT_DATE))
+        self.assertEqual(DAY.THURSDAY.value, weekday(Date(2024, 2, 29)))
+
+    def test_daysBetween_should_be_negative_for_earlier_date(self):
+        self.assertEqual(82696, days_between(Date(2474, 7, 9), Date(2700, 12, 8)))
+        self.assertEqual(-82696, days_between(Date(2700, 12, 8), Date(2474, 7, 9)))
+
+
+class FirstWeekdayOfMonthTest(unittest.TestCase):
+    def test_firstWeekdayOfMonth_should_return_sunday_for_pivot_date(self):
+        self.assertEqual(PIVOT_DAY.value, first_weekday_of_month(PIVOT_DATE.year, PIVOT_DATE.month))
+
+    def test_firstWeekdayOfMonth_should_return_expected_day_of_week(self):
+        self.assertEqual(DAY.TUESDAY.value, first_weekday_of_month(2022, 2))
+        self.assertEqual(DAY.SATURDAY.value, first_weekday_of_month(2020, 2))
+        self.assertEqual(DAY.SUNDAY.value, first_weekday_of_month(2020, 3))
+        self.assertEqual(DAY.MONDAY.value, first_weekday_of_month(2385, 7))
+
+
 class DateValidatorTest(unittest.TestCase):
     def test_dateValidator_should_pass_a_valid_date(self):
         dummy_date = "2022-02-28"
 
         date_validator(dummy_date, PIVOT_DATE)  # No error expected
 
+    def test_dateValidator_should_return_parsed_date(self):
+        dummy_date = "2022-02-28"
+
+        self.assertEqual(Date(2022, 2, 28), date_validator(dummy_date, PIVOT_DATE))
+
+    def test_dateValidator_should_pass_pivot_date(self):
+        self.assertEqual(PIVOT_DATE, date_validator("1752-10-01", PIVOT_DATE))
+
     def test_dateValidator_should_throw_error_if_month_not_passed(self):
         dummy_date = "2022-02"
 
@@ -164,6 +256,28 @@ class DateValidatorTest(unittest.TestCase):
         with self.assertRaises(InvalidDateFormat):
             date_validator(dummy_date, PIVOT_DATE)
 
+    def test_dateValidator_should_throw_error_if_date_has_too_many_separators(self):
+        dummy_date = "2022-02-28-01"
+
+        with self.assertRaisesRegex(InvalidDateFormat, "doesn't contain enough separators"):
+            date_validator(dummy_date, PIVOT_DATE)
+
+    def test_dateValidator_should_throw_error_if_date_is_not_a_string(self):
+        with self.assertRaisesRegex(InvalidDateFormat, "doesn't contain enough separators"):
+            date_validator(20220228, PIVOT_DATE)
+
+    def test_dateValidator_should_report_parts_that_are_not_integers(self):
+        dummy_date = "2022-ab-28"
+
+        with self.assertRaisesRegex(InvalidDateFormat, "Year: 2022 or month: ab or day: 28 is/are not integer"):
+            date_validator(dummy_date, PIVOT_DATE)
+
+    def test_dateValidator_should_throw_error_if_day_is_zero(self):
+        dummy_date = "2022-12-00"
+
+        with self.assertRaises(InvalidDateFormat):
+            date_validator(dummy_date, PIVOT_DATE)
+
     def test_dateValidator_should_throw_error_if_day_is_not_valid(self):
         dummy_date = "2022-12-32"
 
@@ -195,5 +309,75 @@ class DateValidatorTest(unittest.TestCase):
             date_validator(dummy_date, PIVOT_DATE)
 
 
+class MonthValidatorTest(unittest.TestCase):
+    def test_monthValidator_should_return_year_and_month_for_a_valid_month(self):
+        self.assertEqual((2022, 2), month_validator("2022-02", PIVOT_DATE))
+
+    def test_monthValidator_should_pass_month_of_pivot_date(self):
+        self.assertEqual((1752, 10), month_validator("1752-10", PIVOT_DATE))
+
+    def test_monthValidator_should_throw_error_if_month_not_passed(self):
+        with self.assertRaises(InvalidDateFormat):
+            month_validator("2022", PIVOT_DATE)
+
+    def test_monthValidator_should_throw_error_if_month_is_not_numeric(self):
+        with self.assertRaises(InvalidDateFormat):
+            month_validator("2022-ab", PIVOT_DATE)
+
+    def test_monthValidator_should_throw_error_if_month_is_not_valid(self):
+        with self.assertRaises(InvalidDateFormat):
+            month_validator("2022-13", PIVOT_DATE)
+
+    def test_monthValidator_should_throw_error_if_month_is_less_than_month_of_pivot_date(self):
+        with self.assertRaises(InvalidDateFormat):
+            month_validator("1752-09", PIVOT_DATE)
+
+
+class YearValidatorTest(unittest.TestCase):
+    def test_yearValidator_should_return_year_for_a_valid_year(self):
+        self.assertEqual(2022, year_validator("2022", PIVOT_DATE))
+
+    def test_yearValidator_should_throw_error_if_year_is_not_numeric(self):
+        with self.assertRaises(InvalidDateFormat):
+            year_validator("20a2", PIVOT_DATE)
+
+    def test_yearValidator_should_throw_error_if_year_begins_before_pivot_date(self):
+        with self.assertRaises(InvalidDateFormat):
+            year_validator("1752", PIVOT_DATE)
+
+
+class IsoWeekNumberTest(unittest.TestCase):
+    def test_isoWeekNumber_should_match_isocalendar(self):
+        start_ordinal = datetime.date(1752, 9, 14).toordinal()
+        for ordinal in range(start_ordinal, start_ordinal + 146097, 3):
+            self.assertEqual(datetime.date.fromordinal(ordinal).isocalendar().week, iso_week_number(ordinal))
+
+    def test_isoWeekNumber_should_count_week_of_year_of_its_thursday(self):
+        self.assertEqual(53, iso_week_number(datetime.date(2021, 1, 1).toordinal()))
+        self.assertEqual(1, iso_week_number(datetime.date(2024, 12, 30).toordinal()))
+
+
+class LayoutValidatorTest(unittest.TestCase):
+    def test_layoutValidator_should_return_default_layout_when_nothing_passed(self):
+        self.assertEqual(DEFAULT_LAYOUT, layout_validator(None, None))
+
+    def test_layoutValidator_should_return_requested_layout(self):
+        self.assertEqual(Layout(DAY.MONDAY.value, True), layout_validator("monday", "true"))
+        self.assertEqual(Layout(DAY.SATURDAY.value, False), layout_validator("Saturday", "false"))
+        self.assertEqual(Layout(trim_rows=True), layout_validator(None, None, "true"))
+
+    def test_layoutValidator_should_throw_error_if_week_start_is_not_a_day(self):
+        with self.assertRaises(InvalidDateFormat):
+            layout_validator("mon", None)
+
+    def test_layoutValidator_should_throw_error_if_week_numbers_is_not_boolean(self):
+        with self.assertRaises(InvalidDateFormat):
+            layout_validator(None, "yes")
+
+    def test_layoutValidator_should_throw_error_if_trim_rows_is_not_boolean(self):
+        with self.assertRaises(InvalidDateFormat):
+            layout_validator(None, None, "1")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+from api.src import utils
+from api.src.constants import MONTH, PIVOT_DATE, Date
+from api.src.exceptions import InvalidDateFormat
+from api.src.vectorized import (
+    count_leap_years,
+    date_arrays,
+    days_in_month,
+    is_leap_year,
+    np,
+    num_days_between_dates,
+)
+
+# Every month of a few centuries around leap year edge cases along with the days around its end
+_DATES = [
+    (year, month, day) for year in (1752, 1800, 1900, 1999, 2000, 2023, 2024, 2100, 2400) for month in range(1, 13) for day in (0, 1, 14, 28, 29, 30, 31, 32)
+]
+_YEARS, _MONTHS, _DAYS = (list(values) for values in zip(*_DATES))
+
+
+def _as_list(values) -> list:
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+def _is_valid(year: int, month: int, day: int) -> bool:
+    try:
+        utils.date_validator(f"{year}-{month}-{day}", PIVOT_DATE)
+    except InvalidDateFormat:
+        return False
+
+    return True
+
+
+class VectorizedTest(unittest.TestCase):
+    def assert_matches_scalar_functions(self):
+        self.assertEqual([utils.is_leap_year(year) for year in _YEARS], _as_list(is_leap_year(_YEARS)))
+        self.assertEqual([utils.count_leap_years(Date(*date)) for date in _DATES], _as_list(count_leap_years(_YEARS, _MONTHS)))
+        self.assertEqual([utils.get_actual_days_in_month(MONTH(month), year) for year, month, _ in _DATES], _as_list(days_in_month(_YEARS, _MONTHS)))
+        self.assertEqual(
+            [utils.num_days_between_dates(PIVOT_DATE, Date(*date)) for date in _DATES], _as_list(num_days_between_dates(PIVOT_DATE, _YEARS, _MONTHS, _DAYS))
+        )
+
+        actual_value = date_arrays(_YEARS, _MONTHS, _DAYS)
+
+        self.assertEqual(_as_list(is_leap_year(_YEARS)), _as_list(actual_value.is_leap_year))
+        self.assertEqual(_as_list(days_in_month(_YEARS, _MONTHS)), _as_list(actual_value.days_in_month))
+        self.assertEqual([utils.day_ordinal(*date) for date in _DATES], _as_list(actual_value.ordinal))
+        self.assertEqual([utils.day_ordinal(*date) % 7 for date in _DATES], _as_list(actual_value.weekday))
+        self.assertEqual([_is_valid(*date) for date in _DATES], _as_list(actual_value.valid))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorized_should_match_scalar_functions_with_numpy(self):
+        self.assert_matches_scalar_functions()
+
+    @patch("api.src.vectorized.np", None)
+    def test_vectorized_should_match_scalar_functions_without_numpy(self):
+        self.assert_matches_scalar_functions()
+
+    def test_dateArrays_should_mask_invalid_months_instead_of_raising(self):
+        for numpy in (np, None):
+            with self.subTest(numpy=numpy), patch("api.src.vectorized.np", numpy):
+                actual_value = date_arrays([2024, 2024, 2024], [0, 13, 2], [1, 1, 29])
+
+                self.assertEqual([0, 0, 29], _as_list(actual_value.days_in_month))
+                self.assertEqual([0, 0, utils.day_ordinal(2024, 2, 29)], _as_list(actual_value.ordinal))
+                self.assertEqual([-1, -1, utils.first_weekday_of_month(2024, 3) - 1], _as_list(actual_value.weekday))
+                self.assertEqual([False, False, True], _as_list(actual_value.valid))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_dateArrays_should_accept_numpy_arrays(self):
+        actual_value = date_arrays(np.array([2022]), np.array([2]), np.array([28]))
+
+        self.assertEqual([utils.day_ordinal(2022, 2, 28)], actual_value.ordinal.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()